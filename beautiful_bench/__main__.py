@@ -0,0 +1,40 @@
+import argparse
+import sys
+
+from beautiful_bench.benchmarks import BASELINE_PATH, BENCHMARKS, DEFAULT_THRESHOLD, load_baseline, regressions, \
+    run, save
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m beautiful_bench',
+                                     description='Times beautiful-date DSL against plain datetime/relativedelta.')
+    parser.add_argument('names', nargs='*', help='benchmarks to run (all by default)')
+    parser.add_argument('-o', '--output', default='bench_results.json', help='JSON file to write results to')
+    parser.add_argument('-b', '--baseline', default=BASELINE_PATH, help='JSON results to compare with')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown relative to the baseline (default: %(default)s)')
+    parser.add_argument('--save-baseline', action='store_true', help='overwrite the baseline with the results')
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error('unknown benchmarks: {} (choose from {})'.format(
+            ', '.join(sorted(unknown)), ', '.join(BENCHMARKS)))
+
+    results = run(args.names)
+    for name, result in results.items():
+        print('{:<12} {:>10.0f} ns {:>10.0f} ns {:>6.2f}x'.format(
+            name, result['dsl'] * 1e9, result['plain'] * 1e9, result['ratio']))
+    save(results, args.output)
+
+    if args.save_baseline:
+        save(results, args.baseline)
+        return 0
+
+    slow = regressions(results, load_baseline(args.baseline), args.threshold)
+    for name, (expected, actual) in slow.items():
+        print('{} is {:.2f}x slower than plain equivalent, baseline: {:.2f}x'.format(name, actual, expected))
+    return 1 if slow else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import json
+import os
+import platform
+import timeit
+from datetime import date, datetime, timedelta
+
+from dateutil.relativedelta import relativedelta, MO as _MO
+
+from beautiful_date import D, Oct, Jan, days, months, MO, drange, floor
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Benchmark fails if its slowdown relative to the plain equivalent grows by more than this factor
+DEFAULT_THRESHOLD = 1.5
+
+
+def _create():
+    return 16 / Oct / 1995
+
+
+def _create_plain():
+    return date(1995, 10, 16)
+
+
+def _create_d():
+    return D @ 16 / 10 / 1995
+
+
+def _datetime():
+    return (16 / Oct / 1995)[23:14:10]
+
+
+def _datetime_plain():
+    return datetime(1995, 10, 16, 23, 14, 10)
+
+
+def _add_days(d=16 / Oct / 1995):
+    return d + 5 * days
+
+
+def _add_days_plain(d=date(1995, 10, 16)):
+    return d + timedelta(days=5)
+
+
+def _add_fixed_delta(d=16 / Oct / 1995, delta=5 * days):
+    return d + delta
+
+
+def _add_fixed_delta_relative(d=16 / Oct / 1995, delta=relativedelta(days=5)):
+    # Fixed deltas give the same results as relativedelta, so this is what they are compared with
+    return d + delta
+
+
+def _add_months(d=16 / Oct / 1995):
+    return d + 1 * months
+
+
+def _add_months_plain(d=date(1995, 10, 16)):
+    return d + relativedelta(months=1)
+
+
+def _add_weekday(d=16 / Oct / 1995):
+    return d + MO(2)
+
+
+def _add_weekday_plain(d=date(1995, 10, 16)):
+    return d + relativedelta(weekday=_MO(2))
+
+
+def _floor_month(t=(16 / Oct / 1995)[23:14:10], unit=1 * months):
+    return floor(t, unit)
+
+
+def _floor_month_plain(t=datetime(1995, 10, 16, 23, 14, 10)):
+    return t + relativedelta(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _drange_year():
+    return list(drange(1 / Jan / 2020, 1 / Jan / 2021))
+
+
+def _drange_year_plain(start=date(2020, 1, 1), one_day=timedelta(days=1)):
+    return [start + i * one_day for i in range(366)]
+
+
+# name: (DSL entry point, plain datetime/relativedelta equivalent)
+BENCHMARKS = {
+    'create': (_create, _create_plain),
+    'create_d': (_create_d, _create_plain),
+    'datetime': (_datetime, _datetime_plain),
+    'add_days': (_add_days, _add_days_plain),
+    'add_fixed_delta': (_add_fixed_delta, _add_fixed_delta_relative),
+    'add_months': (_add_months, _add_months_plain),
+    'add_weekday': (_add_weekday, _add_weekday_plain),
+    'drange_year': (_drange_year, _drange_year_plain),
+    'floor_month': (_floor_month, _floor_month_plain),
+}
+
+
+def _best_time(func, number, repeat):
+    """Best time of a single call in seconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(names=None, repeat=5):
+    """Times DSL entry points and their plain equivalents.
+
+    Returns {name: {'dsl': seconds, 'plain': seconds, 'ratio': dsl/plain}}. The ratio doesn't depend on the speed
+    of the machine, so it is what's compared with the baseline.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        dsl, plain = BENCHMARKS[name]
+        number, _ = timeit.Timer(dsl).autorange()
+        dsl_time = _best_time(dsl, number, repeat)
+        plain_time = _best_time(plain, number, repeat)
+        results[name] = {'dsl': dsl_time, 'plain': plain_time, 'ratio': dsl_time / plain_time}
+    return results
+
+
+def report(results):
+    """Results with the information about environment, ready to be dumped to JSON."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'benchmarks': results,
+    }
+
+
+def save(results, path):
+    with open(path, 'w') as f:
+        json.dump(report(results), f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Returns {name: ratio} from the results saved to path."""
+    with open(path) as f:
+        return {name: result['ratio'] for name, result in json.load(f)['benchmarks'].items()}
+
+
+def regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns {name: (baseline ratio, current ratio)} of the benchmarks slowed down by more than threshold."""
+    return {
+        name: (baseline[name], result['ratio'])
+        for name, result in results.items()
+        if name in baseline and result['ratio'] > baseline[name] * threshold
+    }
@@ -0,0 +1,23 @@
+import os
+import unittest
+
+from beautiful_bench.benchmarks import BENCHMARKS, DEFAULT_THRESHOLD, load_baseline, regressions, run, save
+
+OUTPUT_PATH = os.environ.get('BEAUTIFUL_BENCH_OUTPUT', 'bench_results.json')
+THRESHOLD = float(os.environ.get('BEAUTIFUL_BENCH_THRESHOLD', DEFAULT_THRESHOLD))
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.results = run()
+        save(cls.results, OUTPUT_PATH)
+        cls.baseline = load_baseline()
+
+    def test_regressions(self):
+        self.assertEqual(set(self.results), set(BENCHMARKS))
+        for name, (expected, actual) in regressions(self.results, self.baseline, THRESHOLD).items():
+            with self.subTest(name):
+                self.fail('{} is {:.2f}x slower than plain equivalent, baseline: {:.2f}x (threshold {})'.format(
+                    name, actual, expected, THRESHOLD))
@@ -1,10 +1,50 @@
-from beautiful_date.beautiful_date import BeautifulDate, \
+from beautiful_date.beautiful_date import BeautifulDate, BeautifulDatetime, DateDifference, InvalidDatesError, \
     D, MDY, DMY, \
     M, Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sept, Oct, Nov, Dec
 
-from beautiful_date.beautiful_timedelta import \
-    years, months, weeks, days, hours, minutes, seconds, microseconds, leapday, \
-    year, month, day, hour, minute, second, microsecond, yearday, nlyearday, \
-    MO, TU, WE, TH, FR, SA, SU
+from beautiful_date.clock import Clock, FrozenClock, get_clock, use_clock, frozen_clock
 
-from beautiful_date.date_range import drange
+from beautiful_date.periods import DatePeriod, IntervalSet, period
+
+# Deltas, ranges and rules depend on dateutil (and scheduling on asyncio), so their modules are imported
+# on the first access
+_LAZY_MODULES = {
+    'beautiful_date.beautiful_timedelta': (
+        'years', 'months', 'weeks', 'days', 'hours', 'minutes', 'seconds', 'microseconds', 'leapday',
+        'year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond', 'yearday', 'nlyearday',
+        'MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU',
+        'compile_delta',
+    ),
+    'beautiful_date.business_days': ('BusinessCalendar', 'bdays'),
+    'beautiful_date.date_range': ('drange',),
+    'beautiful_date.date_array': ('DateArray',),
+    'beautiful_date.bucketing': ('Buckets',),
+    'beautiful_date.rounding': ('floor', 'ceil', 'floor_many', 'ceil_many', 'round_many'),
+    'beautiful_date.counting': ('months_between', 'between', 'count', 'between_many', 'count_many'),
+    'beautiful_date.recurrence': ('Recurrence', 'every'),
+    'beautiful_date.scheduling': ('Scheduler',),
+}
+_LAZY = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+__all__ = [
+    'BeautifulDate', 'BeautifulDatetime', 'DateDifference', 'InvalidDatesError', 'D', 'MDY', 'DMY',
+    'M', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sept', 'Oct', 'Nov', 'Dec',
+    'Clock', 'FrozenClock', 'get_clock', 'use_clock', 'frozen_clock',
+    'DatePeriod', 'IntervalSet', 'period',
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    from importlib import import_module
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
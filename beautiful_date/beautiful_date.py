@@ -1,6 +1,24 @@
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, tzinfo
+from functools import lru_cache
 
-from dateutil.relativedelta import relativedelta
+
+class _ReadOnly:
+    """Base of the hashable or shared objects. Their fields are set in __init__ with object.__setattr__
+    and can't be changed afterwards."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("can't set attribute {!r} of read-only {}".format(name, type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("can't delete attribute {!r} of read-only {}".format(name, type(self).__name__))
+
+    def __setstate__(self, state):
+        # Fields restored by pickle and copy when the class doesn't define __reduce__
+        _, fields = state
+        for name, value in (fields or {}).items():
+            object.__setattr__(self, name, value)
 
 
 class BeautifulDate(date):
@@ -8,32 +26,109 @@ class BeautifulDate(date):
 
     Examples:
         >>> (Oct / 16 / 1995)[:]
-        datetime.datetime(1995, 10, 16, 0, 0)
+        BeautifulDatetime(1995, 10, 16, 0, 0)
 
         >>> (Oct / 16 / 1995)[23]
-        datetime.datetime(1995, 10, 16, 23, 0)
+        BeautifulDatetime(1995, 10, 16, 23, 0)
 
         >>> (Oct / 16 / 1995)[23:14]
-        datetime.datetime(1995, 10, 16, 23, 14)
+        BeautifulDatetime(1995, 10, 16, 23, 14)
 
         >>> (Oct / 16 / 1995)[23:14:10]
-        datetime.datetime(1995, 10, 16, 23, 14, 10)
+        BeautifulDatetime(1995, 10, 16, 23, 14, 10)
+
+        >>> (Oct / 16 / 1995)[23:14:10, 500000]
+        BeautifulDatetime(1995, 10, 16, 23, 14, 10, 500000)
+
+        >>> (Oct / 16 / 1995)[23:14, timezone.utc]
+        BeautifulDatetime(1995, 10, 16, 23, 14, tzinfo=datetime.timezone.utc)
     """
 
     def __getitem__(self, t):
         """
-        Converts date to datetime with provided time [hours[:minutes[:seconds]]]
-        :return: datetime object.
+        Converts date to datetime with provided time [hours[:minutes[:seconds]][, microseconds][, tzinfo]]
+        :return: BeautifulDatetime object.
         """
 
-        if isinstance(t, slice):
+        us, tz = 0, None
+        if type(t) is tuple:
+            if len(t) == 3:
+                t, us, tz = t
+            elif len(t) == 2:
+                t, extra = t
+                if isinstance(extra, tzinfo) or extra is None:
+                    tz = extra
+                else:
+                    us = extra
+            else:
+                raise TypeError('Expected time, microseconds and/or tzinfo, got {} values'.format(len(t)))
+
+        if type(t) is slice:
             h, m, s = t.start or 0, t.stop or 0, t.step or 0
         elif isinstance(t, int):
             h, m, s = t, 0, 0
         else:
             raise TypeError("Time values must be integer or slice, not {!r}".format(t.__class__.__name__))
 
-        return datetime(self.year, self.month, self.day, hour=h, minute=m, second=s)
+        # Positional arguments are about twice as fast as keyword ones
+        return BeautifulDatetime(self.year, self.month, self.day, h, m, s, us, tz)
+
+    def __round__(self, unit):
+        """round(d, 1*weeks) rounds date to the nearest start of the period. See rounding.round()."""
+        from beautiful_date.rounding import round
+        return round(self, unit)
+
+    def __add__(self, other):
+        new_date = date.__add__(self, other)
+        if type(new_date) is date:
+            return BeautifulDate(new_date.year, new_date.month, new_date.day)
+        return new_date
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is BeautifulDate or type(other) is date:
+            return DateDifference(other, self)
+
+        new_date = date.__sub__(self, other)
+        if type(new_date) is date:
+            return BeautifulDate(new_date.year, new_date.month, new_date.day)
+        return new_date
+
+    def __rsub__(self, other):
+        if isinstance(other, date) and not isinstance(other, datetime):
+            return DateDifference(self, other)
+        return NotImplemented
+
+    def __rshift__(self, other):
+        """Creates DatePeriod from the date to the other date/datetime or to the date + delta.
+
+        Examples:
+            >>> (16/Oct/1995) >> (20/Oct/1995)
+            DatePeriod(1995-10-16, 1995-10-20)
+        """
+        if isinstance(other, date):
+            return DatePeriod(self, other)
+        return DatePeriod(self, self + other)
+
+    def format(self, pattern):
+        """Formats the date with strftime-like pattern. Pattern is compiled once and cached.
+
+        Directives %Y, %y, %m, %d, %j, %b, %B, %a, %A and %% are formatted without strftime
+        (names are in English), patterns with other directives are passed to strftime.
+
+        Examples:
+            >>> (16/Oct/1995).format('%d %b %Y')
+            '16 Oct 1995'
+        """
+        compiled = _compile_formatter(pattern)
+        if compiled is None:
+            return self.strftime(pattern)
+        template, getters = compiled
+        return template.format(self.year, self.month, self.day, *[getter(self) for getter in getters])
+
+    def __format__(self, spec):
+        return self.format(spec) if spec else str(self)
 
     def to_date(self):
         """
@@ -43,11 +138,248 @@ class BeautifulDate(date):
         return date(self.year, self.month, self.day)
 
 
+class BeautifulDatetime(datetime):
+    """Datetime created by indexing/slicing BeautifulDate. Adding and subtracting deltas keeps the type.
+
+    Examples:
+        >>> (16/Oct/1995)[23:14] + 5*days
+        BeautifulDatetime(1995, 10, 21, 23, 14)
+
+        >>> ((16/Oct/1995)[23:14] + 1*hours).date()
+        BeautifulDate(1995, 10, 17)
+    """
+
+    __slots__ = ()
+
+    def __add__(self, other):
+        new_datetime = datetime.__add__(self, other)
+        if type(new_datetime) is datetime:
+            # Before Python 3.8, datetime arithmetic didn't keep the subclass
+            return _beautiful_datetime(new_datetime)
+        return new_datetime
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, datetime):
+            return DateDifference(other, self)
+        new_datetime = datetime.__sub__(self, other)
+        if type(new_datetime) is datetime:
+            return _beautiful_datetime(new_datetime)
+        return new_datetime
+
+    def __rsub__(self, other):
+        if isinstance(other, datetime):
+            return DateDifference(self, other)
+        return NotImplemented
+
+    __rshift__ = BeautifulDate.__rshift__
+    __round__ = BeautifulDate.__round__
+
+    def date(self):
+        """Returns the date part as BeautifulDate."""
+        return BeautifulDate(self.year, self.month, self.day)
+
+    def to_datetime(self):
+        """Converts BeautifulDatetime to a simple Python datetime."""
+        return datetime(self.year, self.month, self.day, self.hour, self.minute, self.second, self.microsecond,
+                        self.tzinfo, fold=self.fold)
+
+
+class DateDifference(_ReadOnly, timedelta):
+    """Difference between two dates/datetimes (end - start) that remembers them, so it can be expressed
+    in calendar units as well.
+
+    Examples:
+        >>> (16/Oct/1995) - (29/Feb/1992)
+        DateDifference(days=1325)
+
+        >>> ((16/Oct/1995) - (29/Feb/1992)).in_(months)
+        43
+    """
+
+    __slots__ = ('start', 'end')
+
+    def __new__(cls, start, end):
+        difference = (datetime.__sub__ if isinstance(end, datetime) else date.__sub__)(end, start)
+        self = timedelta.__new__(cls, difference.days, difference.seconds, difference.microseconds)
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'end', end)
+        return self
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, timedelta.__repr__(self).split('(', 1)[1][:-1])
+
+    def __reduce__(self):
+        return self.__class__, (self.start, self.end)
+
+    def in_(self, unit):
+        """Number of whole units (years, months, weeks, days, hours, ...) from start to end, truncated towards zero.
+        Weekday (MO..SU) counts the weekdays from start (inclusive) to end. See counting.between() and count().
+        """
+        from beautiful_date.counting import between
+        return between(self.start, self.end, unit)
+
+
+def _beautiful_datetime(dt):
+    """Converts plain datetime to BeautifulDatetime."""
+    return BeautifulDatetime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond,
+                             dt.tzinfo, fold=dt.fold)
+
+
+class InvalidDatesError(ValueError):
+    """Raised by bulk date constructors with all the rows that couldn't be converted to dates.
+
+    errors: list of (row index, (year, month, day) or string, error message) tuples.
+    """
+
+    def __init__(self, errors):
+        self.errors = errors
+        shown = '; '.join('row {}: {} {}'.format(i, values, message) for i, values, message in errors[:10])
+        more = '; ...' if len(errors) > 10 else ''
+        super().__init__('{} invalid date(s): {}{}'.format(len(errors), shown, more))
+
+
+_ONE_DAY = timedelta(days=1)
+
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(_MONTH_NAMES, 1)}
+_MONTH_NUMBERS.update((name[:3].lower(), i) for i, name in enumerate(_MONTH_NAMES, 1))
+
+
+def _two_digit_year(value):
+    # Same as strptime: 69-99 are 1969-1999, 00-68 are 2000-2068
+    year = int(value)
+    return year + (1900 if year >= 69 else 2000)
+
+
+def _month_number(name):
+    try:
+        return _MONTH_NUMBERS[name.lower()]
+    except KeyError:
+        raise ValueError('Unknown month name {!r}'.format(name)) from None
+
+
+# Directive: (regex, field, conversion)
+_PARSE_DIRECTIVES = {
+    'd': (r'(\d{1,2})', 'day', int),
+    'm': (r'(\d{1,2})', 'month', int),
+    'Y': (r'(\d{4})', 'year', int),
+    'y': (r'(\d{2})', 'year', _two_digit_year),
+    'b': (r'([A-Za-z]{3})', 'month', _month_number),
+    'B': (r'([A-Za-z]+)', 'month', _month_number),
+}
+
+# Directive: (format field, value getter). Fields {0}, {1} and {2} are year, month and day.
+_FORMAT_DIRECTIVES = {
+    'Y': ('{0:04d}', None),
+    'm': ('{1:02d}', None),
+    'd': ('{2:02d}', None),
+    'y': ('{:02d}', lambda d: d.year % 100),
+    'j': ('{:03d}', lambda d: d.timetuple().tm_yday),
+    'b': ('{}', lambda d: _MONTH_NAMES[d.month - 1][:3]),
+    'B': ('{}', lambda d: _MONTH_NAMES[d.month - 1]),
+    'a': ('{}', lambda d: _WEEKDAY_NAMES[d.weekday()][:3]),
+    'A': ('{}', lambda d: _WEEKDAY_NAMES[d.weekday()]),
+}
+
+_DIRECTIVE = r'%(.)|[^%]+|%$'
+
+
+def _pattern_parts(pattern):
+    # re is imported only when the pattern is compiled for the first time to keep "import beautiful_date" fast
+    import re
+    return re.finditer(_DIRECTIVE, pattern)
+
+
+@lru_cache(maxsize=128)
+def _compile_formatter(pattern):
+    """Compiles strftime-like pattern to str.format template and getters of the values it needs
+    besides year, month and day. Returns None if pattern has directives that aren't supported."""
+    parts = []
+    getters = []
+    for match in _pattern_parts(pattern):
+        directive = match.group(1)
+        if directive is None:
+            if match.group() == '%':
+                return None
+            parts.append(match.group().replace('{', '{{').replace('}', '}}'))
+        elif directive == '%':
+            parts.append('%')
+        elif directive in _FORMAT_DIRECTIVES:
+            field, getter = _FORMAT_DIRECTIVES[directive]
+            if getter is not None:
+                field = '{{{}{}'.format(3 + len(getters), field[1:])
+                getters.append(getter)
+            parts.append(field)
+        else:
+            return None
+    return ''.join(parts), tuple(getters)
+
+
+@lru_cache(maxsize=128)
+def _compile_parser(pattern, order):
+    """Compiles strptime-like pattern to regex and (field, conversion) of each of its groups.
+
+    If pattern is None, numbers of the fields in the given order separated by "/", "-" or "." are expected.
+    """
+    import re
+
+    if pattern is None:
+        regex = r'[-/.]'.join(r'(\d+)' for _ in order)
+        return re.compile(regex), tuple((field, int) for field in order), False
+
+    parts = []
+    fields = []
+    for match in _pattern_parts(pattern):
+        directive = match.group(1)
+        if directive is None:
+            parts.append(re.escape(match.group()))
+        elif directive == '%':
+            parts.append('%')
+        elif directive in _PARSE_DIRECTIVES:
+            regex, field, convert = _PARSE_DIRECTIVES[directive]
+            parts.append(regex)
+            fields.append((field, convert))
+        else:
+            raise ValueError('Unsupported directive %{} in pattern {!r}'.format(directive, pattern))
+
+    if sorted(field for field, _ in fields) != ['day', 'month', 'year']:
+        raise ValueError('Pattern must contain day, month and year once, got {!r}'.format(pattern))
+    return re.compile(''.join(parts)), tuple(fields), pattern == '%Y-%m-%d'
+
+
+def _parse(string, parser):
+    if not isinstance(string, str):
+        raise TypeError('Date must be parsed from string, not {!r}'.format(string.__class__.__name__))
+    regex, fields, is_iso = parser
+    if is_iso and len(string) == 10 and string[4] == string[7] == '-':
+        # Creates BeautifulDate directly without matching the regex
+        return BeautifulDate.fromisoformat(string)
+
+    match = regex.fullmatch(string.strip())
+    if match is None:
+        raise ValueError('{!r} does not match the date format'.format(string))
+    values = {field: convert(value) for (field, convert), value in zip(fields, match.groups())}
+    return BeautifulDate(values['year'], values['month'], values['day'])
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required for this operation. '
+                          'Install it with "pip install beautiful-date[numpy]"') from None
+    return numpy
+
+
 # Classes to build date
 #   D @ 16/10/1995 (16/Oct/1995)
 #   D @ 5/19/2006 (May/19/2006)
 
-class _PartialDate:
+class _PartialDate(_ReadOnly):
     """Date builder that uses operator "/" or "-" between values of day, month and year
 
     Examples:
@@ -58,19 +390,42 @@ class _PartialDate:
         BeautifulDate(2000, 10, 22)
     """
 
-    def __init__(self, first, _format):
-        self._date_values = [first]
-        self._format = _format
+    __slots__ = ('_date_values', '_order')
+
+    def __init__(self, date_values, order):
+        # Read-only, so the same partial date can be completed multiple times
+        _set_date_values(self, date_values)
+        _set_order(self, order)
 
     def __truediv__(self, value):
-        self._date_values.append(value)
-        if len(self._date_values) == 3:
-            return BeautifulDate(**dict(zip(self._format, self._date_values)))
+        values = self._date_values + (value,)
+        if len(values) == 3:
+            y, m, d = self._order
+            return BeautifulDate(values[y], values[m], values[d])
         else:
-            return self
+            return _PartialDate(values, self._order)
 
     __sub__ = __truediv__
 
+    def __repr__(self):
+        return '_PartialDate({})'.format('/'.join(map(str, self._date_values)))
+
+    def __eq__(self, other):
+        if not isinstance(other, _PartialDate):
+            return NotImplemented
+        return (self._date_values, self._order) == (other._date_values, other._order)
+
+    def __hash__(self):
+        return hash((self._date_values, self._order))
+
+    def __reduce__(self):
+        return _PartialDate, (self._date_values, self._order)
+
+
+# Setters of the read-only fields, faster than object.__setattr__ for the builder created on each "/"
+_set_date_values = _PartialDate._date_values.__set__
+_set_order = _PartialDate._order.__set__
+
 
 class BaseDateFormat:
     """Base class for date format.
@@ -85,49 +440,168 @@ class BaseDateFormat:
         _PartialDate(22/10)
     """
 
+    __slots__ = ()
+
     # List of strings 'day', 'month', and 'year' in desired order.
     # Should be overridden in the inherited classes
     _format = None
 
+    # Positions of year, month and day in the format
+    _order = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._format is not None:
+            cls._order = tuple(cls._format.index(field) for field in ('year', 'month', 'day'))
+
     def __matmul__(self, first):
-        return _PartialDate(first, self._format)
+        return _PartialDate((first,), self._order)
 
     def __repr__(self):
         return '{}{}'.format(self.__class__.__name__, self._format)
 
+    @classmethod
+    def from_columns(cls, *columns, dtype=None):
+        """Creates dates from columns of day, month and year numbers given in the order of the format.
+
+        Columns can be lists, array.array or numpy arrays. Returns list of BeautifulDate objects or,
+        if dtype is given (e.g. 'datetime64[D]'), numpy array computed without creating date objects.
+        All the invalid rows are reported together in InvalidDatesError.
+
+        Examples:
+            >>> D.from_columns([16, 29], [10, 2], [1995, 2000])
+            [BeautifulDate(1995, 10, 16), BeautifulDate(2000, 2, 29)]
+
+            >>> YMD.from_columns([1995, 2000], [10, 2], [16, 29], dtype='datetime64[D]')
+            array(['1995-10-16', '2000-02-29'], dtype='datetime64[D]')
+        """
+        if len(columns) != 3:
+            raise TypeError('from_columns() takes 3 columns ({}), {} given'.format(
+                ', '.join(cls._format), len(columns)))
+        if len(set(map(len, columns))) != 1:
+            raise ValueError('Columns must have the same length')
+
+        by_name = dict(zip(cls._format, columns))
+        years, months, days = by_name['year'], by_name['month'], by_name['day']
+
+        if dtype is not None:
+            return cls._datetime64_from_columns(years, months, days, dtype)
+
+        result = []
+        errors = []
+        for i, (y, m, d) in enumerate(zip(years, months, days)):
+            try:
+                result.append(BeautifulDate(y, m, d))
+            except (ValueError, TypeError) as e:
+                errors.append((i, (y, m, d), str(e)))
+
+        if errors:
+            raise InvalidDatesError(errors)
+        return result
+
+    from_arrays = from_columns
+
+    @classmethod
+    def parse(cls, string, pattern=None):
+        """Parses date from the string.
+
+        Without pattern, numbers of day, month and year are expected in the order of the format, separated by
+        "/", "-" or ".". Pattern is strptime-like with directives %d, %m, %Y, %y, %b and %B (English month names).
+        Patterns are compiled once and cached.
+
+        Examples:
+            >>> D.parse('16/10/1995')
+            BeautifulDate(1995, 10, 16)
+
+            >>> MDY.parse('Oct 16, 1995', '%b %d, %Y')
+            BeautifulDate(1995, 10, 16)
+        """
+        return _parse(string, _compile_parser(pattern, cls._format))
+
+    @classmethod
+    def parse_many(cls, strings, pattern=None, errors='raise'):
+        """Parses dates from the iterable of strings. See parse().
+
+        All the strings that couldn't be parsed are reported together in InvalidDatesError, or, if errors
+        is 'coerce', are returned as None.
+
+        Examples:
+            >>> YMD.parse_many(['1995-10-16', '2000-02-30', '2000-02-29'], errors='coerce')
+            [BeautifulDate(1995, 10, 16), None, BeautifulDate(2000, 2, 29)]
+        """
+        if errors not in ('raise', 'coerce'):
+            raise ValueError("errors must be 'raise' or 'coerce', not {!r}".format(errors))
+
+        parser = _compile_parser(pattern, cls._format)
+        result = []
+        failed = []
+        for i, string in enumerate(strings):
+            try:
+                result.append(_parse(string, parser))
+            except (ValueError, TypeError) as e:
+                failed.append((i, string, str(e)))
+                result.append(None)
+
+        if failed and errors == 'raise':
+            raise InvalidDatesError(failed)
+        return result
+
+    @staticmethod
+    def _datetime64_from_columns(years, months, days, dtype):
+        np = _numpy()
+        years, months, days = (np.asarray(c, dtype=np.int64) for c in (years, months, days))
+
+        month_starts = ((years - 1970) * 12 + months - 1).astype('datetime64[M]')
+        first_days = month_starts.astype('datetime64[D]')
+        month_lengths = ((month_starts + 1).astype('datetime64[D]') - first_days).astype(np.int64)
+
+        invalid = (years < 1) | (years > 9999) | (months < 1) | (months > 12) | (days < 1) | (days > month_lengths)
+        if invalid.any():
+            errors = []
+            for i in np.flatnonzero(invalid).tolist():
+                values = (int(years[i]), int(months[i]), int(days[i]))
+                try:
+                    date(*values)
+                except ValueError as e:
+                    errors.append((i, values, str(e)))
+            raise InvalidDatesError(errors)
+
+        return (first_days + (days - 1).astype('timedelta64[D]')).astype(dtype)
+
     @staticmethod
     def today():
-        today = date.today()
-        return BeautifulDate(year=today.year, month=today.month, day=today.day)
+        return get_clock().today()
 
     @staticmethod
     def now(tz=None):
-        return datetime.now(tz=tz)
+        return get_clock().now(tz)
 
     @staticmethod
     def tomorrow():
-        day = D.today() + relativedelta(days=1)
-        return BeautifulDate(year=day.year, month=day.month, day=day.day)
+        return get_clock().today() + _ONE_DAY
 
     @staticmethod
     def yesterday():
-        day = D.today() - relativedelta(days=1)
-        return BeautifulDate(year=day.year, month=day.month, day=day.day)
+        return get_clock().today() - _ONE_DAY
 
 
 class DMY(BaseDateFormat):
+    __slots__ = ()
     _format = 'day', 'month', 'year'
 
 
 class MDY(BaseDateFormat):
+    __slots__ = ()
     _format = 'month', 'day', 'year'
 
 
 class YMD(BaseDateFormat):
+    __slots__ = ()
     _format = 'year', 'month', 'day'
 
 
 class YDM(BaseDateFormat):
+    __slots__ = ()
     _format = 'year', 'day', 'month'
 
 
@@ -138,7 +612,7 @@ D = DMY()
 #   16/Oct/1995
 #   May-19-2006
 
-class _Day:
+class _Day(_ReadOnly):
     """Second step of creating date object
 
     Stores month and day numbers. If applied operator '/' or '-', returns BeautifulDate with provided value of the year
@@ -152,17 +626,33 @@ class _Day:
 
     """
 
+    __slots__ = ('d', 'm')
+
     def __init__(self, d, m):
-        self.d = d
-        self.m = m
+        object.__setattr__(self, 'd', d)
+        object.__setattr__(self, 'm', m)
 
     def __sub__(self, y):
-        return BeautifulDate(year=y, month=self.m, day=self.d)
+        return BeautifulDate(y, self.m, self.d)
 
     __truediv__ = __sub__
 
+    def __repr__(self):
+        return '_Day({}, {})'.format(self.d, self.m)
+
+    def __eq__(self, other):
+        if not isinstance(other, _Day):
+            return NotImplemented
+        return (self.d, self.m) == (other.d, other.m)
 
-class _Month:
+    def __hash__(self):
+        return hash((self.d, self.m))
+
+    def __reduce__(self):
+        return _Day, (self.d, self.m)
+
+
+class _Month(_ReadOnly):
     """First step of creating date object
 
     Stores month number. If applied operator '/' or '-', returns _Day with provided value of the day.
@@ -175,13 +665,43 @@ class _Month:
         _Day(19, 5)
     """
 
+    __slots__ = ('m', '_days')
+
     def __init__(self, m):
-        self.m = m
+        object.__setattr__(self, 'm', m)
+        # Builders for every day of the month are created once and shared
+        object.__setattr__(self, '_days', tuple(_Day(d, m) for d in range(32)))
 
     def __sub__(self, d):
+        if type(d) is int and 0 <= d < 32:
+            return self._days[d]
         return _Day(d, self.m)
 
+    def __repr__(self):
+        return 'M[{}]'.format(self.m)
+
+    def __eq__(self, other):
+        if not isinstance(other, _Month):
+            return NotImplemented
+        return self.m == other.m
+
+    def __hash__(self):
+        return hash(self.m)
+
+    def __reduce__(self):
+        # Months are shared (and hold builders of their days), so they are unpickled as Jan..Dec
+        return _month, (self.m,)
+
     __rtruediv__ = __rsub__ = __truediv__ = __sub__
 
 
 M = _, Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sept, Oct, Nov, Dec = [_Month(i) for i in range(13)]
+
+
+def _month(m):
+    return M[m] if type(m) is int and 0 <= m < len(M) else _Month(m)
+
+
+# Imported at the end as the clock creates BeautifulDate objects
+from beautiful_date.clock import get_clock  # noqa: E402
+from beautiful_date.periods import DatePeriod  # noqa: E402
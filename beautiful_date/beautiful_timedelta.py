@@ -1,7 +1,52 @@
 from dateutil.relativedelta import relativedelta, weekdays
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 from beautiful_date import BeautifulDate, D
+from beautiful_date.beautiful_date import BeautifulDatetime, _ReadOnly, _beautiful_datetime
+from beautiful_date.calendar_table import _days_in_month, _is_leap, _ymd_to_ordinal, get_calendar_table, weekday_jump
+
+_ABSOLUTE_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond')
+_ZERO = timedelta(0)
+
+
+@lru_cache(maxsize=256)
+def _months_bounds(months):
+    """Returns exact (min, max) number of days by which adding given number of months moves a date.
+
+    Calendar repeats every 400 years, so it is enough to check every month of the cycle. Within a month,
+    the date moves the most from the days that are never clamped (up to 28th) and the least from the last day.
+    """
+    moves = []
+    for start in range(400 * 12):
+        y, m = divmod(start, 12)
+        ty, tm = divmod(start + months, 12)
+        y, m, ty, tm = y + 2000, m + 1, ty + 2000, tm + 1
+
+        length, target_length = _days_in_month(y, m), _days_in_month(ty, tm)
+        moves.append(_ymd_to_ordinal(ty, tm, 28) - _ymd_to_ordinal(y, m, 28))
+        moves.append(_ymd_to_ordinal(ty, tm, min(length, target_length)) - _ymd_to_ordinal(y, m, length))
+    return min(moves), max(moves)
+
+
+def _beautified(new_date, d):
+    """Result of adding delta to d as BeautifulDate/BeautifulDatetime."""
+    if isinstance(new_date, date) and not isinstance(new_date, datetime):
+        return BeautifulDate(new_date.year, new_date.month, new_date.day)
+    elif type(new_date) is datetime and (type(d) is BeautifulDatetime or not isinstance(d, datetime)):
+        # Adding time to a date, or relativedelta that didn't keep the subclass
+        return _beautiful_datetime(new_date)
+    else:
+        return new_date
+
+
+# Defaults of the positional arguments of relativedelta: dt1, dt2, relative fields and absolute fields
+_REDUCE_DEFAULTS = (None, None) + (0,) * 9 + (None,) * 10
+
+
+def _is_default(value, default):
+    # Absolute fields set to 0 (e.g. hour=0 to truncate to midnight) are not defaults
+    return value is None if default is None else value == 0
 
 
 class BeautifulRelativeDelta(relativedelta):
@@ -13,22 +58,218 @@ class BeautifulRelativeDelta(relativedelta):
     """
 
     def __add__(self, d):
-        new_date = super().__add__(d)
-        if isinstance(new_date, date) and not isinstance(new_date, datetime):
-            return BeautifulDate(new_date.year, new_date.month, new_date.day)
-        else:
+        if isinstance(d, date) and self._months_only():
+            new_date = get_calendar_table().add_months(d, self.years * 12 + self.months)
+            if type(new_date) is date:
+                return BeautifulDate(new_date.year, new_date.month, new_date.day)
             return new_date
 
+        return _beautified(super().__add__(d), d)
+
     __radd__ = __add__
 
+    def __reduce__(self):
+        # Only the fields that differ from the defaults, so 1*months pickles to a few bytes
+        args = (None, None, self.years, self.months, self.days, self.leapdays, 0, self.hours, self.minutes,
+                self.seconds, self.microseconds, self.year, self.month, self.day, self.weekday, None, None,
+                self.hour, self.minute, self.second, self.microsecond)
+        n = len(args)
+        while n and _is_default(args[n - 1], _REDUCE_DEFAULTS[n - 1]):
+            n -= 1
+        return self.__class__, args[:n]
+
+    def __rfloordiv__(self, d):
+        """d // (3*months) rounds date/datetime down to the start of the period. See rounding.floor()."""
+        if isinstance(d, date):
+            from beautiful_date.rounding import floor
+            return floor(d, self)
+        return NotImplemented
+
+    def _months_only(self):
+        """Checks whether the delta consists only of years and months, so it can be added by the calendar table."""
+        return not (self.days or self.hours or self.minutes or self.seconds or self.microseconds or self.leapdays) \
+            and self.weekday is None and self.year is None and self.month is None and self.day is None \
+            and self.hour is None and self.minute is None and self.second is None and self.microsecond is None
+
+    def bounds(self):
+        """Returns (min, max) timedeltas by which the delta can move a date, depending on the date.
+
+        Returns None if the delta sets absolute values (year, day, hour, ...) and so isn't bounded.
+
+        Examples:
+            >>> (1*months - 30*days).bounds()
+            (datetime.timedelta(days=-2), datetime.timedelta(days=1))
+        """
+        if any(getattr(self, field) is not None for field in _ABSOLUTE_FIELDS):
+            return None
+
+        fixed = timedelta(days=self.days, hours=self.hours, minutes=self.minutes,
+                          seconds=self.seconds, microseconds=self.microseconds)
+
+        low, high = _months_bounds(self.years * 12 + self.months)
+
+        low += min(0, self.leapdays)
+        high += max(0, self.leapdays)
+
+        if self.weekday is not None:
+            nth = self.weekday.n or 1
+            weeks = 7 * (abs(nth) - 1)
+            if nth > 0:
+                low, high = low + weeks, high + weeks + 6
+            else:
+                low, high = low - weeks - 6, high - weeks
+
+        return fixed + timedelta(days=low), fixed + timedelta(days=high)
+
+    def sign(self, anchor=None):
+        """Returns 1 if the delta moves dates forward, -1 if backward and 0 if it doesn't move them.
+
+        If the direction depends on the date (e.g. 1*months - 30*days), it is determined for the anchor
+        date/datetime if given, otherwise None is returned.
+        """
+        # Called unbound for plain relativedelta steps of drange as well
+        bounds = BeautifulRelativeDelta.bounds(self)
+        if bounds is not None:
+            low, high = bounds
+            if low > _ZERO:
+                return 1
+            if high < _ZERO:
+                return -1
+            if low == high == _ZERO:
+                return 0
+
+        if anchor is None:
+            return None
+        moved = anchor + self
+        return (moved > anchor) - (moved < anchor)
+
+
+class BeautifulFixedDelta(BeautifulRelativeDelta):
+    """BeautifulRelativeDelta of fixed length (weeks, days, hours, minutes, seconds, microseconds).
+
+    It has the fields and equality of relativedelta and gives the same results, but is added to dates
+    and datetimes as timedelta, without the calendar computations of relativedelta.
+
+    Examples:
+        >>> 16/Jan/2005 + 5*days
+        BeautifulDate(2005, 1, 21)
+
+        >>> 5*days + 3*hours
+        BeautifulFixedDelta(days=+5, hours=+3)
+
+        >>> 5*days + 2*months
+        BeautifulRelativeDelta(months=+2, days=+5)
+    """
+
+    # Default values of relativedelta fields, deltas created by _fixed_delta() only store the ones they change
+    years = months = days = leapdays = hours = minutes = seconds = microseconds = _has_time = 0
+    year = month = day = hour = minute = second = microsecond = weekday = None
+
+    def _timedelta(self):
+        td = self.__dict__.get('_td')
+        if td is None:
+            # Fields aren't changed after creation (same as with other deltas), so it is computed once
+            td = self._td = timedelta(days=self.days, hours=self.hours, minutes=self.minutes, seconds=self.seconds,
+                                      microseconds=self.microseconds)
+        return td
+
+    def _relative(self):
+        return BeautifulRelativeDelta(days=self.days, hours=self.hours, minutes=self.minutes, seconds=self.seconds,
+                                      microseconds=self.microseconds)
+
+    def __add__(self, other):
+        cls = type(other)
+        if cls is BeautifulDate and not self._has_time or cls is BeautifulDatetime:
+            # They keep their type when adding timedelta
+            return other + self._timedelta()
+        if isinstance(other, date):
+            # Same as relativedelta.__add__ without years, months and absolute values
+            if self._has_time and not isinstance(other, datetime):
+                other_date, other = other, BeautifulDatetime(other.year, other.month, other.day)
+                return _beautified(other + self._timedelta(), other_date)
+            return _beautified(other + self._timedelta(), other)
+        if isinstance(other, relativedelta) and not isinstance(other, BeautifulFixedDelta):
+            # Result has calendar fields
+            return self._relative() + other
+        return super().__add__(other)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, timedelta):
+            return self + -other
+        if isinstance(other, relativedelta) and not isinstance(other, BeautifulFixedDelta):
+            return self._relative() - other
+        return super().__sub__(other)
+
+    def __rfloordiv__(self, other):
+        """d // (15*minutes) rounds date/datetime down to the start of the period. See rounding.floor().
+        timedelta // (15*minutes) is the number of whole periods in it, same as with timedelta."""
+        if isinstance(other, timedelta):
+            return other // self._timedelta()
+        return super().__rfloordiv__(other)
 
-class BeautifulTimedelta:
+    def total_seconds(self):
+        return self._timedelta().total_seconds()
+
+    def sign(self, anchor=None):
+        """Returns 1 if the delta moves dates forward, -1 if backward and 0 if it doesn't move them."""
+        td = self._timedelta()
+        return (td > _ZERO) - (td < _ZERO)
+
+
+# Largest values of the time fields that relativedelta._fix() doesn't carry over to the next field
+_FIX_LIMITS = {'hours': 23, 'minutes': 59, 'seconds': 59, 'microseconds': 999999}
+
+
+@lru_cache(maxsize=1024)
+def _unit_timedelta(name, n):
+    return timedelta(**{name: n})
+
+
+def _fixed_delta(name, n):
+    """Same as BeautifulFixedDelta(**{name: n}) for units of fixed length, but without relativedelta.__init__.
+    Fields left at their default values are read from the class."""
+    delta = object.__new__(BeautifulFixedDelta)
+    if name == 'weeks':
+        name, n = 'days', n * 7
+    fields = delta.__dict__
+    fields[name] = n
+    fields['_td'] = _unit_timedelta(name, n)
+    if name == 'days':
+        fields['_has_time'] = 0
+    elif -_FIX_LIMITS[name] <= n <= _FIX_LIMITS[name]:
+        fields['_has_time'] = 1 if n else 0
+    else:
+        delta._fix()
+    return delta
+
+
+_FIXED_UNITS = frozenset(('weeks', 'days', 'hours', 'minutes', 'seconds', 'microseconds'))
+
+
+class BeautifulTimedelta(_ReadOnly):
     """Creates timedelta with specified time unit using operator '*'."""
 
+    __slots__ = ('name', 'start', 'is_until')
+
     def __init__(self, name, start=None, is_until=False):
-        self.name = name
-        self.start = start
-        self.is_until = is_until
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'is_until', is_until)
+
+    def __eq__(self, other):
+        if not isinstance(other, BeautifulTimedelta):
+            return NotImplemented
+        return (self.name, self.start, self.is_until) == (other.name, other.start, other.is_until)
+
+    def __hash__(self):
+        return hash((self.name, self.start, self.is_until))
+
+    def __reduce__(self):
+        if self.start is None:
+            return self.__class__, (self.name,)
+        return self.__class__, (self.name, self.start, self.is_until)
 
     def __rmul__(self, n):
         """If start is set, returns BeautifulDate or datetime (depending on the start's type).
@@ -47,22 +288,28 @@ class BeautifulTimedelta:
 
 
 
-        Otherwise, returns BeautifulRelativeDelta.
+        Otherwise, returns BeautifulFixedDelta for units of fixed length and BeautifulRelativeDelta
+        for calendar units.
         Examples:
             >>> 3*years
             BeautifulRelativeDelta(years=+3)
 
             >>> -5*weeks
-            BeautifulRelativeDelta(days=-35)
+            BeautifulFixedDelta(days=-35)
         """
 
+        if self.name in _FIXED_UNITS:
+            delta = _fixed_delta(self.name, n)
+        else:
+            delta = BeautifulRelativeDelta(**{self.name: n})
+
         if self.start is not None:
             if self.is_until:
-                return self.start + BeautifulRelativeDelta(**{self.name: -n})
+                return self.start - delta
             else:
-                return self.start + BeautifulRelativeDelta(**{self.name: n})
+                return self.start + delta
         else:
-            return BeautifulRelativeDelta(**{self.name: n})
+            return delta
 
     def from_(self, start):
         return BeautifulTimedelta(self.name, start=start)
@@ -120,7 +367,7 @@ nlyearday = _('nlyearday')
 _weekday = _('weekday')
 
 
-class BeautifulWeekday:
+class BeautifulWeekday(_ReadOnly):
     """
 
     Examples:
@@ -150,18 +397,153 @@ class BeautifulWeekday:
         BeautifulDate(2018, 3, 17)
     """
 
+    __slots__ = ('wd', 'n')
+
     def __init__(self, wd, n=1):
-        self.wd = wd
-        self.n = n
+        object.__setattr__(self, 'wd', wd)
+        object.__setattr__(self, 'n', n)
+
+    def _jump(self, d, n):
+        new_date = d + timedelta(days=weekday_jump(self.wd.weekday, n, d.weekday()))
+        if type(new_date) is date:
+            return BeautifulDate(new_date.year, new_date.month, new_date.day)
+        return new_date
 
     def __radd__(self, other):
+        if isinstance(other, date):
+            return self._jump(other, self.n)
         return other + self.wd(self.n) * _weekday
 
     def __rsub__(self, other):
+        if isinstance(other, date):
+            return self._jump(other, -self.n)
         return other + self.wd(-self.n) * _weekday
 
     def __call__(self, n):
         return BeautifulWeekday(self.wd, n)
 
+    def __repr__(self):
+        return repr(self.wd) if self.n == 1 else repr(self.wd(self.n))
+
+    def __eq__(self, other):
+        if not isinstance(other, BeautifulWeekday):
+            return NotImplemented
+        return (self.wd.weekday, self.n) == (other.wd.weekday, other.n)
+
+    def __hash__(self):
+        return hash((self.wd.weekday, self.n))
+
+    def __reduce__(self):
+        return _beautiful_weekday, (self.wd.weekday,) if self.n == 1 else (self.wd.weekday, self.n)
+
 
 weekdays = MO, TU, WE, TH, FR, SA, SU = [BeautifulWeekday(weekdays[i]) for i in range(7)]
+
+
+def _beautiful_weekday(number, n=1):
+    """Returns MO..SU (or MO(n)..SU(n)) by the number of the weekday, used to unpickle them."""
+    return weekdays[number] if n == 1 else weekdays[number](n)
+
+
+def _weekday_number(wd):
+    """Returns number of the weekday given as MO..SU, dateutil weekday or int (0 for Monday)."""
+    wd = getattr(wd, 'wd', wd)
+    return getattr(wd, 'weekday', wd)
+
+
+class CompiledDelta:
+    """Combination of deltas folded once into a plan that is applied to dates in a single pass.
+
+    Gives the same result as adding the sum of the deltas, but doesn't create intermediate
+    relativedelta/date objects, so it is suitable for applying the same delta to many dates.
+
+    Examples:
+        >>> next_meeting = compile_delta(1*months, 1*day, MO(2))
+        >>> 16/Oct/1995 + next_meeting
+        BeautifulDate(1995, 11, 13)
+
+        >>> next_meeting.apply_many([16/Oct/1995, 1/Jan/2000])
+        [BeautifulDate(1995, 11, 13), BeautifulDate(2000, 2, 14)]
+    """
+
+    __slots__ = ('delta', '_months', '_year', '_month', '_day', '_time', '_days', '_fixed',
+                 '_has_time', '_leapdays', '_weekday', '_nth')
+
+    def __init__(self, delta):
+        self.delta = delta
+
+        self._months = delta.years * 12 + delta.months
+        self._year, self._month, self._day = delta.year, delta.month, delta.day
+        self._time = {attr: getattr(delta, attr) for attr in ('hour', 'minute', 'second', 'microsecond')
+                      if getattr(delta, attr) is not None}
+        self._days = delta.days
+        self._fixed = timedelta(days=delta.days, hours=delta.hours, minutes=delta.minutes,
+                                seconds=delta.seconds, microseconds=delta.microseconds)
+        self._has_time = delta._has_time
+        self._leapdays = delta.leapdays
+
+        if delta.weekday is not None:
+            self._weekday, self._nth = delta.weekday.weekday, delta.weekday.n or 1
+        else:
+            self._weekday, self._nth = None, None
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.delta)
+
+    def _target(self, d):
+        """Year, month and day of d after applying years, months and absolute values of the delta."""
+        months = (self._year or d.year) * 12 + (self._month or d.month) - 1 + self._months
+        y, m = divmod(months, 12)
+        m += 1
+        return y, m, min(self._day or d.day, get_calendar_table().month_length(y, m))
+
+    def _jump(self, weekday):
+        return weekday_jump(self._weekday, self._nth, weekday)
+
+    def apply(self, d):
+        """Returns d shifted by the delta. Same as d + delta."""
+        if not isinstance(d, datetime):
+            if self._has_time:
+                d = BeautifulDatetime(d.year, d.month, d.day)
+            else:
+                y, m, day = self._target(d)
+                ordinal = get_calendar_table().ordinal(y, m, day) + self._days
+                if self._leapdays and m > 2 and _is_leap(y):
+                    ordinal += self._leapdays
+                if self._weekday is not None:
+                    ordinal += self._jump((ordinal + 6) % 7)
+                return BeautifulDate.fromordinal(ordinal)
+
+        y, m, day = self._target(d)
+        fixed = self._fixed
+        if self._leapdays and m > 2 and _is_leap(y):
+            fixed += timedelta(days=self._leapdays)
+
+        new_date = d.replace(year=y, month=m, day=day, **self._time) + fixed
+        if self._weekday is not None:
+            new_date += timedelta(days=self._jump(new_date.weekday()))
+        return new_date
+
+    __call__ = apply
+
+    def __radd__(self, d):
+        if isinstance(d, date):
+            return self.apply(d)
+        return NotImplemented
+
+    def apply_many(self, dates):
+        """Applies the delta to each of the dates. Returns list of the results."""
+        apply = self.apply
+        return [apply(d) for d in dates]
+
+
+def compile_delta(*deltas):
+    """Folds given deltas (years, months, days, ..., MO(2), ...) into CompiledDelta.
+
+    Deltas are summed the same way as with "+", so compile_delta(1*years, 2*months) is equivalent to
+    (1*years + 2*months) and not to applying them one after another.
+    """
+    total = BeautifulRelativeDelta()
+    for delta in deltas:
+        total = total + delta
+    return CompiledDelta(total)
@@ -0,0 +1,175 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+
+from beautiful_date.beautiful_date import _numpy
+from beautiful_date.date_array import DateArray, _EPOCH_ORDINAL
+from beautiful_date.date_range import _MICROSECOND
+
+
+class Buckets:
+    """Intervals between consecutive dates/datetimes of a drange, used to find which of them a value falls into.
+
+    The i-th interval starts at r[i] and ends at r[i + 1] (the last one ends at the stop of the range),
+    for backward ranges it is (r[i + 1], r[i]]. Values outside of the range get -1.
+
+    For ranges with fixed steps the index is computed arithmetically. For calendar steps (months, weekdays,
+    business days, ...) the boundaries are computed once and searched by bisection. Ranges of dates are
+    searched by ordinals, so datetimes are put into the interval of their date.
+
+    Examples:
+        >>> buckets = Buckets(drange(1/Jan/2020, 1/Jan/2021, 1*months))
+        >>> list(buckets.indices([16/Oct/2020, (29/Feb/2020)[23:59], 1/Jan/2021]))
+        [9, 1, -1]
+        >>> buckets.counts([16/Oct/2020, 17/Oct/2020, 1/Jan/2020])
+        [1, 0, 0, 0, 0, 0, 0, 0, 0, 2, 0, 0]
+    """
+
+    __slots__ = ('range', '_dates', '_start', '_stop', '_step', '_boundaries', '_backwards', '_n')
+
+    def __init__(self, r):
+        self.range = r
+        self._dates = not isinstance(r._start, datetime)
+        self._backwards = r._backwards
+        self._n = len(r)
+
+        if self._dates:
+            self._start, self._stop = r._start.toordinal(), r._stop.toordinal()
+            self._step = r._fixed_step.days if r._fixed_step is not None else None
+            boundaries = r.to_date_array().ordinals if self._step is None else None
+        else:
+            self._start, self._stop = r._start, r._stop
+            self._step = r._fixed_step
+            if r._tz is not None and self._step is not None and r._skipped():
+                # Wall times left out of the range don't start intervals
+                self._step = None
+                boundaries = [r._naive(d) for d in r]
+            else:
+                boundaries = r._elements() if self._step is None else None
+
+        # Boundaries are kept in ascending order for bisection, in a list, so that bisect doesn't box the ordinals
+        if boundaries is not None:
+            boundaries = list(boundaries)
+            if self._backwards:
+                boundaries.reverse()
+        self._boundaries = boundaries
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.range)
+
+    def __len__(self):
+        return self._n
+
+    def _key(self, value):
+        """Converts date/datetime to the value the boundaries are compared with."""
+        if self._dates:
+            return value.toordinal()
+        if self.range._tz is not None:
+            return self.range._naive(value)
+        if not isinstance(value, datetime):
+            return datetime(value.year, value.month, value.day)
+        return value
+
+    def _keys(self, values):
+        if isinstance(values, DateArray):
+            values = values.ordinals
+        if isinstance(values, (array, memoryview)):
+            if not self._dates:
+                raise TypeError('Arrays of ordinals can only be bucketed by ranges of dates')
+            return values
+        if self._dates:
+            return map(date.toordinal, values)
+        return map(self._key, values)
+
+    def _positions(self, keys):
+        start, stop, step, boundaries = self._start, self._stop, self._step, self._boundaries
+        # Each case has its own loop to keep the per-value work to a comparison and one operation
+        if self._backwards:
+            if step is not None:
+                return ((k - start) // step if stop < k <= start else -1 for k in keys)
+            n = self._n - 1
+            return (n - bisect_left(boundaries, k) if stop < k <= start else -1 for k in keys)
+        if step is not None:
+            return ((k - start) // step if start <= k < stop else -1 for k in keys)
+        return (bisect_right(boundaries, k) - 1 if start <= k < stop else -1 for k in keys)
+
+    def index(self, value):
+        """Index of the interval the date/datetime falls into, -1 if it is outside of the range."""
+        return next(self._positions((self._key(value),)))
+
+    def indices(self, values):
+        """Lazily yields index of the interval for each of the values (-1 for the ones outside of the range).
+
+        values can be any iterable of dates/datetimes, DateArray or array of ordinals (for ranges of dates).
+        For numpy arrays of datetime64 returns numpy array of indexes instead.
+        """
+        if _is_datetime64(values):
+            return self._numpy_indices(values)
+        return self._positions(self._keys(values))
+
+    def counts(self, values):
+        """Returns list with the number of values in each interval. Values outside of the range are ignored."""
+        if _is_datetime64(values):
+            np = _numpy()
+            positions = self._numpy_indices(values)
+            return np.bincount(positions[positions >= 0], minlength=self._n).tolist()
+
+        counts = [0] * self._n
+        for i in self._positions(self._keys(values)):
+            if i >= 0:
+                counts[i] += 1
+        return counts
+
+    def group_by(self, values):
+        """Returns dict of the start of each interval to the list of values that fall into it.
+
+        Only non-empty intervals are included, in the order of the range. Values outside of the range are ignored.
+        """
+        if isinstance(values, (array, memoryview)):
+            values = DateArray.from_ordinals(values)
+        if isinstance(values, DateArray) or _is_datetime64(values):
+            pairs = zip(values, self.indices(values))
+        else:
+            # Values are iterated once, so they can come from a generator
+            pairs = ((value, self.index(value)) for value in values)
+
+        groups = {}
+        for value, i in pairs:
+            if i >= 0:
+                groups.setdefault(int(i), []).append(value)
+        return {self.range[i]: groups[i] for i in sorted(groups)}
+
+    def _numpy_indices(self, values):
+        np = _numpy()
+        r = self.range
+        if self._dates:
+            keys = values.astype('datetime64[D]').astype(np.int64) + _EPOCH_ORDINAL
+            start, stop, step = self._start, self._stop, self._step
+            boundaries = self._boundaries
+        else:
+            if r._tz is not None or r._start.tzinfo is not None:
+                raise ValueError('Timezone-aware drange can not bucket datetime64')
+            keys = values.astype('datetime64[us]').astype(np.int64)
+            start, stop = (np.datetime64(d, 'us').astype(np.int64) for d in (self._start, self._stop))
+            step = self._step // _MICROSECOND if self._step is not None else None
+            boundaries = self._boundaries
+            if boundaries is not None:
+                boundaries = np.array(boundaries, dtype='datetime64[us]').astype(np.int64)
+
+        if self._backwards:
+            inside = (stop < keys) & (keys <= start)
+        else:
+            inside = (start <= keys) & (keys < stop)
+
+        if step is not None:
+            positions = (keys - start) // step
+        elif self._backwards:
+            positions = self._n - np.searchsorted(np.asarray(boundaries), keys, side='left') - 1
+        else:
+            positions = np.searchsorted(np.asarray(boundaries), keys, side='right') - 1
+        return np.where(inside, positions, -1)
+
+
+def _is_datetime64(values):
+    dtype = getattr(values, 'dtype', None)
+    return dtype is not None and getattr(dtype, 'kind', None) == 'M'
@@ -0,0 +1,314 @@
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from beautiful_date.beautiful_date import BeautifulDate, _ReadOnly
+from beautiful_date.beautiful_timedelta import _weekday_number
+
+# Header of the binary file: magic, format version, weekmask bits, number of holidays
+_HEADER = struct.Struct('<4sBBI')
+_MAGIC = b'BDAY'
+_VERSION = 1
+
+
+def _parse_weekmask(weekmask):
+    """Returns tuple of 7 booleans (Monday first) from '1111100' string or collection of weekdays (MO..SU or 0..6)."""
+    if isinstance(weekmask, str):
+        if len(weekmask) != 7 or set(weekmask) - {'0', '1'}:
+            raise ValueError("Weekmask must be a string of 7 '0'/'1' characters, not {!r}".format(weekmask))
+        mask = tuple(c == '1' for c in weekmask)
+    else:
+        business_weekdays = {_weekday_number(wd) for wd in weekmask}
+        mask = tuple(i in business_weekdays for i in range(7))
+
+    if not any(mask):
+        raise ValueError('Weekmask must contain at least one business day')
+    return mask
+
+
+def _ordinal(d):
+    return d if isinstance(d, int) else d.toordinal()
+
+
+class BusinessCalendar(_ReadOnly):
+    """Business days defined by the weekmask (business weekdays) and the list of holidays.
+
+    Holidays are stored as a sorted array of ordinals, which together with the weekmask gives the number
+    of business days before any date in O(log(holidays)). Adding business days, counting them between
+    the dates and indexing drange with business-day step are computed from it without walking the dates.
+
+    Examples:
+        >>> cal = BusinessCalendar(holidays=[25/Dec/2023, 26/Dec/2023, 1/Jan/2024])
+        >>> 22/Dec/2023 + 2*cal.bdays
+        BeautifulDate(2023, 12, 28)
+
+        >>> cal.count(1/Dec/2023, 1/Jan/2024)
+        19
+
+        >>> BusinessCalendar([MO, TU, WE, TH, FR])
+        BusinessCalendar('1111100', holidays=0)
+    """
+
+    __slots__ = ('weekmask', '_positions', '_prefix', '_holidays')
+
+    def __init__(self, weekmask='1111100', holidays=()):
+        self._set_weekmask(_parse_weekmask(weekmask))
+        # Holidays that fall on non-business weekdays don't change anything
+        ordinals = {_ordinal(h) for h in holidays}
+        object.__setattr__(self, '_holidays', array('i', sorted(o for o in ordinals if self.weekmask[(o + 6) % 7])))
+
+    def _set_weekmask(self, mask):
+        object.__setattr__(self, 'weekmask', mask)
+        # Weekdays of business days and number of business days before each weekday within a week
+        object.__setattr__(self, '_positions', tuple(i for i in range(7) if mask[i]))
+        object.__setattr__(self, '_prefix', tuple(sum(mask[:i]) for i in range(8)))
+
+    def __repr__(self):
+        return '{}({!r}, holidays={})'.format(self.__class__.__name__,
+                                              ''.join('1' if b else '0' for b in self.weekmask),
+                                              len(self._holidays))
+
+    def __eq__(self, other):
+        if not isinstance(other, BusinessCalendar):
+            return NotImplemented
+        return self.weekmask == other.weekmask and self._holidays == other._holidays
+
+    def __hash__(self):
+        return hash((self.weekmask, tuple(self._holidays)))
+
+    @property
+    def holidays(self):
+        """Holidays that fall on business weekdays as a list of BeautifulDate objects."""
+        return [BeautifulDate.fromordinal(o) for o in self._holidays]
+
+    @property
+    def bdays(self):
+        """Business days unit of this calendar: d + 5*cal.bdays."""
+        return BusinessDays(self)
+
+    def _count_before(self, o):
+        """Number of business days from the 1st of January of year 1 to the given ordinal (exclusive)."""
+        weeks, weekday = divmod(o - 1, 7)
+        return weeks * len(self._positions) + self._prefix[weekday] - bisect_left(self._holidays, o)
+
+    def _weekmask_day(self, t):
+        """Ordinal of the t-th (from 0) day that falls on a business weekday, ignoring holidays."""
+        weeks, i = divmod(t, len(self._positions))
+        return 1 + weeks * 7 + self._positions[i]
+
+    def _business_day(self, t):
+        """Ordinal of the t-th (from 0) business day.
+
+        It is the (t + h)-th day on a business weekday, where h is the number of holidays before it.
+        Number of holidays up to the (t + i)-th such day grows by at most 1 with i, so h is found by
+        binary search over the holidays.
+        """
+        holidays = self._holidays
+        low, high = 0, len(holidays)
+        while low < high:
+            mid = (low + high) // 2
+            if bisect_right(holidays, self._weekmask_day(t + mid)) <= mid:
+                high = mid
+            else:
+                low = mid + 1
+        return self._weekmask_day(t + low)
+
+    def is_business_day(self, d):
+        """Checks whether date/datetime falls on a business weekday and is not a holiday."""
+        o = d.toordinal()
+        if not self.weekmask[(o + 6) % 7]:
+            return False
+        i = bisect_left(self._holidays, o)
+        return i == len(self._holidays) or self._holidays[i] != o
+
+    __contains__ = is_business_day
+
+    def count(self, start, end):
+        """Number of business days from start (inclusive) to end (exclusive). Negative if end is before start."""
+        return self._count_before(end.toordinal()) - self._count_before(start.toordinal())
+
+    def offset(self, d, n):
+        """Returns date/datetime moved by n business days. Same as d + n*cal.bdays.
+
+        Positive n gives the n-th business day after d, negative - the n-th business day before d.
+        Zero n gives d if it is a business day, otherwise the next business day. Time of datetime is kept.
+        """
+        o = d.toordinal()
+        if n > 0:
+            t = self._count_before(o + 1) + n - 1
+        else:
+            t = self._count_before(o) + n
+
+        new_ordinal = self._business_day(t)
+        if isinstance(d, datetime):
+            return d + timedelta(days=new_ordinal - o)
+        return BeautifulDate.fromordinal(new_ordinal)
+
+    def to_bytes(self):
+        """Serializes calendar to compact binary form: header and little-endian int32 holiday ordinals."""
+        mask_bits = sum(1 << i for i in range(7) if self.weekmask[i])
+        holidays = self._holidays
+        if sys.byteorder == 'big':
+            holidays = array('i', holidays)
+            holidays.byteswap()
+        return _HEADER.pack(_MAGIC, _VERSION, mask_bits, len(holidays)) + holidays.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Loads calendar serialized with to_bytes() without sorting and validating the holidays again."""
+        try:
+            magic, version, mask_bits, n = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError('Data is too short to be a business calendar') from None
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('Data is not a business calendar of version {}'.format(_VERSION))
+
+        holidays = array('i')
+        holidays.frombytes(data[_HEADER.size:_HEADER.size + n * holidays.itemsize])
+        if len(holidays) != n:
+            raise ValueError('Business calendar data is truncated')
+        if sys.byteorder == 'big':
+            holidays.byteswap()
+
+        calendar = cls.__new__(cls)
+        calendar._set_weekmask(tuple(bool(mask_bits & (1 << i)) for i in range(7)))
+        object.__setattr__(calendar, '_holidays', holidays)
+        return calendar
+
+    def save(self, path):
+        """Saves calendar to the binary file."""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Loads calendar from the binary file created with save()."""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class BusinessDays(_ReadOnly):
+    """Creates BusinessDelta of the calendar using operator '*'."""
+
+    __slots__ = ('calendar',)
+
+    def __init__(self, calendar):
+        object.__setattr__(self, 'calendar', calendar)
+
+    def __rmul__(self, n):
+        return BusinessDelta(n, self.calendar)
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.calendar)
+
+    def __eq__(self, other):
+        if not isinstance(other, BusinessDays):
+            return NotImplemented
+        return self.calendar == other.calendar
+
+    def __hash__(self):
+        return hash(self.calendar)
+
+
+class BusinessDelta(_ReadOnly):
+    """Number of business days of the calendar that can be added to or subtracted from date/datetime.
+
+    Examples:
+        >>> 15/Mar/2024 + 1*bdays  # Friday
+        BeautifulDate(2024, 3, 18)
+
+        >>> 16/Mar/2024 - 1*bdays  # Saturday
+        BeautifulDate(2024, 3, 15)
+
+        >>> list(drange(15/Mar/2024, 22/Mar/2024, 2*bdays))
+        [BeautifulDate(2024, 3, 15), BeautifulDate(2024, 3, 19), BeautifulDate(2024, 3, 21)]
+    """
+
+    __slots__ = ('n', 'calendar')
+
+    def __init__(self, n, calendar):
+        if n != int(n):
+            raise ValueError('Number of business days must be integer, not {!r}'.format(n))
+        object.__setattr__(self, 'n', int(n))
+        object.__setattr__(self, 'calendar', calendar)
+
+    def __repr__(self):
+        return '{}(bdays={:+d})'.format(self.__class__.__name__, self.n)
+
+    def __eq__(self, other):
+        if not isinstance(other, BusinessDelta):
+            return NotImplemented
+        return self.n == other.n and self.calendar == other.calendar
+
+    def __hash__(self):
+        return hash((self.n, self.calendar))
+
+    def __bool__(self):
+        return self.n != 0
+
+    def __add__(self, other):
+        if isinstance(other, date):
+            return self.calendar.offset(other, self.n)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __rsub__(self, other):
+        if isinstance(other, date):
+            return self.calendar.offset(other, -self.n)
+        return NotImplemented
+
+    def __neg__(self):
+        return BusinessDelta(-self.n, self.calendar)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return BusinessDelta(self.n * other, self.calendar)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def sign(self, anchor=None):
+        """Returns 1 if the delta moves dates forward, -1 if backward and 0 if it doesn't move them."""
+        return (self.n > 0) - (self.n < 0)
+
+    # Adding business days k times one after another is the same as adding them all at once
+    # (start + i*step), so drange with business-day step is computed from the business day indexes.
+
+    def _base(self, start):
+        """Index of the business day from which the i-th (i >= 1) date of the range is i*n business days away."""
+        o = start.toordinal()
+        if self.n > 0:
+            return self.calendar._count_before(o + 1) - 1
+        return self.calendar._count_before(o)
+
+    def _range_length(self, start, stop):
+        """Number of dates in drange(start, stop, self)."""
+        count_before = self.calendar._count_before
+        base = self._base(start)
+        if self.n > 0:
+            if not start < stop:
+                return 0
+            return 1 + max(0, -((base - count_before(stop.toordinal())) // self.n) - 1)
+        else:
+            if not stop < start:
+                return 0
+            return 1 + max(0, (base - count_before(stop.toordinal() + 1)) // -self.n)
+
+    def _range_index(self, start, d):
+        """Returns i such that start + i*self == d or None if there is no such i."""
+        if d == start:
+            return 0
+        if not self.calendar.is_business_day(d):
+            return None
+        i, remainder = divmod(self.calendar._count_before(d.toordinal()) - self._base(start), self.n)
+        if remainder or i < 1:
+            return None
+        return i
+
+
+DEFAULT_CALENDAR = BusinessCalendar()
+
+bdays = DEFAULT_CALENDAR.bdays
@@ -0,0 +1,135 @@
+from array import array
+from bisect import bisect_right
+from datetime import date
+
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(y):
+    return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
+
+def _days_in_month(y, m):
+    return 29 if m == 2 and _is_leap(y) else _DAYS_IN_MONTH[m]
+
+
+def _ymd_to_ordinal(y, m, d):
+    y1 = y - 1
+    return y1 * 365 + y1 // 4 - y1 // 100 + y1 // 400 + _DAYS_BEFORE_MONTH[m] + (m > 2 and _is_leap(y)) + d
+
+
+class CalendarTable:
+    """Ordinal of the 1st day, number of days and weekday of the 1st day of each month of the years
+    from first_year to last_year (inclusive), kept in compact arrays.
+
+    Lookups of the months within the years of the table take O(1) without creating date objects,
+    months outside of them are computed the usual way.
+
+    Examples:
+        >>> table = CalendarTable(2000, 2099)
+        >>> table.month_length(2024, 2)
+        29
+        >>> table.weekday(1995, 10, 16)  # Outside of the table
+        0
+    """
+
+    __slots__ = ('first_year', 'last_year', '_ordinals', '_lengths', '_weekdays')
+
+    def __init__(self, first_year=1900, last_year=2199):
+        if not 1 <= first_year <= last_year <= 9999:
+            raise ValueError('Years of the calendar table must be within 1..9999, not {}..{}'.format(
+                first_year, last_year))
+        self.first_year = first_year
+        self.last_year = last_year
+
+        self._ordinals = array('i')
+        self._lengths = array('B')
+        self._weekdays = array('B')
+        ordinal = date(first_year, 1, 1).toordinal()
+        for y in range(first_year, last_year + 1):
+            for m in range(1, 13):
+                length = _days_in_month(y, m)
+                self._ordinals.append(ordinal)
+                self._lengths.append(length)
+                self._weekdays.append((ordinal + 6) % 7)
+                ordinal += length
+
+    def __repr__(self):
+        return '{}({}, {})'.format(self.__class__.__name__, self.first_year, self.last_year)
+
+    def __contains__(self, year):
+        return self.first_year <= year <= self.last_year
+
+    def month_length(self, y, m):
+        """Number of days in the month."""
+        i = (y - self.first_year) * 12 + m - 1
+        if 0 <= i < len(self._lengths):
+            return self._lengths[i]
+        return _days_in_month(y, m)
+
+    def ordinal(self, y, m, d):
+        """Proleptic Gregorian ordinal of the date, same as date(y, m, d).toordinal() for valid dates."""
+        i = (y - self.first_year) * 12 + m - 1
+        if 0 <= i < len(self._ordinals):
+            return self._ordinals[i] + d - 1
+        return _ymd_to_ordinal(y, m, d)
+
+    def weekday(self, y, m, d):
+        """Day of the week of the date, where Monday is 0 and Sunday is 6."""
+        i = (y - self.first_year) * 12 + m - 1
+        if 0 <= i < len(self._weekdays):
+            return (self._weekdays[i] + d - 1) % 7
+        return (_ymd_to_ordinal(y, m, d) + 6) % 7
+
+    def add_months(self, d, n):
+        """Moves date/datetime by n months, clamping the day to the end of the shorter month.
+
+        Same as d + relativedelta(months=n), but the day is clamped by a lookup.
+        """
+        y, m = divmod(d.year * 12 + d.month - 1 + n, 12)
+        m += 1
+        day = d.day
+        if day > 28:
+            day = min(day, self.month_length(y, m))
+        return d.replace(year=y, month=m, day=day)
+
+    def add_months_to_ordinal(self, ordinal, n):
+        """Same as add_months() for the date given and returned as ordinal, without creating date objects."""
+        i = bisect_right(self._ordinals, ordinal) - 1
+        j = i + n
+        if 0 <= i and 0 <= j < len(self._ordinals) and ordinal < self._ordinals[i] + self._lengths[i]:
+            return self._ordinals[j] + min(ordinal - self._ordinals[i] + 1, self._lengths[j]) - 1
+        return self.add_months(date.fromordinal(ordinal), n).toordinal()
+
+
+_table = CalendarTable()
+
+
+def get_calendar_table():
+    """Returns CalendarTable used by the deltas and ranges."""
+    return _table
+
+
+def set_calendar_window(first_year, last_year):
+    """Replaces the calendar table used by the deltas and ranges with the one for the given years."""
+    global _table
+    _table = CalendarTable(first_year, last_year)
+    return _table
+
+
+def add_months(d, n):
+    """Moves date/datetime by n months using the current calendar table. See CalendarTable.add_months."""
+    return _table.add_months(d, n)
+
+
+def weekday_jump(weekday, nth, current):
+    """Number of days from a date of the current weekday to the nth given weekday (the date itself counts).
+
+    Same as relativedelta(weekday=...), negative nth goes backward. nth of 0 has no direction and raises ValueError.
+    """
+    if nth == 0:
+        raise ValueError('Weekday jump needs nth other than 0')
+    if nth > 0:
+        return (nth - 1) * 7 + (weekday - current) % 7
+    return -((-nth - 1) * 7 + (current - weekday) % 7)
@@ -0,0 +1,128 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from beautiful_date.beautiful_date import BeautifulDate
+
+
+class Clock:
+    """Source of the current date and time used by D.now(), D.today(), 5*days.ago, drange(stop), ...
+
+    By default, the system clock is read on every call. If tick (seconds or timedelta) is given,
+    the clock is read at most once per tick and the same objects are returned in between.
+    It is useful for the code that asks for the current time many times, e.g. while handling a request.
+    Each cached value is stored together with its expiry in one tuple, so the clock can be shared by threads.
+
+    Examples:
+        >>> with use_clock(Clock(tick=1)):
+        ...     D.now() is D.now()
+        True
+    """
+
+    __slots__ = ('tick', '_now', '_today')
+
+    def __init__(self, tick=None):
+        if hasattr(tick, 'total_seconds'):
+            tick = tick.total_seconds()
+        self.tick = tick
+
+        # (expires, tz, now) and (expires, today), replaced as a whole
+        self._now = (0, None, None)
+        self._today = (0, None)
+
+    def __repr__(self):
+        return '{}(tick={})'.format(self.__class__.__name__, self.tick)
+
+    def now(self, tz=None):
+        """Returns current datetime (in the given timezone)."""
+        if self.tick is None:
+            return datetime.now(tz=tz)
+
+        t = time.monotonic()
+        expires, now_tz, now = self._now
+        if t >= expires or tz is not now_tz:
+            now = datetime.now(tz=tz)
+            self._now = (t + self.tick, tz, now)
+        return now
+
+    def today(self):
+        """Returns current date as BeautifulDate."""
+        if self.tick is None:
+            now = datetime.now()
+            return BeautifulDate(now.year, now.month, now.day)
+
+        t = time.monotonic()
+        expires, today = self._today
+        if t >= expires:
+            now = datetime.now()
+            today = BeautifulDate(now.year, now.month, now.day)
+            self._today = (t + self.tick, today)
+        return today
+
+
+class FrozenClock(Clock):
+    """Clock that always returns the same time until it is changed with set() or advance().
+
+    Naive frozen time is treated as local time.
+
+    Examples:
+        >>> with frozen_clock((16/Oct/1995)[10:30]) as clock:
+        ...     print(D.now(), 1*hours.ago)
+        ...     clock.advance(5*days)
+        ...     print(D.today())
+        1995-10-16 10:30:00 1995-10-16 09:30:00
+        1995-10-21
+    """
+
+    __slots__ = ('_frozen',)
+
+    def __init__(self, now=None):
+        super().__init__()
+        self._frozen = datetime.now() if now is None else now
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._frozen)
+
+    def now(self, tz=None):
+        if tz is None:
+            return self._frozen
+        return self._frozen.astimezone(tz)
+
+    def today(self):
+        return BeautifulDate(self._frozen.year, self._frozen.month, self._frozen.day)
+
+    def set(self, now):
+        """Freezes the clock at the given datetime."""
+        self._frozen = now
+
+    def advance(self, delta):
+        """Moves the frozen time by delta (timedelta, 5*minutes, ...)."""
+        self._frozen = self._frozen + delta
+
+
+SYSTEM_CLOCK = Clock()
+
+_current_clock = ContextVar('beautiful_date_clock', default=SYSTEM_CLOCK)
+
+
+def get_clock():
+    """Returns the clock used in the current context."""
+    return _current_clock.get()
+
+
+@contextmanager
+def use_clock(clock):
+    """Uses given clock for the current date and time within the context (thread or asyncio task)."""
+    token = _current_clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _current_clock.reset(token)
+
+
+@contextmanager
+def frozen_clock(now=None):
+    """Freezes the current date and time within the context. Yields FrozenClock that can be moved."""
+    with use_clock(FrozenClock(now)) as clock:
+        yield clock
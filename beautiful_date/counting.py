@@ -0,0 +1,185 @@
+from datetime import datetime, timedelta
+
+from dateutil.relativedelta import weekday as _dateutil_weekday
+
+from beautiful_date.beautiful_date import _numpy
+from beautiful_date.beautiful_timedelta import BeautifulTimedelta, BeautifulWeekday, _weekday_number
+from beautiful_date.business_days import BusinessDays
+from beautiful_date.calendar_table import add_months
+from beautiful_date.date_array import DateArray, _EPOCH_ORDINAL
+from beautiful_date.date_range import drange, _calendar_months, _fixed_timedelta
+
+_ORIGIN = datetime(1, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _step(unit):
+    """Converts unit (months, weeks, bdays, ...) to the delta it stands for."""
+    if isinstance(unit, (BeautifulTimedelta, BusinessDays)):
+        return 1 * unit
+    return unit
+
+
+def _is_weekday(what):
+    return isinstance(what, (BeautifulWeekday, _dateutil_weekday))
+
+
+def _comparable(a, b):
+    """Takes date as midnight if the other value is datetime."""
+    if isinstance(a, datetime) and not isinstance(b, datetime):
+        b = datetime(b.year, b.month, b.day, tzinfo=a.tzinfo)
+    elif isinstance(b, datetime) and not isinstance(a, datetime):
+        a = datetime(a.year, a.month, a.day, tzinfo=b.tzinfo)
+    return a, b
+
+
+def _truncated(difference, unit):
+    """Number of whole units in the difference, truncated towards zero."""
+    if difference < timedelta(0):
+        return -(-difference // unit)
+    return difference // unit
+
+
+def months_between(a, b):
+    """Number of whole months from a to b (negative if b is before a), same as relativedelta(b, a) in months.
+
+    Counted from the month numbers and one date comparison, the same way as a + n*months (the day is clamped
+    to the end of the shorter month).
+
+    Examples:
+        >>> months_between(31/Jan/2020, 29/Feb/2020)
+        1
+        >>> months_between(16/Oct/1995, 15/Oct/2020)
+        299
+    """
+    a, b = _comparable(a, b)
+    n = (b.year - a.year) * 12 + b.month - a.month
+    if n > 0 and add_months(a, n) > b:
+        return n - 1
+    if n < 0 and add_months(a, n) < b:
+        return n + 1
+    return n
+
+
+def between(a, b, unit):
+    """Number of whole units (years, months, weeks, days, hours, ..., or multiples like 3*months) from a to b,
+    truncated towards zero. Same as (b - a).in_(unit) for BeautifulDate/BeautifulDatetime.
+
+    Examples:
+        >>> between(16/Oct/1995, 1/Jan/2020, years)
+        24
+        >>> between((1/Jan/2020)[10:00], (3/Jan/2020)[9:00], days)
+        1
+    """
+    if _is_weekday(unit):
+        return count(unit, a, b)
+    step = _step(unit)
+    months = _calendar_months(step)
+    if months is not None:
+        if months <= 0:
+            raise ValueError('Unit must be positive, not {!r}'.format(unit))
+        n = months_between(a, b)
+        return n // months if n >= 0 else -(-n // months)
+
+    fixed = _fixed_timedelta(step, _ORIGIN)
+    if fixed is None:
+        raise ValueError('Can only count years/months or units of fixed length (weeks, days, hours, ...), '
+                         'not {!r}'.format(unit))
+    if fixed <= timedelta(0):
+        raise ValueError('Unit must be positive, not {!r}'.format(unit))
+    a, b = _comparable(a, b)
+    return _truncated(b - a, fixed)
+
+
+def _weekdays_between(weekday, start, stop):
+    """Number of days with the weekday from ordinal start (inclusive) to stop (exclusive)."""
+    # Ordinal 1 is a Monday, so ordinals of the weekday have the remainder weekday + 1 modulo 7
+    shift = weekday + 1
+    return max(0, (stop - 1 - shift) // 7 - (start - 1 - shift) // 7)
+
+
+def count(what, a, b):
+    """Counts dates from a (inclusive) to b (exclusive) without generating them.
+
+    If what is a weekday (MO..SU), counts the dates that fall on it (datetimes are taken by their date).
+    Otherwise it is a step (months, 2*weeks, 1*bdays, ...) and the result is the same as len(drange(a, b, step)).
+
+    Examples:
+        >>> count(MO, 1/Jan/2020, 1/Jan/2021)
+        52
+        >>> count(months, 31/Jan/2020, 1/Jan/2021)
+        12
+    """
+    if _is_weekday(what):
+        return _weekdays_between(_weekday_number(what), a.toordinal(), b.toordinal())
+    return drange(a, b, _step(what)).count()
+
+
+def _ordinals(values):
+    if isinstance(values, DateArray):
+        return values.ordinals
+    return [d.toordinal() for d in values]
+
+
+def _is_datetime64(values):
+    return getattr(getattr(values, 'dtype', None), 'kind', None) == 'M'
+
+
+def between_many(starts, ends, unit):
+    """Applies between() to the pairs of starts and ends. Returns list, or numpy array for numpy arrays
+    of datetime64 (computed without Python loops).
+    """
+    if _is_datetime64(starts) or _is_datetime64(ends):
+        return _between_datetime64(starts, ends, unit)
+    if _is_weekday(unit):
+        return count_many(unit, starts, ends)
+    return [between(a, b, unit) for a, b in zip(starts, ends)]
+
+
+def count_many(what, starts, ends):
+    """Applies count() to the pairs of starts and ends. Weekdays are counted from the ordinals; for numpy arrays
+    of datetime64 returns numpy array computed without Python loops.
+    """
+    if not _is_weekday(what):
+        return [count(what, a, b) for a, b in zip(starts, ends)]
+
+    weekday = _weekday_number(what)
+    if _is_datetime64(starts) or _is_datetime64(ends):
+        np = _numpy()
+        start, stop = (np.asarray(v, dtype='datetime64[D]').astype(np.int64) + _EPOCH_ORDINAL for v in (starts, ends))
+        shift = weekday + 1
+        return np.maximum(0, (stop - 1 - shift) // 7 - (start - 1 - shift) // 7)
+    return [_weekdays_between(weekday, a, b) for a, b in zip(_ordinals(starts), _ordinals(ends))]
+
+
+def _between_datetime64(starts, ends, unit):
+    np = _numpy()
+    starts, ends = np.asarray(starts), np.asarray(ends)
+    if _is_weekday(unit):
+        return count_many(unit, starts, ends)
+
+    step = _step(unit)
+    months = _calendar_months(step)
+    if months is not None:
+        if months <= 0:
+            raise ValueError('Unit must be positive, not {!r}'.format(unit))
+        starts, ends = starts.astype('datetime64[us]'), ends.astype('datetime64[us]')
+        first_months = starts.astype('datetime64[M]')
+        n = (ends.astype('datetime64[M]') - first_months).astype(np.int64)
+
+        # Starts moved by n months, with the day clamped to the end of the shorter month
+        day = (starts.astype('datetime64[D]') - first_months.astype('datetime64[D]')).astype(np.int64)
+        time_of_day = starts - starts.astype('datetime64[D]')
+        target = first_months + n
+        length = ((target + 1).astype('datetime64[D]') - target.astype('datetime64[D]')).astype(np.int64)
+        moved = target.astype('datetime64[D]') + np.minimum(day, length - 1).astype('timedelta64[D]') + time_of_day
+
+        n = np.where((n > 0) & (moved > ends), n - 1, n)
+        n = np.where((n < 0) & (moved < ends), n + 1, n)
+        return np.sign(n) * (np.abs(n) // months)
+
+    fixed = _fixed_timedelta(step, _ORIGIN)
+    if fixed is None or fixed <= timedelta(0):
+        raise ValueError('Can only count positive years/months or units of fixed length, not {!r}'.format(unit))
+    difference = (ends.astype('datetime64[us]') - starts.astype('datetime64[us]')).astype(np.int64)
+    return np.sign(difference) * (np.abs(difference) // (fixed // _MICROSECOND))
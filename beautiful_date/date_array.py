@@ -0,0 +1,256 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from beautiful_date.beautiful_date import BeautifulDate, _numpy
+from beautiful_date.calendar_table import get_calendar_table
+from beautiful_date.date_range import _calendar_months, _fixed_timedelta
+
+# Header of the binary file: magic, format version, number of dates. Padded to 16 bytes to keep ordinals aligned
+_HEADER = struct.Struct('<4sB3xQ')
+_MAGIC = b'DARR'
+_VERSION = 1
+
+# Ordinal of 1970-01-01, the epoch of numpy datetime64
+_EPOCH_ORDINAL = 719163
+
+
+def _date_ordinal(d):
+    if isinstance(d, datetime) or not isinstance(d, date):
+        raise TypeError('DateArray can only contain dates, not {!r}'.format(d.__class__.__name__))
+    return d.toordinal()
+
+
+class DateArray:
+    """Sequence of dates stored as int32 proleptic Gregorian ordinals (4 bytes per date).
+
+    Dates are created only when the elements are accessed. Adding days/weeks, months/years,
+    comparisons, sorting and binary search work on the ordinals directly. Ordinals can be kept in memory
+    (array.array) or in a memory-mapped file (see save() and load()).
+
+    Comparisons with a date or another DateArray (<, <=, >, >=) return lists of booleans for each element,
+    == compares the arrays as a whole.
+
+    Examples:
+        >>> dates = DateArray.from_iterable([16/Oct/1995, 1/Jan/2000, 29/Feb/2024])
+        >>> dates[1]
+        BeautifulDate(2000, 1, 1)
+        >>> dates + 1*months
+        DateArray([1995-11-16, 2000-02-01, 2024-03-29])
+        >>> dates.searchsorted(1/Jan/2001)
+        2
+        >>> dates < 1/Jan/2001
+        [True, True, False]
+    """
+
+    __slots__ = ('_ordinals', '_buffer')
+
+    def __init__(self, dates=()):
+        """Creates array from dates. See also from_iterable()."""
+        self._ordinals = array('i', map(_date_ordinal, dates))
+        self._buffer = None
+
+    @classmethod
+    def from_ordinals(cls, ordinals):
+        """Creates array from ordinals (iterable of int). array('i') and int32 memoryview are used without copying."""
+        date_array = cls.__new__(cls)
+        if isinstance(ordinals, memoryview):
+            if ordinals.format != 'i':
+                ordinals = array('i', ordinals)
+        elif not isinstance(ordinals, array) or ordinals.typecode != 'i':
+            ordinals = array('i', ordinals)
+        date_array._ordinals = ordinals
+        date_array._buffer = None
+        return date_array
+
+    @classmethod
+    def from_iterable(cls, dates):
+        """Creates array from iterable of dates. Ranges of dates are converted without creating date objects."""
+        if isinstance(dates, DateArray):
+            return cls.from_ordinals(array('i', dates._ordinals))
+        to_date_array = getattr(dates, 'to_date_array', None)
+        if to_date_array is not None:
+            return to_date_array()
+        return cls(dates)
+
+    def __repr__(self):
+        if len(self) > 6:
+            shown = '{}, ..., {}'.format(', '.join(map(str, self[:3])), ', '.join(map(str, self[-3:])))
+        else:
+            shown = ', '.join(map(str, self))
+        return '{}([{}])'.format(self.__class__.__name__, shown)
+
+    @property
+    def ordinals(self):
+        """Underlying buffer of int32 ordinals."""
+        return self._ordinals
+
+    @property
+    def nbytes(self):
+        return len(self._ordinals) * 4
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    def __iter__(self):
+        return map(BeautifulDate.fromordinal, self._ordinals)
+
+    def __reversed__(self):
+        return map(BeautifulDate.fromordinal, reversed(self._ordinals))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            # Slices of the memory-mapped arrays share the memory of the file
+            date_array = DateArray.from_ordinals(self._ordinals[i])
+            date_array._buffer = self._buffer
+            return date_array
+        return BeautifulDate.fromordinal(self._ordinals[i])
+
+    def __contains__(self, d):
+        if isinstance(d, datetime) or not isinstance(d, date):
+            return False
+        return d.toordinal() in self._ordinals
+
+    def __eq__(self, other):
+        if not isinstance(other, DateArray):
+            return NotImplemented
+        return self._ordinals == other._ordinals
+
+    __hash__ = None
+
+    def _shifted(self, days):
+        return DateArray.from_ordinals(array('i', [o + days for o in self._ordinals]))
+
+    def _add_months(self, months):
+        shift = get_calendar_table().add_months_to_ordinal
+        return DateArray.from_ordinals(array('i', [shift(o, months) for o in self._ordinals]))
+
+    def __add__(self, delta):
+        """Adds delta to each date. Whole days/weeks and months/years are added to the ordinals directly."""
+        if isinstance(delta, timedelta):
+            if delta.seconds or delta.microseconds:
+                raise TypeError('Only whole days can be added to DateArray, not {!r}'.format(delta))
+            return self._shifted(delta.days)
+        if isinstance(delta, relativedelta):
+            months = _calendar_months(delta)
+            if months is not None:
+                return self._add_months(months)
+            fixed = _fixed_timedelta(delta, date.min)
+            if fixed is not None:
+                return self._shifted(fixed.days)
+        if isinstance(delta, DateArray):
+            return NotImplemented
+
+        # Weekdays, business days and mixed deltas are added to each date
+        return DateArray(d + delta for d in self)
+
+    __radd__ = __add__
+
+    def __sub__(self, delta):
+        if isinstance(delta, (timedelta, relativedelta)):
+            return self + -delta
+        return NotImplemented
+
+    def _compare(self, other, op):
+        if isinstance(other, DateArray):
+            if len(other) != len(self):
+                raise ValueError('Can not compare DateArrays of lengths {} and {}'.format(len(self), len(other)))
+            return [op(a, b) for a, b in zip(self._ordinals, other._ordinals)]
+        if isinstance(other, datetime) or not isinstance(other, date):
+            return NotImplemented
+        o = other.toordinal()
+        return [op(a, o) for a in self._ordinals]
+
+    def __lt__(self, other):
+        return self._compare(other, int.__lt__)
+
+    def __le__(self, other):
+        return self._compare(other, int.__le__)
+
+    def __gt__(self, other):
+        return self._compare(other, int.__gt__)
+
+    def __ge__(self, other):
+        return self._compare(other, int.__ge__)
+
+    def searchsorted(self, d, side='left'):
+        """Index where the date (or each of the dates) would be inserted to keep the sorted array sorted."""
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right', not {!r}".format(side))
+        search = bisect_left if side == 'left' else bisect_right
+        if isinstance(d, date):
+            return search(self._ordinals, d.toordinal())
+        return [search(self._ordinals, o) for o in map(_date_ordinal, d)]
+
+    def sort(self, reverse=False):
+        """Sorts the array in place (the memory-mapped file as well if it was loaded for writing)."""
+        self._ordinals[:] = array('i', sorted(self._ordinals, reverse=reverse))
+
+    def sorted(self, reverse=False):
+        """Returns sorted copy of the array."""
+        return DateArray.from_ordinals(array('i', sorted(self._ordinals, reverse=reverse)))
+
+    def argsort(self):
+        """Returns list of indexes that would sort the array."""
+        ordinals = self._ordinals
+        return sorted(range(len(ordinals)), key=ordinals.__getitem__)
+
+    def to_array(self):
+        """Converts to numpy array of datetime64[D] without creating date objects. Requires numpy."""
+        np = _numpy()
+        return (np.frombuffer(self._ordinals, dtype=np.int32) - _EPOCH_ORDINAL).astype('datetime64[D]')
+
+    to_numpy = to_array
+
+    def save(self, path):
+        """Saves array to the binary file: header and little-endian int32 ordinals."""
+        ordinals = self._ordinals
+        if sys.byteorder == 'big':
+            ordinals = array('i', ordinals)
+            ordinals.byteswap()
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(ordinals)))
+            f.write(ordinals.tobytes())
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """Loads array from the binary file created with save().
+
+        If mmap_mode is 'r' (read-only) or 'r+' (changes are written to the file), the file is memory-mapped
+        instead of being read, so only the accessed pages are loaded.
+        """
+        if mmap_mode not in (None, 'r', 'r+'):
+            raise ValueError("mmap_mode must be None, 'r' or 'r+', not {!r}".format(mmap_mode))
+
+        with open(path, 'rb' if mmap_mode != 'r+' else 'r+b') as f:
+            header = f.read(_HEADER.size)
+            try:
+                magic, version, n = _HEADER.unpack(header)
+            except struct.error:
+                raise ValueError('File is too short to be a date array') from None
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError('File is not a date array of version {}'.format(_VERSION))
+
+            if mmap_mode is None or sys.byteorder == 'big':
+                ordinals = array('i')
+                ordinals.frombytes(f.read(n * ordinals.itemsize))
+                if len(ordinals) != n:
+                    raise ValueError('Date array file is truncated')
+                if sys.byteorder == 'big':
+                    ordinals.byteswap()
+                return cls.from_ordinals(ordinals)
+
+            access = mmap.ACCESS_READ if mmap_mode == 'r' else mmap.ACCESS_WRITE
+            buffer = mmap.mmap(f.fileno(), 0, access=access)
+
+        end = _HEADER.size + n * 4
+        if len(buffer) < end:
+            raise ValueError('Date array file is truncated')
+        date_array = cls.from_ordinals(memoryview(buffer)[_HEADER.size:end].cast('i'))
+        date_array._buffer = buffer
+        return date_array
@@ -1,11 +1,245 @@
-from datetime import date, datetime
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from itertools import islice
+from math import gcd
 
-from beautiful_date import BeautifulDate, days
+from dateutil.relativedelta import relativedelta
 
+from beautiful_date import BeautifulDate, D, days
+from beautiful_date.beautiful_timedelta import BeautifulRelativeDelta, _weekday_number
+from beautiful_date.beautiful_date import BeautifulDatetime, _beautiful_datetime, _numpy
+from beautiful_date.business_days import BusinessDelta
+from beautiful_date.calendar_table import add_months, get_calendar_table
 
-def timedelta_is_negative(td):
+_ABSOLUTE_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond')
+_ONE_DAY = timedelta(days=1)
+_ZERO = timedelta(0)
+_DIRECTIONS = {'forward': False, 'backward': True}
+_MODES = ('wall', 'absolute')
+_SECOND = timedelta(seconds=1)
+_MICROSECOND = timedelta(microseconds=1)
+_WEEK_US = timedelta(weeks=1) // _MICROSECOND
+
+
+def delta_sign(td, anchor=None):
+    """Returns 1 if timedelta moves dates forward, -1 if backward and 0 if it doesn't move them.
+
+    If the direction depends on the date the timedelta is applied to (e.g. 1*months - 30*days),
+    it is determined for the anchor date/datetime. Returns None if it can't be determined without it.
+    """
+    if isinstance(td, relativedelta):
+        return BeautifulRelativeDelta.sign(td, anchor)
+
+    sign = getattr(td, 'sign', None)
+    if sign is not None:
+        return sign(anchor)
+
+    if isinstance(td, timedelta):
+        return (td > _ZERO) - (td < _ZERO)
+
+    if anchor is None:
+        return None
+    moved = anchor + td
+    return (moved > anchor) - (moved < anchor)
+
+
+def timedelta_is_negative(td, anchor=None):
     """Checks whether timedelta is negative (would move date/datetime to the past)."""
-    return datetime.now() > datetime.now() + td
+    return delta_sign(td, anchor) == -1
+
+
+def _fixed_timedelta(step, start):
+    """Returns step as a timedelta if it moves start by a fixed amount of time, otherwise None.
+
+    Steps with months, years, leapdays, weekdays or absolute values (day=1, ...) depend on the date
+    they are applied to and have no fixed length.
+    """
+    if isinstance(step, timedelta):
+        td = step
+    elif isinstance(step, relativedelta):
+        if step.years or step.months or step.leapdays or step.weekday is not None:
+            return None
+        if any(getattr(step, field) is not None for field in _ABSOLUTE_FIELDS):
+            return None
+        td = timedelta(days=step.days, hours=step.hours, minutes=step.minutes,
+                       seconds=step.seconds, microseconds=step.microseconds)
+    else:
+        return None
+
+    if not isinstance(start, datetime) and td % _ONE_DAY:
+        # Adding time to a date either converts it to datetime or is truncated
+        return None
+    return td
+
+
+def _calendar_months(step):
+    """Returns number of months in step if it consists only of years and months, otherwise None."""
+    if not isinstance(step, relativedelta) or step.leapdays or step.weekday is not None:
+        return None
+    if step.days or step.hours or step.minutes or step.seconds or step.microseconds:
+        return None
+    if any(getattr(step, field) is not None for field in _ABSOLUTE_FIELDS):
+        return None
+    return step.years * 12 + step.months
+
+
+def _walked(start, months, k):
+    """k-th date of the range from start by steps of whole months, without walking it.
+
+    Same as walking: once the day is clamped to the end of a shorter month, the following dates keep the smaller
+    day. Months visited by the range repeat every 12 steps, so unless February is among them (leap years), the day
+    doesn't change after that.
+    """
+    n = start.year * 12 + start.month - 1
+    day = start.day
+    if day > 28:
+        month_length = get_calendar_table().month_length
+        visits_february = any((n + j * months) % 12 == 1 for j in range(12))
+        for j in range(1, k + 1):
+            y, m = divmod(n + j * months, 12)
+            day = min(day, month_length(y, m + 1))
+            if day <= 28 or j >= 12 and not visits_february:
+                break
+    y, m = divmod(n + k * months, 12)
+    return start.replace(year=y, month=m + 1, day=day)
+
+
+def _beautify(d):
+    """Converts plain date to BeautifulDate, leaves other values as they are."""
+    if type(d) is date:
+        return BeautifulDate(d.year, d.month, d.day)
+    return d
+
+
+def _timezone(tz):
+    """Returns tzinfo given as is or by the name of the zone (e.g. 'Europe/Prague')."""
+    if isinstance(tz, str):
+        try:
+            from zoneinfo import ZoneInfo
+        except ImportError:  # pragma: no cover
+            raise TypeError('drange() tz can be given by name since Python 3.9, pass tzinfo instead') from None
+        return ZoneInfo(tz)
+    if tz is not None and not isinstance(tz, tzinfo):
+        raise TypeError('drange() tz must be tzinfo or name of the zone, not {!r}'.format(tz.__class__.__name__))
+    return tz
+
+
+def _utc_offset(tz, utc):
+    """UTC offset of the timezone at the given naive UTC datetime."""
+    return tz.fromutc(utc.replace(tzinfo=tz)).utcoffset()
+
+
+class _Transitions:
+    """UTC offsets of the timezone between two naive UTC datetimes, found once for the whole range.
+
+    Offsets are sampled every day and the instants at which they change are found by bisection,
+    so converting datetimes of the range to the timezone doesn't need a timezone lookup for each of them.
+    """
+
+    __slots__ = ('tz', 'instants', 'offsets', 'ends')
+
+    def __init__(self, tz, first, last):
+        self.tz = tz
+        t, last = first.replace(microsecond=0) - _ONE_DAY, last + _ONE_DAY
+
+        # offsets[i] is used before instants[i] and offsets[i + 1] from it
+        self.instants = []
+        self.offsets = [_utc_offset(tz, t)]
+        while t < last:
+            following = t + _ONE_DAY
+            offset = _utc_offset(tz, following)
+            if offset != self.offsets[-1]:
+                low, high = t, following
+                while high - low > _SECOND:
+                    middle = low + (high - low) // _SECOND // 2 * _SECOND
+                    if _utc_offset(tz, middle) == self.offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+                self.instants.append(high)
+                self.offsets.append(offset)
+            t = following
+
+        # Wall time at which each of the offsets stops being used
+        self.ends = [instant + offset for instant, offset in zip(self.instants, self.offsets)]
+
+    def to_local(self, utc):
+        """Converts naive UTC datetime to aware datetime in the timezone. The second of the repeated
+        wall times (after clocks are turned back) gets fold=1."""
+        i = bisect_right(self.instants, utc)
+        offset = self.offsets[i]
+        fold = i > 0 and offset < self.offsets[i - 1] and utc < self.instants[i - 1] + self.offsets[i - 1] - offset
+        return (utc + offset).replace(tzinfo=self.tz, fold=fold)
+
+    def from_wall(self, wall):
+        """Converts naive wall time to aware datetime in the timezone. Repeated wall times are taken
+        the first time they occur and nonexistent ones (skipped when clocks are turned forward) are
+        moved forward by the length of the gap."""
+        i = bisect_right(self.ends, wall)
+        if i > 0 and wall < self.instants[i - 1] + self.offsets[i]:
+            wall += self.offsets[i] - self.offsets[i - 1]
+        return wall.replace(tzinfo=self.tz, fold=0)
+
+    def moved_from(self, wall):
+        """Nonexistent wall time that from_wall() moves to the given one, None if there is no such."""
+        for low, high in self.gaps():
+            if high <= wall < high + (high - low):
+                return wall - (high - low)
+        return None
+
+    def gaps(self):
+        """Yields (start, end) of the naive wall times that don't exist, as clocks are turned forward."""
+        for i in range(1, len(self.offsets)):
+            if self.offsets[i] > self.offsets[i - 1]:
+                yield self.ends[i - 1], self.instants[i - 1] + self.offsets[i]
+
+
+class _EveryNth:
+    """Step that moves date/datetime of the range n dates/datetimes further in it (back for negative n).
+
+    Slices of ranges with calendar steps (and some others) can't be represented by a step of the same kind,
+    e.g. every other date of drange(31/Jan/2020, 1/Jan/2021, 1*months) isn't the same as the range
+    with 2*months step. Such slices are ranges with this step over the dates of the original range.
+    """
+
+    __slots__ = ('range', 'n', 'values', '_positions')
+
+    def __init__(self, r, n):
+        self.range = r
+        self.n = n
+        # Naive wall or UTC datetimes for the range with tz, as the range is computed on them
+        self.values = tuple(r._iter_naive())
+        self._positions = None
+
+    def __repr__(self):
+        return '{}({!r}, {})'.format(self.__class__.__name__, self.range, self.n)
+
+    def __eq__(self, other):
+        if not isinstance(other, _EveryNth):
+            return NotImplemented
+        return self.range == other.range and self.n == other.n
+
+    def __hash__(self):
+        return hash((self.range, self.n))
+
+    def __reduce__(self):
+        return _EveryNth, (self.range, self.n)
+
+    def sign(self, anchor=None):
+        return -1 if (self.n < 0) != self.range._backwards else 1
+
+    def __radd__(self, d):
+        if self._positions is None:
+            self._positions = {value: i for i, value in enumerate(self.values)}
+        i = self._positions.get(d)
+        if i is None:
+            return NotImplemented
+        i += self.n
+        # Date/datetime doesn't move past the ends of the range, which ends walking it
+        return self.values[i] if 0 <= i < len(self.values) else d
 
 
 class drange:  # noqa: N801
@@ -21,15 +255,52 @@ class drange:  # noqa: N801
 
     When step is given, it specifies the increment (or decrement).
     When step is not given, 1-day step is used.
+
+    Direction of the range is determined from the step. For steps that move dates forward or backward
+    depending on the date (e.g. 1*months - 30*days) it is determined for the start date, unless
+    direction ('forward' or 'backward') is given explicitly. The range ends once the step stops
+    moving dates in its direction. Direction that contradicts a step moving all dates the same way
+    (e.g. 1*days or 1*months) raises ValueError.
+
+    Like built-in range, drange can be iterated multiple times, indexed, sliced, reversed and
+    supports len() and "in". For steps of fixed length (weeks, days, hours, ...) all of these
+    are computed arithmetically. For business-day steps of dates they are computed from the business
+    days index of the calendar. For calendar steps (months, years, weekdays, ...) each date depends
+    on the previous one, so the dates are generated once and cached.
+
+    If tz is given (tzinfo or name of the zone, e.g. 'Europe/Prague'), the range produces aware datetimes
+    in that timezone. Naive start and stop are taken as wall time in tz. In 'wall' mode (default) steps
+    are added to the wall time, so 1*days keeps the time of day across DST changes. Wall times skipped
+    when clocks are turned forward are moved forward by the length of the gap, unless the step of fixed
+    length isn't longer than the gap: then they are left out, as they would repeat or pass the following
+    datetimes. In 'absolute' mode steps are added to the elapsed time, so 1*hours is always an hour apart.
+    UTC offsets of tz are found once for the whole range.
+
+    Examples:
+        >>> r = drange(1/Jan/2020, 1/Jan/2021)
+        >>> len(r)
+        366
+        >>> r[-1]
+        BeautifulDate(2020, 12, 31)
+        >>> r[::7]
+        drange(2020-01-01, 2021-01-01, BeautifulFixedDelta(days=+7))
+        >>> 29/Feb/2020 in r
+        True
+
+        >>> r = drange((29/Mar/2025)[12:], (31/Mar/2025)[:], 12*hours, tz=ZoneInfo('Europe/Prague'), mode='absolute')
+        >>> [str(d) for d in r]
+        ['2025-03-29 12:00:00+01:00', '2025-03-30 00:00:00+01:00', '2025-03-30 13:00:00+02:00']
     """
 
-    def __init__(self, start_or_stop, stop=None, step=1 * days):
+    def __init__(self, start_or_stop, stop=None, step=1 * days, direction=None, tz=None, mode='wall'):
+        tz = _timezone(tz)
         if stop is None:
-            if isinstance(start_or_stop, datetime):
-                start = datetime.now()
+            if tz is not None:
+                start = D.now(tz)
+            elif isinstance(start_or_stop, datetime):
+                start = D.now()
             else:
-                now = date.today()
-                start = BeautifulDate(now.year, now.month, now.day)
+                start = D.today()
 
             stop = start_or_stop
         else:
@@ -38,22 +309,780 @@ class drange:  # noqa: N801
         if not step:
             raise ValueError('drange() step must be positive or negative step, not 0')
 
-        self._backwards = timedelta_is_negative(step)
+        self._tz = tz
+        self._mode = mode
+        self._transitions = None
+        self._skipped_indexes = None
+        if tz is not None:
+            if mode not in _MODES:
+                raise ValueError("drange() mode must be 'wall' or 'absolute', not {!r}".format(mode))
+            # The range is computed on naive wall or UTC time and converted to tz on the way out
+            start, stop = self._naive(start), self._naive(stop)
 
-        self._start = start
+        self._start = _beautify(start)
         self._stop = stop
         self._step = step
 
+        self._fixed_step = _fixed_timedelta(step, start)
+        if direction is not None:
+            if direction not in _DIRECTIONS:
+                raise ValueError("drange() direction must be 'forward' or 'backward', not {!r}".format(direction))
+            self._backwards = _DIRECTIONS[direction]
+            # Direction can only be chosen for steps whose direction depends on the date
+            if delta_sign(step) == (1 if self._backwards else -1):
+                raise ValueError('drange() direction {!r} contradicts step {!r}'.format(direction, step))
+        elif self._fixed_step is not None:
+            self._backwards = self._fixed_step < _ZERO
+        else:
+            self._backwards = delta_sign(step, self._start) == -1
+
+        if isinstance(step, BusinessDelta) and not isinstance(start, datetime):
+            self._business_step = step
+        else:
+            self._business_step = None
+
+        self._cache = None
+
     def __repr__(self):
-        return 'drange({}, {}, {})'.format(self._start, self._stop, self._step)
+        if self._tz is None:
+            return 'drange({}, {}, {!r})'.format(self._start, self._stop, self._step)
+        return 'drange({}, {}, {!r}, tz={}, mode={!r})'.format(self._aware(self._start), self._aware(self._stop),
+                                                               self._step, self._tz, self._mode)
 
-    def __iter__(self):
+    def _key(self):
+        mode = self._mode if self._tz is not None else None
+        return self._start, self._stop, self._step, self._backwards, self._tz, mode
+
+    def __eq__(self, other):
+        """Ranges are equal if they are defined by the same start, stop, step, direction and timezone."""
+        if not isinstance(other, drange):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __reduce__(self):
+        # Pickled by the arguments only, without the cached dates and UTC offsets
+        start, stop = self._start, self._stop
+        if self._tz is not None:
+            if self._mode == 'absolute':
+                # Naive start and stop would be taken as wall time in tz, not as UTC time the range is computed on
+                start, stop = start.replace(tzinfo=timezone.utc), stop.replace(tzinfo=timezone.utc)
+            return drange, (start, stop, self._step, self._direction(), self._tz, self._mode)
+        if self._fixed_step is not None and (self._fixed_step < _ZERO) == self._backwards:
+            return drange, (start, stop, self._step)
+        return drange, (start, stop, self._step, self._direction())
+
+    def _direction(self):
+        return 'backward' if self._backwards else 'forward'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
         return self
 
-    def __next__(self):
-        if (self._backwards and self._start <= self._stop) or (not self._backwards and self._start >= self._stop):
-            raise StopIteration
+    def _naive(self, d):
+        """Converts date/datetime to the naive wall or UTC datetime the range with tz is computed on."""
+        if not isinstance(d, datetime):
+            d = BeautifulDatetime(d.year, d.month, d.day)
+        elif type(d) is datetime:
+            # So that the aware datetimes of the range are BeautifulDatetime as well
+            d = _beautiful_datetime(d)
+        if self._mode == 'wall':
+            return d.astimezone(self._tz).replace(tzinfo=None) if d.tzinfo is not None else d
+        if d.tzinfo is None:
+            d = d.replace(tzinfo=self._tz)
+        return d.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def _offsets(self):
+        """UTC offsets of tz found for the range with tz."""
+        if self._transitions is None:
+            # Wall time differs from UTC by less than a day the transitions are searched around the range
+            first, last = sorted((self._start, self._stop))
+            self._transitions = _Transitions(self._tz, first, last)
+        return self._transitions
+
+    def _converter(self):
+        """Function that converts naive datetimes of the range with tz to aware datetimes."""
+        if self._mode == 'wall':
+            return self._offsets().from_wall
+        return self._offsets().to_local
+
+    def _skipped(self):
+        """Ascending indexes of the wall times left out of the range with tz and fixed step (see drange).
+        Indexes count all the steps from the start, the ones of the range are those without them."""
+        if self._skipped_indexes is None:
+            skipped = []
+            if self._tz is not None and self._mode == 'wall' and self._fixed_step is not None:
+                start, step, n = self._start, abs(self._fixed_step), self._steps()
+                for low, high in self._offsets().gaps():
+                    if high - low < step:
+                        continue
+                    # Steps from the start that fall into [low, high)
+                    if self._backwards:
+                        first, last = (start - high) // step + 1, (start - low) // step + 1
+                    else:
+                        first, last = -((start - low) // step), -((start - high) // step)
+                    skipped.extend(range(max(first, 0), min(last, n)))
+            self._skipped_indexes = tuple(sorted(skipped))
+        return self._skipped_indexes
+
+    def _step_index(self, i):
+        """Number of steps from the start to the i-th datetime of the range with left out wall times."""
+        for j in self._skipped():
+            if j > i:
+                break
+            i += 1
+        return i
+
+    def _aware(self, d):
+        return d if self._tz is None else self._converter()(d)
+
+    def _derived(self, start, stop, step, direction=None):
+        """Creates range of the same timezone and mode from values of this range."""
+        r = drange(start, stop, step, direction)
+        r._tz, r._mode, r._transitions = self._tz, self._mode, self._transitions
+        return r
+
+    def _in_range(self, d):
+        if self._backwards:
+            return self._stop < d <= self._start
+        else:
+            return self._start <= d < self._stop
+
+    def _walk(self):
+        current = self._start
+        months = _calendar_months(self._step)
+        while self._in_range(current):
+            yield current
+            # Steps of whole months/years are added by the calendar table instead of relativedelta
+            following = _beautify(add_months(current, months)) if months is not None else current + self._step
+            if (following <= current) if not self._backwards else (following >= current):
+                # Step whose direction depends on the date stopped moving towards the stop
+                return
+            current = following
+
+    def _elements(self):
+        """Tuple of all the dates of the range with calendar step, generated once."""
+        if self._cache is None:
+            self._cache = tuple(self._walk())
+        return self._cache
+
+    def __iter__(self):
+        iterator = self._iter_naive()
+        return iterator if self._tz is None else map(self._converter(), iterator)
+
+    def _iter_naive(self):
+        """Iterates over the dates/datetimes of the range (naive wall or UTC datetimes for ranges with tz)."""
+        if self._business_step is not None:
+            return self._walk()
+        if self._fixed_step is None:
+            return iter(self._cache) if self._cache is not None else self._walk()
+        return self._iter_fixed()
+
+    def _iter_fixed(self):
+        current, step = self._start, self._fixed_step
+        skipped = self._skipped() if self._tz is not None else ()
+        if skipped:
+            skipped = frozenset(skipped)
+            for i in range(self._steps()):
+                if i not in skipped:
+                    yield current
+                current += step
+            return
+
+        for _ in range(len(self)):
+            yield _beautify(current)
+            current += step
+
+    def __reversed__(self):
+        if self._business_step is not None:
+            return (self[i] for i in reversed(range(len(self))))
+        if self._fixed_step is None:
+            iterator = reversed(self._elements())
+            return iterator if self._tz is None else map(self._converter(), iterator)
+        return iter(self[::-1])
+
+    def __len__(self):
+        if self._business_step is not None:
+            return self._business_step._range_length(self._start, self._stop)
+        if self._fixed_step is None:
+            months = _calendar_months(self._step)
+            if months is not None and self._cache is None:
+                return self._months_length(months)
+            return len(self._elements())
+        if self._tz is not None:
+            return self._steps() - len(self._skipped())
+        return self._steps()
+
+    def _steps(self):
+        """Number of steps of fixed length from the start before reaching the stop."""
+        return max(0, -((self._start - self._stop) // self._fixed_step))
+
+    def _months_length(self, months):
+        """Number of dates of the range with step of whole months, computed without generating them."""
+        if not self:
+            return 0
+        if (months < 0) != self._backwards:
+            # Step moves away from the stop, so only the start is in the range
+            return 1
+        start, stop = self._start, self._stop
+        if isinstance(start, datetime) and not isinstance(stop, datetime):
+            stop = datetime(stop.year, stop.month, stop.day)
+
+        # Dates before the month of the stop are all in the range, the one in its month is compared with it
+        stop_month = stop.year * 12 + stop.month
+        k = (stop_month - start.year * 12 - start.month) // months
+        if start.year * 12 + start.month + k * months != stop_month:
+            return k + 1
+        return k + self._in_range(_walked(start, months, k))
+
+    def count(self, d=None):
+        """Without arguments returns number of dates of the range, same as len(). Ranges with fixed,
+        business-day or whole months/years steps are counted without generating the dates.
+
+        With date/datetime given returns 1 if it is in the range, otherwise 0, same as range.count().
+
+        Examples:
+            >>> drange(31/Jan/2000, 1/Jan/2100, 1*months).count()
+            1200
+        """
+        if d is None:
+            return len(self)
+        return int(d in self)
+
+    def __bool__(self):
+        return self._in_range(self._start)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._slice(i)
+
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('drange object index out of range')
+
+        if self._business_step is not None:
+            # Adding 0 business days would move the start from a holiday to the next business day
+            return self._start + i * self._business_step if i else self._start
+        if self._fixed_step is None:
+            return self._aware(self._elements()[i])
+        if self._tz is not None:
+            return self._aware(self._start + self._step_index(i) * self._fixed_step)
+        return _beautify(self._start + i * self._fixed_step)
+
+    def _slice(self, s):
+        r = range(len(self))[s]
+
+        if self._fixed_step is not None:
+            if self._tz is not None and self._skipped():
+                if r.step != 1:
+                    return self._every_nth(r)
+                # Sub-range leaves out the same wall times
+                n = len(self)
+                start, stop = (self._step_index(j) if j < n else self._steps() for j in (r.start, r.stop))
+                return self._derived(self._start + start * self._fixed_step,
+                                     self._start + max(start, stop) * self._fixed_step, self._step)
+            return self._derived(self._start + r.start * self._fixed_step,
+                                 self._start + r.stop * self._fixed_step,
+                                 self._step * r.step)
+
+        if self._business_step is not None:
+            if r.step < 0:
+                return self._every_nth(r)
+            # Dates of the range are start + i*step, so every k-th date from the i-th one are the same with k*step
+            n = len(self)
+            start = self[r.start] if r.start < n else self._stop
+            stop = self[r.stop] if r.stop < n else self._stop
+            if r.start >= r.stop:
+                stop = start
+            return drange(start, stop, self._step * r.step)
+
+        # Each date of the calendar range depends on the previous one. Continuous part of the range
+        # can be represented by drange, but there is no such step that would skip dates the same way.
+        if r.step != 1:
+            return self._every_nth(r)
+
+        elements = self._elements()
+        n = len(elements)
+        start = elements[r.start] if r.start < n else self._stop
+        stop = elements[r.stop] if r.stop < n else self._stop
+        if r.start >= r.stop:
+            stop = start
+        return self._derived(start, stop, self._step, direction='backward' if self._backwards else 'forward')
+
+    def _every_nth(self, r):
+        """Slice of the range by the indexes r that no step of the range's kind can produce, see _EveryNth."""
+        if not r:
+            return self._derived(self._start, self._start, self._step, self._direction())
+
+        step = _EveryNth(self, r.step)
+        values = step.values
+        if r.step > 0:
+            stop = values[r.stop] if r.stop < len(values) else self._stop
+        elif r.stop >= 0:
+            stop = values[r.stop]
+        else:
+            # Just before the start, so that the first date/datetime of the range is in the slice
+            unit = _MICROSECOND if isinstance(self._start, datetime) else _ONE_DAY
+            stop = values[0] + unit if self._backwards else values[0] - unit
+        return self._derived(values[r.start], stop, step)
+
+    def __contains__(self, d):
+        if self._tz is not None:
+            return self._wall_or_utc(d) is not None
+        return self._has(d)
+
+    def _has(self, d):
+        """Checks whether the date/datetime (naive wall or UTC datetime for ranges with tz) is in the range."""
+        if not isinstance(d, date) or isinstance(d, datetime) != isinstance(self._start, datetime):
+            return False
+
+        if self._business_step is not None:
+            return self._in_range(d) and self._business_step._range_index(self._start, d) is not None
+        if self._fixed_step is None:
+            return d in self._elements()
+        return self._in_range(d) and not (d - self._start) % self._fixed_step
+
+    def _wall_or_utc(self, d):
+        """Naive datetime of the range with tz that is converted to the aware datetime d, None if there is none."""
+        if not isinstance(d, datetime) or d.tzinfo is None:
+            return None
+        naive = self._naive(d)
+        if self._mode == 'wall':
+            # Nonexistent wall time of the range that was moved forward to d
+            moved = self._offsets().moved_from(naive)
+            if moved is not None and self._has(moved) and \
+                    (self._fixed_step is None or (moved - self._start) // self._fixed_step not in self._skipped()):
+                naive = moved
+            elif not self._has(naive):
+                return None
+            # Repeated wall times are in the range only the first time they occur
+            if self._offsets().from_wall(naive).utcoffset() != d.astimezone(self._tz).utcoffset():
+                return None
+            return naive
+        return naive if self._has(naive) else None
+
+    def index(self, d):
+        """Returns index of the date/datetime in the range. Raises ValueError if it is not present."""
+        if self._tz is not None:
+            naive = self._wall_or_utc(d)
+        else:
+            naive = d if self._has(d) else None
+        if naive is None:
+            raise ValueError('{} is not in drange'.format(d))
+
+        if self._business_step is not None:
+            return self._business_step._range_index(self._start, naive)
+        if self._fixed_step is None:
+            return self._elements().index(naive)
+        i = (naive - self._start) // self._fixed_step
+        if self._tz is not None:
+            return i - bisect_left(self._skipped(), i)
+        return i
+
+    def split(self, n):
+        """Splits range into list of n contiguous sub-ranges of (almost) equal length. Some can be empty.
+
+        Sub-ranges are computed by slicing, so ranges with fixed or business-day steps are not enumerated.
+        Dates of the ranges with calendar steps are generated once, as for any slice of such ranges.
+
+        Examples:
+            >>> drange(1/Jan/2020, 1/Jan/2021).split(3)
+            [drange(2020-01-01, 2020-05-02, BeautifulFixedDelta(days=+1)),
+             drange(2020-05-02, 2020-09-01, BeautifulFixedDelta(days=+1)),
+             drange(2020-09-01, 2021-01-01, BeautifulFixedDelta(days=+1))]
+        """
+        if n < 1:
+            raise ValueError('drange.split() number of parts must be positive, not {}'.format(n))
+        length = len(self)
+        return [self[i * length // n:(i + 1) * length // n] for i in range(n)]
+
+    def partitions(self, chunk_size):
+        """Lazily yields contiguous sub-ranges of chunk_size dates (the last one can be shorter)."""
+        if chunk_size < 1:
+            raise ValueError('drange.partitions() chunk size must be positive, not {}'.format(chunk_size))
+        for i in range(0, len(self), chunk_size):
+            yield self[i:i + chunk_size]
+
+    def parallel_map(self, fn, executor=None, ordered=True, chunk_size=1000, max_in_flight=None):
+        """Lazily yields fn applied to each date, computed in partitions of chunk_size dates by the executor.
+
+        executor is any concurrent.futures executor. If not given, ProcessPoolExecutor is created for the
+        duration of the iteration, so fn must be picklable (e.g. defined at the module level).
+        At most max_in_flight partitions (twice the number of CPUs by default) are submitted at a time,
+        so the memory used doesn't depend on the length of the range. If ordered is False, results of each
+        partition are yielded as soon as it is done.
+
+        Examples:
+            >>> with ThreadPoolExecutor() as executor:
+            ...     list(drange(1/Jan/2020, 6/Jan/2020).parallel_map(lambda d: d.weekday(), executor, chunk_size=2))
+            [2, 3, 4, 5, 6]
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if max_in_flight is None:
+            max_in_flight = 2 * (os.cpu_count() or 1)
+        if max_in_flight < 1:
+            raise ValueError('drange.parallel_map() max_in_flight must be positive, not {}'.format(max_in_flight))
+
+        partitions = self.partitions(chunk_size)
+        if executor is not None:
+            yield from _bounded_map(executor, fn, partitions, ordered, max_in_flight)
+        else:
+            with ProcessPoolExecutor() as executor:
+                yield from _bounded_map(executor, fn, partitions, ordered, max_in_flight)
+
+    def aligned(self, missed='coalesce', tolerance=timedelta(seconds=1), scheduler=None):
+        """Returns asynchronous iterator that yields each date/datetime of the range once the clock reaches it.
+
+        Dates/datetimes that are late by more than tolerance are all yielded ('all'), skipped ('skip')
+        or replaced by the latest of them ('coalesce'). All the aligned ranges of the event loop share
+        one Scheduler unless another one is given. See AlignedRange.
+
+        Examples:
+            >>> async for t in drange(D.now(), (D.today() + 1*days)[:], 15*minutes).aligned(missed='skip'):
+            ...     await run_job(t)
+        """
+        from beautiful_date.scheduling import AlignedRange
+
+        return AlignedRange(self, missed, tolerance, scheduler)
+
+    def bucketize(self, values):
+        """Lazily yields index of the interval of the range each of the dates/datetimes falls into.
+
+        The i-th interval is from r[i] (inclusive) to r[i + 1], values outside of the range get -1.
+        Ranges with fixed steps compute the index arithmetically, calendar steps search the precomputed
+        boundaries. Numpy arrays of datetime64 get numpy array of indexes. See Buckets.
+
+        Examples:
+            >>> list(drange(1/Jan/2020, 1/Jan/2021, 1*months).bucketize([16/Oct/2020, (29/Feb/2020)[23:59]]))
+            [9, 1]
+        """
+        from beautiful_date.bucketing import Buckets
+
+        return Buckets(self).indices(values)
+
+    def bucket_counts(self, values):
+        """Returns list with the number of dates/datetimes in each interval of the range. See bucketize()."""
+        from beautiful_date.bucketing import Buckets
+
+        return Buckets(self).counts(values)
+
+    def group_by(self, values):
+        """Returns dict of dates of the range to the lists of values in their intervals. See bucketize()."""
+        from beautiful_date.bucketing import Buckets
+
+        return Buckets(self).group_by(values)
+
+    def to_array(self, unit=None):
+        """Converts range to numpy array of datetime64 with given unit ('D', 's', 'us', ...).
+
+        Default unit is 'D' for ranges of dates and 'us' for ranges of datetimes. Ranges with fixed steps
+        and with steps of whole months/years are computed without creating date objects. Dates of the latter
+        are clamped to the end of the month the same way as when iterating over the range.
+
+        Examples:
+            >>> drange(31/Jan/2020, 1/Jun/2020, 1*months).to_array()
+            array(['2020-01-31', '2020-02-29', '2020-03-29', '2020-04-29', '2020-05-29'],
+                  dtype='datetime64[D]')
+
+        Requires numpy.
+        """
+        np = _numpy()
+
+        is_datetime = isinstance(self._start, datetime)
+        if self._tz is not None or is_datetime and self._start.tzinfo is not None:
+            raise ValueError('Timezone-aware drange can not be converted to datetime64')
+
+        base_unit = 'us' if is_datetime else 'D'
+        start = np.datetime64(self._start, base_unit)
+
+        months = _calendar_months(self._step)
+        if self._fixed_step is not None:
+            values = start + np.arange(len(self)) * np.timedelta64(self._fixed_step, base_unit)
+        elif months is not None:
+            values = self._months_array(np, start, months, base_unit)
+        else:
+            values = np.array(list(self), dtype='datetime64[{}]'.format(base_unit))
+
+        return values.astype('datetime64[{}]'.format(unit or base_unit))
+
+    to_numpy = to_array
+
+    def to_date_array(self):
+        """Converts range of dates to DateArray. Ranges with steps of whole days/weeks or months/years
+        are converted without creating date objects.
+
+        Examples:
+            >>> drange(31/Jan/2020, 1/Jun/2020, 1*months).to_date_array()
+            DateArray([2020-01-31, 2020-02-29, 2020-03-29, 2020-04-29, 2020-05-29])
+        """
+        from beautiful_date.date_array import DateArray
+
+        if self._tz is not None or isinstance(self._start, datetime):
+            raise TypeError('Only ranges of dates can be converted to DateArray')
+
+        start = self._start.toordinal()
+        if self._fixed_step is not None:
+            step = self._fixed_step.days
+            return DateArray.from_ordinals(range(start, start + len(self) * step, step))
+
+        months = _calendar_months(self._step)
+        if months is None or self._business_step is not None:
+            return DateArray(self)
+
+        # Same as walking the range: each date is the previous one moved by the step
+        shift = get_calendar_table().add_months_to_ordinal
+        ordinals = array('i')
+        current, stop = start, self._stop.toordinal()
+        while (stop < current <= start) if self._backwards else (start <= current < stop):
+            ordinals.append(current)
+            current = shift(current, months)
+        return DateArray.from_ordinals(ordinals)
+
+    def filter(self, predicate=None, weekday=None, month=None, day=None):
+        """Returns lazy DateStream of the dates that match all the given conditions. See DateStream.filter."""
+        return DateStream(self).filter(predicate, weekday=weekday, month=month, day=day)
+
+    def exclude(self, dates):
+        """Returns lazy DateStream of the dates that are not in the given dates (e.g. holidays)."""
+        return DateStream(self).exclude(dates)
+
+    def take(self, n):
+        """Returns lazy DateStream of the first n dates."""
+        return DateStream(self).take(n)
+
+    def every(self, n):
+        """Returns lazy DateStream of every n-th date starting from the first one."""
+        return DateStream(self).every(n)
+
+    def chunk(self, size):
+        """Returns lazy DateStream of tuples of size consecutive dates (the last one can be shorter)."""
+        return DateStream(self).chunk(size)
+
+    def map(self, fn):
+        """Returns lazy DateStream of fn applied to each date."""
+        return DateStream(self).map(fn)
+
+    def _months_array(self, np, start, months, base_unit):
+        stop = np.datetime64(self._stop, base_unit)
+        first_month = start.astype('datetime64[M]')
+        time_of_day = start - start.astype('datetime64[D]')
 
-        ret = self._start
-        self._start += self._step
-        return ret
+        # Upper bound of the number of dates in the range
+        n = abs(int((stop.astype('datetime64[M]') - first_month).astype(int))) // abs(months) + 2
+        month_starts = first_month + np.arange(n) * months
+        first_days = month_starts.astype('datetime64[D]')
+        month_lengths = ((month_starts + 1).astype('datetime64[D]') - first_days).astype(int)
+
+        # Once the day is clamped to the end of the shorter month, the following dates keep the smaller day
+        month_days = np.minimum(self._start.day, np.minimum.accumulate(month_lengths))
+        values = (first_days + (month_days - 1).astype('timedelta64[D]')).astype(start.dtype) + time_of_day
+
+        if months > 0:
+            return values[:np.searchsorted(values, stop, side='left')]
+        else:
+            return values[:n - np.searchsorted(values[::-1], stop, side='right')]
+
+
+def _map_partition(fn, r):
+    return [fn(d) for d in r]
+
+
+def _bounded_map(executor, fn, partitions, ordered, max_in_flight):
+    """Yields results of fn for each date of the partitions, keeping at most max_in_flight of them submitted."""
+    from concurrent.futures import FIRST_COMPLETED, as_completed, wait
+
+    pending = deque()
+    for partition in partitions:
+        if len(pending) == max_in_flight:
+            if ordered:
+                yield from pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield from future.result()
+        pending.append(executor.submit(_map_partition, fn, partition))
+
+    for future in pending if ordered else as_completed(pending):
+        yield from future.result()
+
+
+def _month_number(m):
+    """Returns number of the month given as Jan..Dec or int."""
+    return getattr(m, 'm', m)
+
+
+def _as_set(values, convert):
+    if not hasattr(values, '__iter__'):
+        values = (values,)
+    return frozenset(convert(v) for v in values)
+
+
+def _periodic(r, period, offsets):
+    """Yields dates of the fixed step range r at the given offsets within each period of indexes."""
+    start, step = r._start, r._fixed_step
+    for base in range(0, len(r), period):
+        for offset in offsets:
+            i = base + offset
+            if i >= len(r):
+                return
+            yield _beautify(start + i * step)
+
+
+def _matching_weekdays(r, weekdays):
+    """Dates of the fixed step range r that fall on the given weekdays without checking each of them.
+
+    Weekdays of the range repeat every period of indexes (7 for 1-day step, 1 for 1-week step,
+    168 for 1-hour step, ...), so only the first period is checked. Returns drange if the dates
+    that match are evenly spaced, otherwise a generator.
+    """
+    period = _WEEK_US // gcd(r._fixed_step // _MICROSECOND, _WEEK_US)
+    offsets = [i for i in range(min(period, len(r))) if r[i].weekday() in weekdays]
+    if len(offsets) == 1:
+        return r[offsets[0]::period]
+    if not offsets:
+        return r[:0]
+    return _periodic(r, period, offsets)
+
+
+def _select(iterator, predicate):
+    return (d for d in iterator if predicate(d))
+
+
+def _exclude(iterator, excluded):
+    for d in iterator:
+        if d in excluded or (isinstance(d, datetime) and d.date() in excluded):
+            continue
+        yield d
+
+
+def _chunk(iterator, size):
+    while True:
+        chunk = tuple(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+_STAGES = {
+    'weekday': lambda iterator, weekdays: _select(iterator, lambda d: d.weekday() in weekdays),
+    'filter': _select,
+    'exclude': _exclude,
+    'take': lambda iterator, n: islice(iterator, n),
+    'every': lambda iterator, n: islice(iterator, 0, None, n),
+    'chunk': _chunk,
+    'map': lambda iterator, fn: map(fn, iterator),
+}
+
+
+class DateStream:
+    """Lazy chain of operations over a drange (or any iterable of dates).
+
+    Operations are not applied until the stream is iterated, and the stream can be iterated multiple
+    times if its source can. Leading operations on a drange with fixed step are done arithmetically:
+    take() and every() slice the range, and filter(weekday=...) jumps straight to the matching dates
+    instead of checking each of them.
+
+    Examples:
+        >>> r = drange(1/Jan/2021, 1/Jan/2022)
+        >>> list(r.filter(weekday=MO, day=range(1, 8)).take(3))  # First Mondays of the months
+        [BeautifulDate(2021, 1, 4), BeautifulDate(2021, 2, 1), BeautifulDate(2021, 3, 1)]
+
+        >>> r.filter(weekday=[SA, SU], month=Feb).chunk(2).map(len)
+        DateStream(drange(2021-01-01, 2022-01-01, BeautifulFixedDelta(days=+1)), weekday, filter, chunk, map)
+    """
+
+    __slots__ = ('_source', '_ops')
+
+    def __init__(self, source, ops=()):
+        self._source = source
+        self._ops = ops
+
+    def __repr__(self):
+        return '{}({!r}{})'.format(self.__class__.__name__, self._source,
+                                   ''.join(', ' + kind for kind, _ in self._ops))
+
+    def _then(self, kind, arg):
+        return DateStream(self._source, self._ops + ((kind, arg),))
+
+    def filter(self, predicate=None, weekday=None, month=None, day=None):
+        """Keeps the dates for which predicate(d) is true and that fall on the given weekday, month and day.
+
+        Each of weekday (MO..SU or 0..6), month (Jan..Dec or 1..12) and day can be a single value
+        or a collection of values, e.g. filter(weekday=[SA, SU]) or filter(day=range(1, 8)).
+        """
+        stream = self
+        if weekday is not None:
+            stream = stream._then('weekday', _as_set(weekday, _weekday_number))
+
+        conditions = []
+        if month is not None:
+            months = _as_set(month, _month_number)
+            conditions.append(lambda d: d.month in months)
+        if day is not None:
+            days_ = _as_set(day, int)
+            conditions.append(lambda d: d.day in days_)
+        if predicate is not None:
+            conditions.append(predicate)
+
+        if len(conditions) == 1:
+            stream = stream._then('filter', conditions[0])
+        elif conditions:
+            stream = stream._then('filter', lambda d: all(condition(d) for condition in conditions))
+        return stream
+
+    def exclude(self, dates):
+        """Skips the given dates (e.g. holidays). Datetimes are skipped if their date is given."""
+        return self._then('exclude', frozenset(dates))
+
+    def take(self, n):
+        """Stops after n values."""
+        if n < 0:
+            raise ValueError('take() n must be non-negative, not {}'.format(n))
+        return self._then('take', n)
+
+    def every(self, n):
+        """Keeps every n-th value starting from the first one."""
+        if n < 1:
+            raise ValueError('every() n must be positive, not {}'.format(n))
+        return self._then('every', n)
+
+    def chunk(self, size):
+        """Groups consecutive values into tuples of given size (the last one can be shorter)."""
+        if size < 1:
+            raise ValueError('chunk() size must be positive, not {}'.format(size))
+        return self._then('chunk', size)
+
+    def map(self, fn):
+        """Applies fn to each value."""
+        return self._then('map', fn)
+
+    def _fused(self):
+        """Applies leading operations that can be done arithmetically. Returns new source and other operations."""
+        source, ops = self._source, self._ops
+        while ops and isinstance(source, drange) and source._fixed_step is not None:
+            kind, arg = ops[0]
+            if kind == 'take':
+                source = source[:arg]
+            elif kind == 'every':
+                source = source[::arg]
+            elif kind == 'weekday' and source._tz is None:
+                source = _matching_weekdays(source, arg)
+            else:
+                break
+            ops = ops[1:]
+        return source, ops
+
+    def __iter__(self):
+        source, ops = self._fused()
+        iterator = iter(source)
+        for kind, arg in ops:
+            iterator = _STAGES[kind](iterator, arg)
+        return iterator
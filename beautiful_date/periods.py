@@ -0,0 +1,255 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from heapq import merge
+
+from beautiful_date.beautiful_date import _ReadOnly
+
+
+class DatePeriod(_ReadOnly):
+    """Span of dates/datetimes from start (inclusive) to end (exclusive).
+
+    Created with operator ">>" between the dates or with period():
+        >>> (16/Oct/1995) >> (20/Oct/1995)
+        DatePeriod(1995-10-16, 1995-10-20)
+
+        >>> period(16/Oct/1995, 3*days)
+        DatePeriod(1995-10-16, 1995-10-19)
+
+        >>> 18/Oct/1995 in (16/Oct/1995) >> (20/Oct/1995)
+        True
+    """
+
+    __slots__ = ('start', 'end')
+
+    def __init__(self, start, end):
+        if end < start:
+            raise ValueError('Period end {} is before its start {}'.format(end, start))
+        object.__setattr__(self, 'start', start)
+        object.__setattr__(self, 'end', end)
+
+    def __repr__(self):
+        return '{}({}, {})'.format(self.__class__.__name__, self.start, self.end)
+
+    def __eq__(self, other):
+        if not isinstance(other, DatePeriod):
+            return NotImplemented
+        return self.start == other.start and self.end == other.end
+
+    def __hash__(self):
+        return hash((self.start, self.end))
+
+    def __bool__(self):
+        return self.start < self.end
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    def __contains__(self, d):
+        """Checks whether date/datetime is in the period or the other period lies within it."""
+        if isinstance(d, DatePeriod):
+            return self.start <= d.start and d.end <= self.end
+        return self.start <= d < self.end
+
+    def overlaps(self, other):
+        """Checks whether periods have common dates."""
+        return self.start < other.end and other.start < self.end
+
+    def __and__(self, other):
+        """Common part of the periods or None if they don't overlap."""
+        if not isinstance(other, DatePeriod):
+            return NotImplemented
+        if not self.overlaps(other):
+            return None
+        return DatePeriod(max(self.start, other.start), min(self.end, other.end))
+
+    intersection = __and__
+
+    def __or__(self, other):
+        if not isinstance(other, DatePeriod):
+            return NotImplemented
+        return IntervalSet([self, other])
+
+    union = __or__
+
+    def __sub__(self, other):
+        if not isinstance(other, DatePeriod):
+            return NotImplemented
+        return IntervalSet([self]) - IntervalSet([other])
+
+    difference = __sub__
+
+
+def period(start, end_or_delta):
+    """Creates DatePeriod from start to the end date/datetime or to start + delta."""
+    if isinstance(end_or_delta, date):
+        return DatePeriod(start, end_or_delta)
+    return DatePeriod(start, start + end_or_delta)
+
+
+def _bounds(p):
+    if isinstance(p, DatePeriod):
+        return p.start, p.end
+    start, end = p
+    return start, end
+
+
+def _merged(pairs):
+    """Merges overlapping and adjacent (start, end) pairs sorted by start into lists of starts and ends."""
+    starts, ends = [], []
+    for start, end in pairs:
+        if not start < end:
+            continue
+        if ends and start <= ends[-1]:
+            if end > ends[-1]:
+                ends[-1] = end
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+class IntervalSet:
+    """Set of dates/datetimes given as periods, stored as sorted lists of starts and ends of disjoint periods.
+
+    Overlapping and adjacent periods are merged once on creation. Membership and overlap checks take
+    O(log n) with binary search, union, intersection and difference take O(n + m) by merging sorted lists.
+
+    Examples:
+        >>> bookings = IntervalSet([(1/Jan/2024) >> (5/Jan/2024), (3/Jan/2024) >> (8/Jan/2024),
+        ...                         (10/Jan/2024, 12/Jan/2024)])
+        >>> bookings
+        IntervalSet([DatePeriod(2024-01-01, 2024-01-08), DatePeriod(2024-01-10, 2024-01-12)])
+
+        >>> 9/Jan/2024 in bookings
+        False
+
+        >>> bookings.gaps()
+        IntervalSet([DatePeriod(2024-01-08, 2024-01-10)])
+    """
+
+    __slots__ = ('_starts', '_ends')
+
+    def __init__(self, periods=()):
+        """Creates set from DatePeriods or (start, end) pairs in any order."""
+        self._starts, self._ends = _merged(sorted(map(_bounds, periods)))
+
+    @classmethod
+    def _from_lists(cls, starts, ends):
+        interval_set = cls.__new__(cls)
+        interval_set._starts, interval_set._ends = starts, ends
+        return interval_set
+
+    def __repr__(self):
+        return '{}([{}])'.format(self.__class__.__name__, ', '.join(map(repr, self)))
+
+    def __len__(self):
+        """Number of disjoint periods."""
+        return len(self._starts)
+
+    def __bool__(self):
+        return bool(self._starts)
+
+    def __iter__(self):
+        return map(DatePeriod, self._starts, self._ends)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return IntervalSet._from_lists(self._starts[i], self._ends[i])
+        return DatePeriod(self._starts[i], self._ends[i])
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    @property
+    def duration(self):
+        """Total duration of the periods."""
+        return sum((end - start for start, end in zip(self._starts, self._ends)), timedelta(0))
+
+    def __contains__(self, d):
+        """Checks whether date/datetime or the whole DatePeriod is in the set."""
+        if isinstance(d, DatePeriod):
+            if not d:
+                return False
+            i = bisect_right(self._starts, d.start) - 1
+            return i >= 0 and d.end <= self._ends[i]
+        i = bisect_right(self._starts, d) - 1
+        return i >= 0 and d < self._ends[i]
+
+    def _overlapping_indexes(self, p):
+        start, end = _bounds(p)
+        return bisect_right(self._ends, start), bisect_left(self._starts, end)
+
+    def overlaps(self, p):
+        """Checks whether the period has common dates with the set."""
+        first, stop = self._overlapping_indexes(p)
+        return first < stop
+
+    def overlapping(self, p):
+        """Returns list of the periods of the set that overlap with the given one."""
+        first, stop = self._overlapping_indexes(p)
+        return [DatePeriod(self._starts[i], self._ends[i]) for i in range(first, stop)]
+
+    def __or__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        pairs = merge(zip(self._starts, self._ends), zip(other._starts, other._ends))
+        return IntervalSet._from_lists(*_merged(pairs))
+
+    union = __or__
+
+    def __and__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            end = min(self._ends[i], other._ends[j])
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+            if self._ends[i] < other._ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_lists(starts, ends)
+
+    intersection = __and__
+
+    def __sub__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        starts, ends = [], []
+        j = 0
+        for start, end in zip(self._starts, self._ends):
+            # Periods of other that end before this one can't overlap with the following ones either
+            while j < len(other._starts) and other._ends[j] <= start:
+                j += 1
+            k = j
+            while k < len(other._starts) and other._starts[k] < end:
+                if other._starts[k] > start:
+                    starts.append(start)
+                    ends.append(other._starts[k])
+                start = max(start, other._ends[k])
+                k += 1
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+        return IntervalSet._from_lists(starts, ends)
+
+    difference = __sub__
+
+    def gaps(self, within=None):
+        """Returns IntervalSet of the periods between the periods of the set (within the given period)."""
+        starts, ends = self._ends[:-1], self._starts[1:]
+        gaps = IntervalSet._from_lists(starts, ends)
+        if within is None:
+            return gaps
+        start, end = _bounds(within)
+        if not self:
+            return IntervalSet([(start, end)])
+        edges = IntervalSet._from_lists(*_merged([(start, self._starts[0]), (self._ends[-1], end)]))
+        return (gaps | edges) & IntervalSet([(start, end)])
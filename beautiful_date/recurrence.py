@@ -0,0 +1,234 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from dateutil.relativedelta import weekday
+
+from beautiful_date import BeautifulDate, D
+from beautiful_date.beautiful_timedelta import BeautifulWeekday
+from beautiful_date.business_days import BusinessDelta
+from beautiful_date.date_range import _calendar_months, _fixed_timedelta
+
+_ONE_DAY = timedelta(days=1)
+
+# Number of months and days in the 400-year cycle of the Gregorian calendar
+_CYCLE_MONTHS = 400 * 12
+_CYCLE_DAYS = 146097
+
+
+def _as_date(d):
+    """Converts date/datetime to BeautifulDate."""
+    if isinstance(d, datetime) or type(d) is date:
+        return BeautifulDate(d.year, d.month, d.day)
+    return d
+
+
+def _selector(s):
+    """Converts MO(2) and other BeautifulWeekday to (hashable) dateutil weekday, leaves other selectors as they are."""
+    if isinstance(s, BeautifulWeekday):
+        return s.wd(s.n)
+    return s
+
+
+def _select(selector, period_start, period_end):
+    """Date the selector picks in the period [period_start, period_end).
+
+    Positive weekdays and business days are counted from the start of the period (TU(2) is the second Tuesday,
+    1*bdays is the first business day), negative ones - from its end (TU(-1) is the last Tuesday, -1*bdays
+    is the last business day). Other deltas (15*day, 2*weeks, ...) are added to the start of the period.
+    """
+    if isinstance(selector, weekday):
+        n = selector.n or 1
+        if n > 0:
+            start = period_start.toordinal()
+            return BeautifulDate.fromordinal(start + (selector.weekday - (start + 6) % 7) % 7 + (n - 1) * 7)
+        last = period_end.toordinal() - 1
+        return BeautifulDate.fromordinal(last - ((last + 6) % 7 - selector.weekday) % 7 - (-n - 1) * 7)
+
+    if isinstance(selector, BusinessDelta):
+        if selector.n > 0:
+            return selector.calendar.offset(period_start - _ONE_DAY, selector.n)
+        if selector.n < 0:
+            return selector.calendar.offset(period_end, selector.n)
+        return selector.calendar.offset(period_start, 0)
+
+    return _as_date(period_start + selector)
+
+
+def _period_bounds(months, days, origin, k):
+    """Start (inclusive) and end (exclusive) dates of the k-th period of the rule."""
+    if months is not None:
+        first = origin + k * months
+        y, m = divmod(first, 12)
+        ny, nm = divmod(first + months, 12)
+        return BeautifulDate(y, m + 1, 1), BeautifulDate(ny, nm + 1, 1)
+    first = origin + k * days
+    return BeautifulDate.fromordinal(first), BeautifulDate.fromordinal(first + days)
+
+
+@lru_cache(maxsize=4096)
+def _expansion(key, k):
+    """Occurrences in the k-th period of the rule with the given key (see Recurrence). Keyed by the values
+    of the rule rather than by the rule, so that equal rules share them and the cache doesn't keep
+    the rules alive. Least recently used are evicted."""
+    months, days, origin, rule_start, selectors = key
+    start, end = _period_bounds(months, days, origin, k)
+    if not selectors:
+        occurrences = {start}
+    else:
+        occurrences = {d for d in (_select(s, start, end) for s in selectors) if start <= d < end}
+    if rule_start is not None:
+        occurrences = {d for d in occurrences if d >= rule_start}
+    return tuple(sorted(occurrences))
+
+
+class Recurrence:
+    """Dates that repeat every period (whole days/weeks or months/years) on the given days of the period.
+
+    Periods are numbered arithmetically, so next_after() and between() go straight to the periods that contain
+    the given dates instead of walking from the start. Occurrences of each period are computed once
+    and cached for all the equal rules.
+
+    Created with every():
+        >>> second_tuesdays = every(1*months).on(TU(2))
+        >>> second_tuesdays.next_after(16/Oct/1995)
+        BeautifulDate(1995, 11, 14)
+
+        >>> every(3*months).on(-1*bdays).between(1/Jan/2024, 1/Jan/2025)  # Last business days of quarters
+        [BeautifulDate(2024, 3, 29), BeautifulDate(2024, 6, 28), BeautifulDate(2024, 9, 30),
+         BeautifulDate(2024, 12, 31)]
+
+        >>> every(2*weeks, start=1/Jan/2024).on(MO, FR)
+        every(BeautifulFixedDelta(days=+14), start=2024-01-01).on(MO, FR)
+    """
+
+    __slots__ = ('step', 'start', 'selectors', '_selectors', '_months', '_days', '_origin', '_key')
+
+    def __init__(self, step, start=None, selectors=()):
+        self.step = step
+        self.start = _as_date(start) if start is not None else None
+        self.selectors = tuple(selectors)
+        self._selectors = tuple(_selector(s) for s in selectors)
+
+        self._months = _calendar_months(step)
+        fixed = _fixed_timedelta(step, date.min) if self._months is None else None
+        self._days = fixed.days if fixed is not None else None
+        if self._months is None and self._days is None:
+            raise ValueError('Recurrence step must be whole days/weeks or months/years, not {!r}'.format(step))
+        if (self._months or self._days) <= 0:
+            raise ValueError('Recurrence step must be positive, not {!r}'.format(step))
+
+        # Periods are aligned to the start of the rule, or to the 1st of January of year 1 (Monday)
+        if self._months is not None:
+            self._origin = self.start.year * 12 + self.start.month - 1 if self.start is not None else 12
+        else:
+            self._origin = self.start.toordinal() if self.start is not None else 1
+
+        # Values that define the occurrences, compared by __eq__ and used as the key of the cached expansions
+        self._key = (self._months, self._days, self._origin, self.start, self._selectors)
+
+    def __repr__(self):
+        start = ', start={}'.format(self.start) if self.start is not None else ''
+        on = '.on({})'.format(', '.join(map(repr, self.selectors))) if self.selectors else ''
+        return 'every({!r}{}){}'.format(self.step, start, on)
+
+    def __eq__(self, other):
+        if not isinstance(other, Recurrence):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def on(self, *selectors):
+        """Returns rule with occurrences on the given days of each period instead of its first day.
+
+        Selectors are weekdays (MO, TU(2), FR(-1), ...), business days (1*bdays, -1*bdays, ...) or deltas
+        added to the start of the period (15*day, 2*days, ...). Days that fall outside the period are skipped.
+        """
+        return Recurrence(self.step, self.start, self.selectors + selectors)
+
+    def _period(self, d):
+        """Number of the period that contains the date."""
+        if self._months is not None:
+            return (d.year * 12 + d.month - 1 - self._origin) // self._months
+        return (d.toordinal() - self._origin) // self._days
+
+    def _periods_from(self, d):
+        """Yields occurrences of the periods from the one that contains d. Stops after 400 years without them."""
+        if self.start is not None and d < self.start:
+            d = self.start
+        k = self._period(d)
+        limit = (_CYCLE_MONTHS // self._months if self._months is not None else _CYCLE_DAYS // self._days) + 1
+        empty = 0
+        while empty <= limit:
+            occurrences = _expansion(self._key, k)
+            empty = 0 if occurrences else empty + 1
+            yield occurrences
+            k += 1
+
+    def after(self, d):
+        """Lazily yields occurrences after the date."""
+        d = _as_date(d)
+        for occurrences in self._periods_from(d):
+            yield from occurrences[bisect_right(occurrences, d):]
+
+    def __iter__(self):
+        """Lazily yields occurrences from the start of the rule (from today if it has no start)."""
+        first = self.start if self.start is not None else D.today()
+        return self.after(first - _ONE_DAY)
+
+    def next_after(self, d):
+        """Returns the first occurrence after the date or None if there are no more occurrences."""
+        return next(self.after(d), None)
+
+    def next_after_many(self, dates):
+        """Returns list of the first occurrences after each of the dates.
+
+        Dates are looked up in ascending order. Occurrences of the periods are kept while the following dates
+        fall into them or into the next period, so dates close to each other are found by bisection
+        without going through the periods again.
+        """
+        dates = [_as_date(d) for d in dates]
+        result = [None] * len(dates)
+        periods, last, loaded = None, None, []
+        for i in sorted(range(len(dates)), key=dates.__getitem__):
+            d = dates[i]
+            j = bisect_right(loaded, d)
+            if j == len(loaded):
+                first = self._period(d if self.start is None or d >= self.start else self.start)
+                if periods is None or first > last + 1:
+                    # Far from the loaded periods, the following ones are generated from the period of d
+                    periods, last, loaded = self._periods_from(d), first - 1, []
+                    j = 0
+                while j == len(loaded):
+                    occurrences = next(periods, None)
+                    if occurrences is None:
+                        # No more occurrences after d, so there are none after the following dates either
+                        return result
+                    last += 1
+                    loaded.extend(occurrences)
+                    j = bisect_right(loaded, d)
+            result[i] = loaded[j]
+        return result
+
+    def between(self, start, end):
+        """Returns list of the occurrences from start (inclusive) to end (exclusive)."""
+        start, end = _as_date(start), _as_date(end)
+        result = []
+        if end <= start:
+            return result
+        last = self._period(end)
+        for k in range(self._period(max(start, self.start or start)), last + 1):
+            occurrences = _expansion(self._key, k)
+            result.extend(occurrences[bisect_left(occurrences, start):bisect_left(occurrences, end)])
+        return result
+
+
+def every(step, start=None):
+    """Creates Recurrence that repeats every step (1*months, 2*weeks, 3*days, ...) from start.
+
+    Periods of months/years start on the 1st day of the month, periods of days/weeks - on the start date
+    (or on Monday if the start isn't given).
+    """
+    return Recurrence(step, start)
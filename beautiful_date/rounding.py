@@ -0,0 +1,221 @@
+from array import array
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from beautiful_date.beautiful_date import BeautifulDate, BeautifulDatetime, _numpy
+from beautiful_date.beautiful_timedelta import _weekday_number
+from beautiful_date.calendar_table import add_months
+from beautiful_date.date_array import DateArray, _EPOCH_ORDINAL
+from beautiful_date.date_range import _calendar_months, _fixed_timedelta, _month_number
+
+# Fixed units are counted from the start of 1/Jan/1, which is a Monday
+_ORIGIN = datetime(1, 1, 1)
+_ONE_DAY = timedelta(days=1)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86400 * 10 ** 6
+# Microseconds from 1/Jan/1 to the epoch of numpy datetime64
+_EPOCH_US = (_EPOCH_ORDINAL - 1) * _DAY_US
+
+
+class _Rounding:
+    """Unit (and start of the periods) folded once into the values floor/ceil/round need."""
+
+    __slots__ = ('unit', 'months', 'month_shift', 'fixed', 'days', 'origin', 'weekday')
+
+    def __init__(self, unit, start=None):
+        self.unit = unit
+        self.months = _calendar_months(unit)
+        self.fixed = _fixed_timedelta(unit, _ORIGIN) if self.months is None else None
+        self.month_shift, self.days, self.origin, self.weekday = 0, None, None, 0
+
+        if self.months is not None:
+            if self.months <= 0:
+                raise ValueError('Unit to round to must be positive, not {!r}'.format(unit))
+            month = 1 if start is None else _month_number(start)
+            if month not in range(1, 13):
+                raise ValueError('Periods of months must start with a month (Jan..Dec or 1..12), not {!r}'.format(
+                    start))
+            self.month_shift = month - 1
+        elif self.fixed is not None:
+            if self.fixed <= timedelta(0):
+                raise ValueError('Unit to round to must be positive, not {!r}'.format(unit))
+            self.weekday = 0 if start is None else _weekday_number(start)
+            if self.weekday not in range(7):
+                raise ValueError('Periods of fixed length must start on a weekday (MO..SU or 0..6), not {!r}'.format(
+                    start))
+            self.origin = _ORIGIN + self.weekday * _ONE_DAY
+            self.days = self.fixed.days if not self.fixed % _ONE_DAY else None
+        else:
+            raise ValueError('Can only round to years/months or units of fixed length (weeks, days, hours, ...), '
+                             'not {!r}'.format(unit))
+
+    def _prepared(self, d):
+        """Dates rounded to the units shorter than a day are taken as midnight."""
+        if self.months is None and self.days is None and not isinstance(d, datetime):
+            return BeautifulDatetime(d.year, d.month, d.day)
+        return d
+
+    def _floor(self, d):
+        if self.months is not None:
+            n = d.year * 12 + d.month - 1 - self.month_shift
+            y, m = divmod(n - n % self.months + self.month_shift, 12)
+            if isinstance(d, datetime):
+                return d.replace(y, m + 1, 1, 0, 0, 0, 0)
+            return d.replace(y, m + 1, 1)
+
+        if self.days is not None and not isinstance(d, datetime):
+            ordinal = d.toordinal()
+            return d - timedelta(days=(ordinal - 1 - self.weekday) % self.days)
+
+        # Aware datetimes are rounded by their wall time
+        naive = d.replace(tzinfo=None) if d.tzinfo is not None else d
+        return d - (naive - self.origin) % self.fixed
+
+    def _next(self, floor):
+        if self.months is not None:
+            return add_months(floor, self.months)
+        return floor + self.fixed
+
+    def floor(self, d):
+        return _beautify(self._floor(self._prepared(d)))
+
+    def ceil(self, d):
+        d = self._prepared(d)
+        floor = self._floor(d)
+        return _beautify(floor if floor == d else self._next(floor))
+
+    def round(self, d):
+        d = self._prepared(d)
+        floor = self._floor(d)
+        if floor == d:
+            return _beautify(floor)
+        ceil = self._next(floor)
+        # Halfway values are rounded up
+        return _beautify(ceil if d - floor >= ceil - d else floor)
+
+    def ordinals(self, ordinals, method):
+        """Rounds dates given as ordinals to units of whole days."""
+        n, base = self.days, 1 + self.weekday
+        if method == 'floor':
+            return array('i', [o - (o - base) % n for o in ordinals])
+        if method == 'ceil':
+            return array('i', [o + (base - o) % n for o in ordinals])
+        half = (n + 1) // 2
+        return array('i', [o - r + n if r >= half else o - r for o, r in ((o, (o - base) % n) for o in ordinals)])
+
+    def datetime64(self, values, method):
+        """Rounds numpy array of datetime64 without Python loops."""
+        np = _numpy()
+
+        if self.months is not None:
+            target = np.result_type(values.dtype, np.dtype('datetime64[D]'))
+            n = values.astype('datetime64[M]').astype(np.int64) + 1970 * 12 - self.month_shift
+            floor = n - n % self.months + self.month_shift - 1970 * 12
+            floor, ceil = (m.astype('datetime64[M]').astype(target) for m in (floor, floor + self.months))
+        else:
+            target = np.result_type(values.dtype, np.dtype('datetime64[D]' if self.days else 'datetime64[us]'))
+            unit = self.fixed // _MICROSECOND
+            us = values.astype('datetime64[us]').astype(np.int64)
+            floor = us - (us + _EPOCH_US - self.weekday * _DAY_US) % unit
+            floor, ceil = (t.astype('datetime64[us]').astype(target) for t in (floor, floor + unit))
+
+        values = values.astype(target)
+        if method == 'floor':
+            result = floor
+        elif method == 'ceil':
+            result = np.where(floor == values, floor, ceil)
+        else:
+            result = np.where(values - floor >= ceil - values, ceil, floor)
+            result = np.where(floor == values, floor, result)
+        return np.where(np.isnat(values), values, result)
+
+
+def _beautify(d):
+    if type(d) is date:
+        return BeautifulDate(d.year, d.month, d.day)
+    return d
+
+
+@lru_cache(maxsize=256)
+def _rounding(unit, start=None):
+    return _Rounding(unit, start)
+
+
+def floor(d, unit, start=None):
+    """Rounds date/datetime down to the start of the period of the unit it falls into.
+
+    Periods of years/months are counted from January (or start month, e.g. start=Apr for fiscal quarters).
+    Periods of fixed length (weeks, days, hours, ...) are counted from Monday, 1/Jan/1 (or the first start
+    weekday), so they are aligned to midnight if a day is divisible by them, and weeks start on Monday.
+    Dates rounded to units shorter than a day are taken as midnight. Aware datetimes are rounded
+    by their wall time. Same as d // unit.
+
+    Examples:
+        >>> floor((16/Oct/1995)[23:14:10], 15*minutes)
+        BeautifulDatetime(1995, 10, 16, 23, 0)
+
+        >>> floor(16/Oct/1995, 3*months)
+        BeautifulDate(1995, 10, 1)
+
+        >>> floor(16/Oct/1995, 1*weeks, start=SU)
+        BeautifulDate(1995, 10, 15)
+    """
+    return _rounding(unit, start).floor(d)
+
+
+def ceil(d, unit, start=None):
+    """Rounds date/datetime up to the start of the next period of the unit, unless it is the start of one.
+    See floor().
+
+    Examples:
+        >>> ceil((16/Oct/1995)[23:14:10], 15*minutes)
+        BeautifulDatetime(1995, 10, 16, 23, 15)
+
+        >>> ceil(17/Oct/1995, 1*weeks, start=MO)
+        BeautifulDate(1995, 10, 23)
+    """
+    return _rounding(unit, start).ceil(d)
+
+
+def round(d, unit, start=None):  # noqa: A001
+    """Rounds date/datetime to the nearest start of the period of the unit (halfway values are rounded up).
+    See floor(). BeautifulDate and BeautifulDatetime support built-in round() as well.
+
+    Examples:
+        >>> round((16/Oct/1995)[23:14:10], 1*hours)
+        BeautifulDatetime(1995, 10, 16, 23, 0)
+    """
+    return _rounding(unit, start).round(d)
+
+
+def _many(values, unit, start, method):
+    rounding = _rounding(unit, start)
+    if getattr(getattr(values, 'dtype', None), 'kind', None) == 'M':
+        return rounding.datetime64(values, method)
+    if isinstance(values, DateArray):
+        if rounding.months is None and rounding.days is None:
+            raise TypeError('DateArray can only be rounded to whole days, months or years, not {!r}'.format(unit))
+        if rounding.days is not None:
+            return DateArray.from_ordinals(rounding.ordinals(values.ordinals, method))
+        return DateArray(map(getattr(rounding, method), values))
+    fn = getattr(rounding, method)
+    return [fn(d) for d in values]
+
+
+def floor_many(values, unit, start=None):
+    """Applies floor() to each of the values. Returns list, or DateArray/numpy array for DateArray/datetime64 array.
+
+    DateArray can be rounded to whole days, months or years. Numpy arrays and DateArray rounded to whole days
+    are rounded without creating date objects.
+    """
+    return _many(values, unit, start, 'floor')
+
+
+def ceil_many(values, unit, start=None):
+    """Applies ceil() to each of the values. See floor_many()."""
+    return _many(values, unit, start, 'ceil')
+
+
+def round_many(values, unit, start=None):
+    """Applies round() to each of the values. See floor_many()."""
+    return _many(values, unit, start, 'round')
@@ -0,0 +1,179 @@
+import asyncio
+from datetime import datetime, timedelta
+from heapq import heappop, heappush
+from itertools import count
+from weakref import WeakKeyDictionary
+
+from beautiful_date.clock import get_clock
+
+_MISSED = ('all', 'skip', 'coalesce')
+
+_schedulers = WeakKeyDictionary()
+
+
+def _timestamp(t):
+    """POSIX timestamp of date/datetime. Dates and naive datetimes are taken as local time, as by the clocks."""
+    if not isinstance(t, datetime):
+        t = datetime(t.year, t.month, t.day)
+    return t.timestamp()
+
+
+class Scheduler:
+    """Wakes up coroutines at the given dates/datetimes of the clock using one timer for all of them.
+
+    Deadlines of all the waiting coroutines are kept in a heap and only the earliest one has a timer
+    in the event loop. Time left is read from the clock each time the timer is set, and once it goes off
+    the clock is checked again, so the drift of the event loop doesn't accumulate.
+
+    If clock is not given, the clock of the current context is used (see use_clock()). With a fake clock
+    (e.g. FrozenClock) call wake() after moving it.
+
+    Examples:
+        >>> scheduler = Scheduler()
+        >>> await scheduler.wait_until(D.now() + 1*seconds)
+    """
+
+    # The event loop isn't stored, so the scheduler shared by the loop doesn't keep it alive
+    __slots__ = ('clock', '_heap', '_counter', '_timer', '_deadline')
+
+    def __init__(self, clock=None):
+        self.clock = clock
+        self._heap = []
+        self._counter = count()
+        self._timer = None
+        self._deadline = None
+
+    def __repr__(self):
+        return '{}(clock={!r}, waiting={})'.format(self.__class__.__name__, self.clock, self.waiting)
+
+    @property
+    def waiting(self):
+        """Number of coroutines that are waiting for their date/datetime."""
+        return sum(1 for _, _, future in self._heap if not future.done())
+
+    def now(self):
+        """Current POSIX timestamp of the clock."""
+        clock = self.clock if self.clock is not None else get_clock()
+        return clock.now().timestamp()
+
+    def wait_until(self, t):
+        """Returns future that is done once the clock reaches date/datetime t."""
+        future = asyncio.get_running_loop().create_future()
+        deadline = _timestamp(t)
+        if deadline <= self.now():
+            future.set_result(None)
+            return future
+
+        heappush(self._heap, (deadline, next(self._counter), future))
+        future.add_done_callback(self._cancelled)
+        if self._deadline is None or deadline < self._deadline:
+            self._arm()
+        return future
+
+    def wake(self):
+        """Re-reads the clock and releases the coroutines whose time has come."""
+        now = self.now()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            future = heappop(heap)[2]
+            if not future.done():
+                future.set_result(None)
+        self._arm()
+
+    def _cancelled(self, future):
+        # Timer of the cancelled coroutine would keep the event loop alive after it is closed
+        if future.cancelled() and self._heap and self._heap[0][2] is future:
+            self._arm()
+
+    def _arm(self):
+        """Sets the timer for the earliest deadline of the coroutines that are still waiting."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = self._deadline = None
+
+        heap = self._heap
+        while heap and heap[0][2].done():
+            # Waiting coroutine was cancelled
+            heappop(heap)
+        if not heap:
+            return
+
+        self._deadline = heap[0][0]
+        loop = heap[0][2].get_loop()
+        self._timer = loop.call_later(max(0, self._deadline - self.now()), self.wake)
+
+
+def _loop_scheduler():
+    """Scheduler shared by all the aligned ranges of the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = Scheduler()
+    return scheduler
+
+
+class AlignedRange:
+    """Asynchronous iterator over the dates/datetimes of drange that yields each of them once it arrives.
+
+    Dates and datetimes that are late by more than tolerance (after the event loop was blocked
+    or the clock jumped) are handled according to missed:
+        'all' - all of them are yielded at once,
+        'skip' - they are skipped, the iteration continues with the first one that didn't arrive yet,
+        'coalesce' - only the latest of them is yielded.
+
+    Created with drange.aligned():
+        >>> async for t in drange(D.now(), (D.today() + 1*days)[:], 15*minutes).aligned():
+        ...     await run_job(t)
+    """
+
+    __slots__ = ('range', 'missed', 'tolerance', 'scheduler', '_i', '_n')
+
+    def __init__(self, r, missed='coalesce', tolerance=timedelta(seconds=1), scheduler=None):
+        if missed not in _MISSED:
+            raise ValueError("missed must be one of 'all', 'skip' or 'coalesce', not {!r}".format(missed))
+        if r._backwards:
+            raise ValueError('Only ranges that go forward in time can be aligned to the clock')
+        self.range = r
+        self.missed = missed
+        self.tolerance = tolerance.total_seconds() if hasattr(tolerance, 'total_seconds') else tolerance
+        self.scheduler = scheduler
+        self._i = 0
+        self._n = None
+
+    def __repr__(self):
+        return '{}({!r}, missed={!r})'.format(self.__class__.__name__, self.range, self.missed)
+
+    def __aiter__(self):
+        return self
+
+    def _first_after(self, now):
+        """Index of the first date/datetime of the range after the timestamp, found by binary search."""
+        low, high = self._i, self._n
+        while low < high:
+            middle = (low + high) // 2
+            if _timestamp(self.range[middle]) <= now:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    async def __anext__(self):
+        if self._n is None:
+            self._n = len(self.range)
+        if self.scheduler is None:
+            self.scheduler = _loop_scheduler()
+        # The clock is checked again after waiting, as the loop could be blocked past the following dates
+        while self._i < self._n:
+            t = self.range[self._i]
+            now = self.scheduler.now()
+            if self.missed != 'all' and now - _timestamp(t) > self.tolerance:
+                following = self._first_after(now)
+                self._i = following
+                if self.missed == 'coalesce':
+                    return self.range[following - 1]
+            elif _timestamp(t) <= now:
+                self._i += 1
+                return t
+            else:
+                await self.scheduler.wait_until(t)
+        raise StopAsyncIteration
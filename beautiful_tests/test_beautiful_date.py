@@ -1,6 +1,43 @@
+import pickle
+import tracemalloc
 import unittest
-from datetime import date, datetime
-from beautiful_date import D, MDY, M, Jan, Feb, May, Oct, Jun, BeautifulDate
+from array import array
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from beautiful_date import D, MDY, M, Jan, Feb, May, Oct, Jun, BeautifulDate, BeautifulDatetime, InvalidDatesError, \
+    DatePeriod, days, hours, months
+from beautiful_date.beautiful_date import YMD, _Day, _PartialDate
+from beautiful_date.beautiful_timedelta import BeautifulWeekday, MO
+
+
+def allocated_per_object(factory, n=10000):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(n)]  # noqa: F841
+    size = (tracemalloc.get_traced_memory()[0] - before) / n
+    tracemalloc.stop()
+    return size
+
+
+class _DictDay:
+    """_Day before __slots__ were added, used for memory comparison."""
+
+    def __init__(self, d, m):
+        self.d = d
+        self.m = m
+
+
+class _DictPartialDate:
+    """_PartialDate before __slots__ were added, used for memory comparison."""
+
+    def __init__(self, first, _format):
+        self._date_values = [first]
+        self._format = _format
 
 
 class TestBeautifulDate(unittest.TestCase):
@@ -41,6 +78,42 @@ class TestBeautifulDate(unittest.TestCase):
         self.assertEqual((D @ 29 - 2 - 1988)[10:11:12],
                          datetime(day=29, month=2, year=1988, hour=10, minute=11, second=12))
 
+    def test_datetime_create_with_tzinfo(self):
+        tz = timezone(timedelta(hours=2))
+        self.assertEqual((16 / Oct / 1995)[23:14, tz], datetime(1995, 10, 16, 23, 14, tzinfo=tz))
+        self.assertEqual((16 / Oct / 1995)[23, tz].tzinfo, tz)
+        self.assertEqual((16 / Oct / 1995)[:, timezone.utc], datetime(1995, 10, 16, tzinfo=timezone.utc))
+        with self.assertRaises(TypeError):
+            _ = (16 / Oct / 1995)[23, tz, 5]
+        with self.assertRaises(TypeError):
+            _ = (16 / Oct / 1995)[23, 0, tz, 5]
+
+    def test_datetime_create_with_microseconds(self):
+        tz = timezone(timedelta(hours=2))
+        self.assertEqual((16 / Oct / 1995)[23:14:10, 500], datetime(1995, 10, 16, 23, 14, 10, 500))
+        self.assertEqual((16 / Oct / 1995)[23:14:10, 500, tz], datetime(1995, 10, 16, 23, 14, 10, 500, tz))
+        self.assertEqual((16 / Oct / 1995)[23, None], datetime(1995, 10, 16, 23))
+        with self.assertRaises(ValueError):
+            _ = (16 / Oct / 1995)[23, 1000000]
+
+    def test_beautiful_datetime(self):
+        t = (16 / Oct / 1995)[23:14:10, 500]
+        self.assertIs(type(t), BeautifulDatetime)
+        self.assertEqual(repr(t), 'BeautifulDatetime(1995, 10, 16, 23, 14, 10, 500)')
+        for delta in (5 * days, 1 * hours, 1 * months, MO(2), timedelta(minutes=1), 1 * months + 1 * hours):
+            self.assertIs(type(t + delta), BeautifulDatetime)
+            self.assertIs(type(t - delta), BeautifulDatetime)
+            self.assertEqual(t + delta, t.to_datetime() + delta)
+            self.assertEqual(t - delta, t.to_datetime() - delta)
+        self.assertIs(type(5 * days + t), BeautifulDatetime)
+        self.assertIs(type(1 * months + t), BeautifulDatetime)
+        self.assertEqual(t - (15 / Oct / 1995)[23:14:10, 500], timedelta(days=1))
+        self.assertIs(type((16 / Oct / 1995) + 1 * hours), BeautifulDatetime)
+
+        self.assertIs(type(t.date()), BeautifulDate)
+        self.assertIs(type(t.to_datetime()), datetime)
+        self.assertIsInstance(t >> t + 1 * hours, DatePeriod)
+
     def test_today_now_tomorrow_yesterday(self):
         self.assertIsInstance(D.today(), BeautifulDate)
         self.assertIsInstance(D.now(), datetime)
@@ -62,3 +135,150 @@ class TestBeautifulDate(unittest.TestCase):
 
         self.assertEqual(repr(D), "DMY('day', 'month', 'year')")
         self.assertEqual(repr(MDY()), "MDY('month', 'day', 'year')")
+
+    def test_from_columns(self):
+        dates = D.from_columns([16, 29, 1], [10, 2, 1], [1995, 2000, 1])
+        self.assertEqual(dates, [date(1995, 10, 16), date(2000, 2, 29), date(1, 1, 1)])
+        self.assertIsInstance(dates[0], BeautifulDate)
+
+        self.assertEqual(MDY.from_columns(array('i', [10, 2]), array('i', [16, 29]), array('i', [1995, 2000])),
+                         [date(1995, 10, 16), date(2000, 2, 29)])
+        self.assertEqual(YMD.from_arrays([1995], [10], [16]), [date(1995, 10, 16)])
+        self.assertEqual(D.from_columns([], [], []), [])
+
+        with self.assertRaises(ValueError):
+            D.from_columns([1, 2], [1], [2000])
+        with self.assertRaises(TypeError):
+            D.from_columns([1], [1])
+
+    def test_from_columns_errors(self):
+        with self.assertRaises(InvalidDatesError) as cm:
+            D.from_columns([31, 1, 29, 5, 0], [2, 1, 2, 13, 5], [2000, 2000, 2001, 2000, 2000])
+
+        self.assertEqual([(i, values) for i, values, _ in cm.exception.errors],
+                         [(0, (2000, 2, 31)), (2, (2001, 2, 29)), (3, (2000, 13, 5)), (4, (2000, 5, 0))])
+        self.assertIsInstance(cm.exception, ValueError)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_from_columns_numpy(self):
+        days = np.array([16, 29, 31])
+        months = np.array([10, 2, 12])
+        years = np.array([1995, 2000, 9999])
+
+        dates = D.from_columns(days, months, years)
+        self.assertEqual(dates, [date(1995, 10, 16), date(2000, 2, 29), date(9999, 12, 31)])
+
+        array64 = D.from_columns(days, months, years, dtype='datetime64[D]')
+        self.assertEqual(array64.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(array64.tolist(), dates)
+        self.assertEqual(D.from_columns(days, months, years, dtype='datetime64[s]').dtype, np.dtype('datetime64[s]'))
+
+        with self.assertRaises(InvalidDatesError) as cm:
+            D.from_columns(np.array([31, 1, 29, 5]), [2, 1, 2, 13], [2000, 2000, 2001, 2000], dtype='datetime64[D]')
+        self.assertEqual([i for i, _, _ in cm.exception.errors], [0, 2, 3])
+
+    def test_parse(self):
+        self.assertEqual(D.parse('16/10/1995'), date(1995, 10, 16))
+        self.assertIsInstance(D.parse('16-10-1995'), BeautifulDate)
+        self.assertEqual(MDY.parse('10.16.1995'), date(1995, 10, 16))
+        self.assertEqual(YMD.parse('1995-10-16'), date(1995, 10, 16))
+        self.assertIsInstance(YMD.parse('1995-10-16', '%Y-%m-%d'), BeautifulDate)
+        self.assertEqual(MDY.parse('Oct 16, 1995', '%b %d, %Y'), date(1995, 10, 16))
+        self.assertEqual(D.parse(' 16 october 95 ', '%d %B %y'), date(1995, 10, 16))
+        self.assertEqual(D.parse('01.02.03', '%d.%m.%y'), date(2003, 2, 1))
+        self.assertEqual(D.parse('100% 16/10/1995', '100%% %d/%m/%Y'), date(1995, 10, 16))
+
+        for string, pattern in [('16/10', None), ('16/13/1995', None), ('16/10/1995', '%Y-%m-%d'),
+                                ('16 Okt 1995', '%d %b %Y'), ('1995-02-30', '%Y-%m-%d')]:
+            with self.assertRaises(ValueError):
+                D.parse(string, pattern)
+        with self.assertRaises(ValueError):
+            D.parse('16/10', '%d/%m')
+        with self.assertRaises(ValueError):
+            D.parse('16/10/1995 10', '%d/%m/%Y %H')
+        with self.assertRaises(TypeError):
+            D.parse(19951016)
+
+    def test_parse_many(self):
+        strings = ['1995-10-16', '2000-02-30', 'x', '2000-02-29']
+        self.assertEqual(YMD.parse_many(strings, errors='coerce'), [date(1995, 10, 16), None, None, date(2000, 2, 29)])
+        with self.assertRaises(InvalidDatesError) as cm:
+            YMD.parse_many(iter(strings))
+        self.assertEqual([(i, s) for i, s, _ in cm.exception.errors], [(1, '2000-02-30'), (2, 'x')])
+        self.assertEqual(D.parse_many(['16/10/1995', '29/2/2000'], '%d/%m/%Y'), [16 / Oct / 1995, 29 / Feb / 2000])
+        with self.assertRaises(ValueError):
+            D.parse_many([], errors='ignore')
+
+    def test_format(self):
+        d = 16 / Oct / 1995
+        self.assertEqual(d.format('%d %b %Y'), '16 Oct 1995')
+        self.assertEqual(d.format('%A, %B %d %y (%j) {x} %%'), 'Monday, October 16 95 (289) {x} %')
+        self.assertEqual(d.format('%d/%m/%Y %U'), d.strftime('%d/%m/%Y %U'))
+        self.assertEqual(d.format('%'), d.strftime('%'))
+        self.assertEqual((1 / Jan / 5).format('%Y %y %j %a'), '0005 05 001 Sat')
+        self.assertEqual('{:%d.%m.%Y}'.format(d), '16.10.1995')
+        self.assertEqual('{}'.format(d), '1995-10-16')
+
+    def test_partial_date_reuse(self):
+        partial = D @ 1
+        self.assertEqual(partial / 2 / 2000, date(2000, 2, 1))
+        self.assertEqual(partial / 3 / 2000, date(2000, 3, 1))
+
+        partial = D @ 1 / 2
+        self.assertEqual(partial / 2000, date(2000, 2, 1))
+        self.assertEqual(partial - 2001, date(2001, 2, 1))
+
+        self.assertEqual(repr(D @ 22 / 10), '_PartialDate(22/10)')
+        self.assertEqual(repr(16 / Oct), '_Day(16, 10)')
+
+    def test_builders_pickle(self):
+        for builder in (Oct, 16 / Oct, D @ 16 / 10, MDY() @ 10):
+            restored = pickle.loads(pickle.dumps(builder))
+            self.assertEqual(restored, builder)
+            self.assertEqual(hash(restored), hash(builder))
+        self.assertIs(pickle.loads(pickle.dumps(Oct)), Oct)
+        self.assertEqual(pickle.loads(pickle.dumps(16 / Oct)) / 1995, 16 / Oct / 1995)
+        self.assertEqual(pickle.loads(pickle.dumps(D @ 16 / 10)) / 1995, 16 / Oct / 1995)
+        self.assertNotEqual(D @ 16 / 10, MDY() @ 16 / 10)
+        self.assertEqual({16 / Oct: 1}[16 / Oct], 1)
+
+    def test_builders_memory(self):
+        for name, factory, dict_factory in [
+            ('_Day', lambda i: _Day(i, 10), lambda i: _DictDay(i, 10)),
+            ('_PartialDate', lambda i: _PartialDate((i, 10), (2, 1, 0)),
+             lambda i: _DictPartialDate(i, ('day', 'month', 'year'))),
+            ('BeautifulWeekday', lambda i: BeautifulWeekday(MO.wd, i), None),
+        ]:
+            size = allocated_per_object(factory)
+            if dict_factory is not None:
+                dict_size = allocated_per_object(dict_factory)
+                self.assertLess(size, dict_size, name)
+
+            with self.assertRaises(AttributeError):
+                factory(0).__dict__
+
+        # Builders for days of the month are shared
+        self.assertIs(16 / Oct, 16 / Oct)
+
+    def test_builders_read_only(self):
+        x = 16 / Oct
+        with self.assertRaises(AttributeError):
+            x.d = 17
+        with self.assertRaises(AttributeError):
+            del x.m
+        with self.assertRaises(AttributeError):
+            Oct.m = 11
+        with self.assertRaises(AttributeError):
+            Oct._days = ()
+        self.assertEqual(16 / Oct / 1995, date(1995, 10, 16))
+        self.assertEqual(_Day(40, 10), _Day(40, 10))
+
+        partial = D @ 16 / 10
+        with self.assertRaises(AttributeError):
+            partial._date_values = (17, 10)
+        self.assertEqual(partial / 1995, 16 / Oct / 1995)
+
+        difference = (16 / Oct / 1995) - (29 / Feb / 1992)
+        with self.assertRaises(AttributeError):
+            difference.start = 1 / Jan / 1992
+        self.assertEqual(difference.start, 29 / Feb / 1992)
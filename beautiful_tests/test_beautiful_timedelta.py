@@ -1,12 +1,16 @@
+import copy
+import pickle
 import unittest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
+from dateutil.relativedelta import relativedelta
 from freezegun import freeze_time
 
-from beautiful_date import Feb, Mar, Oct, \
+from beautiful_date import Jan, Feb, Mar, Apr, Oct, Dec, BeautifulDate, \
     years, months, weeks, days, hours, minutes, seconds, microseconds, leapday, \
     year, month, day, hour, minute, second, microsecond, yearday, nlyearday, \
-    MO, SA, D
+    MO, FR, SA, D, compile_delta
+from beautiful_date.beautiful_timedelta import BeautifulFixedDelta, BeautifulRelativeDelta
 
 
 class TestBeautifulTimedelta(unittest.TestCase):
@@ -124,3 +128,167 @@ class TestBeautifulTimedelta(unittest.TestCase):
             self.assertEqual(initial_time - 2 * hours, 2 * hours.until_now)
             self.assertEqual(initial_time - 3 * hours, 2 * hours.until(initial_time - 1 * hours))
             self.assertEqual(initial_time - 3 * hours, 2 * hours.before(initial_time - 1 * hours))
+
+    def test_fixed_delta(self):
+        self.assertIsInstance(5 * days, BeautifulFixedDelta)
+        self.assertIsInstance(-5 * weeks, BeautifulFixedDelta)
+        self.assertIsInstance(3 * months, BeautifulRelativeDelta)
+
+        self.assertEqual(repr(-5 * weeks), 'BeautifulFixedDelta(days=-35)')
+        self.assertEqual(repr(5 * days + 3 * hours - 1 * microseconds),
+                         'BeautifulFixedDelta(days=+5, hours=+3, microseconds=-1)')
+        self.assertEqual(repr(-(25 * hours)), 'BeautifulFixedDelta(days=-1, hours=-1)')
+
+        self.assertIsInstance(5 * days + 3 * hours, BeautifulFixedDelta)
+        self.assertIsInstance(5 * days - 3 * hours, BeautifulFixedDelta)
+        self.assertIsInstance(-(5 * days), BeautifulFixedDelta)
+        self.assertIsInstance(2 * (5 * days), BeautifulFixedDelta)
+
+        self.assertIsInstance((5 / Oct / 1995) + 5 * days, BeautifulDate)
+        self.assertIsInstance(5 * days + date(1995, 10, 5), BeautifulDate)
+        self.assertIsInstance((5 / Oct / 1995) - 5 * days, BeautifulDate)
+        self.assertEqual(5 * days + date(1995, 10, 5), date(1995, 10, 10))
+
+    def test_fixed_delta_with_calendar_delta(self):
+        self.assertEqual(5 * days + 2 * months, BeautifulRelativeDelta(months=2, days=5))
+        self.assertEqual(2 * months + 5 * days, BeautifulRelativeDelta(months=2, days=5))
+        self.assertEqual(2 * months - 5 * days, BeautifulRelativeDelta(months=2, days=-5))
+        self.assertEqual(2 * months + 30 * hours, BeautifulRelativeDelta(months=2, days=1, hours=6))
+        self.assertIsInstance(5 * days + 2 * months, BeautifulRelativeDelta)
+
+        d = 31 / Oct / 1995
+        self.assertEqual(d + (5 * days + 1 * months), d + relativedelta(months=1, days=5))
+        self.assertEqual(d + (1 * months - 3 * weeks), d + relativedelta(months=1, days=-21))
+        self.assertEqual(d[1:2:3] - (3 * hours + 1 * years - 10 * minutes),
+                         d[1:2:3] - relativedelta(years=1, hours=2, minutes=50))
+
+    def test_fixed_delta_same_as_relativedelta(self):
+        d = 31 / Oct / 1995
+        dt = d[1:2:3]
+        for n in [-1000, -35, -1, 0, 1, 0.5, 7, 24, 25, 365, 1 / 3]:
+            for unit in [weeks, days, hours, minutes, seconds, microseconds]:
+                if unit is microseconds and n != int(n):
+                    continue  # timedelta is precise up to a microsecond
+
+                fixed = n * unit
+                relative = BeautifulRelativeDelta(**{unit.name: n})
+                self.assertEqual(d + fixed, d + relative)
+                self.assertEqual(type(d + fixed), type(d + relative))
+                self.assertEqual(d - fixed, d - relative)
+                self.assertEqual(dt + fixed, dt + relative)
+                self.assertEqual(dt - fixed, dt - relative)
+
+    def test_fixed_delta_with_plain_date(self):
+        # Same results as relativedelta
+        self.assertIs(type(date(2020, 1, 1) + 5 * days), BeautifulDate)
+        self.assertEqual(date(2020, 1, 1) + 5 * days, 6 / Jan / 2020)
+        self.assertEqual(date(2020, 1, 1) - 1 * weeks, date(2019, 12, 25))
+        self.assertIs(type(date(2020, 1, 1) - 1 * weeks), BeautifulDate)
+        self.assertEqual(date(2020, 1, 1) + 5 * hours, datetime(2020, 1, 1, 5))
+        self.assertIsInstance(date(2020, 1, 1) + 5 * hours, datetime)
+        self.assertIs(type(3 * days.until(date(2020, 1, 1))), BeautifulDate)
+        self.assertIs(type((1 / Jan / 2020) + 5 * days), BeautifulDate)
+        self.assertEqual((1 / Jan / 2020) + 5 * hours, datetime(2020, 1, 1, 5))
+        self.assertIs(type(datetime(2020, 1, 1) + 5 * hours), datetime)
+
+    def test_fixed_delta_fields(self):
+        self.assertEqual(5 * days, relativedelta(days=5))
+        self.assertEqual(relativedelta(hours=3), 3 * hours)
+        self.assertEqual(hash(5 * days), hash(BeautifulRelativeDelta(days=5)))
+        self.assertEqual((3 * hours).hours, 3)
+        self.assertEqual((2 * weeks).weeks, 2)
+        self.assertEqual((36 * hours).days, 1)
+        self.assertIs(type(1.5 * days), type(5 * days))
+        self.assertEqual(1.5 * days, relativedelta(days=1.5))
+
+    def test_compiled_delta(self):
+        compiled = compile_delta(1 * months, 1 * day, MO(2))
+        self.assertEqual((16 / Oct / 1995) + compiled, date(1995, 11, 13))
+        self.assertEqual(compiled(16 / Oct / 1995), date(1995, 11, 13))
+        self.assertEqual(compiled.apply_many([16 / Oct / 1995, (1 / Jan / 2000)[10:30]]),
+                         [date(1995, 11, 13), datetime(2000, 2, 14, 10, 30)])
+        self.assertEqual(repr(compiled),
+                         'CompiledDelta(BeautifulRelativeDelta(months=+1, day=1, weekday=MO(+2)))')
+
+    def test_compiled_delta_same_as_relativedelta(self):
+        deltas = [
+            (1 * years, 2 * months, MO(2)),
+            (-13 * months, SA(-2)),
+            (31 * day, 1 * months),
+            (leapday, 1 * years),
+            (2 * months, 3 * hours),
+            (1 * hour, 1 * weeks),
+            (29 * day, 2 * month, 2000 * year, -5 * days),
+            (100 * yearday,),
+            (-1 * months, 30 * minute, 10 * second, 5 * microsecond),
+            (3 * weeks, FR),
+        ]
+        dates = [31 / Jan / 1996, 29 / Feb / 1996, 28 / Feb / 1997, 30 / Dec / 1999, 1 / Mar / 2000]
+        dates += [d[23:59:59] for d in dates]
+
+        for parts in deltas:
+            total = BeautifulRelativeDelta()
+            for part in parts:
+                total += part
+
+            compiled = compile_delta(*parts)
+            for d in dates:
+                expected = d + total
+                self.assertEqual(d + compiled, expected)
+                self.assertEqual(type(d + compiled), type(expected))
+
+    def test_delta_bounds(self):
+        self.assertEqual((1 * months).bounds(), (timedelta(days=28), timedelta(days=31)))
+        self.assertEqual((-1 * years).bounds(), (timedelta(days=-366), timedelta(days=-365)))
+        self.assertEqual((1 * months - 30 * days).bounds(), (timedelta(days=-2), timedelta(days=1)))
+        self.assertEqual((2 * months + MO(2)).bounds(), (timedelta(days=59 + 7), timedelta(days=62 + 13)))
+        self.assertEqual((1 * months + SA(-1) + 3 * hours).bounds(),
+                         (timedelta(days=28 - 6, hours=3), timedelta(days=31, hours=3)))
+        self.assertIsNone((1 * months + 1 * day).bounds())
+
+    def test_delta_sign(self):
+        self.assertEqual((1 * months).sign(), 1)
+        self.assertEqual((-1 * months + 3 * hours).sign(), -1)
+        self.assertEqual((1 * years - 364 * days).sign(), 1)
+        self.assertEqual((5 * days).sign(), 1)
+        self.assertEqual((-5 * days).sign(), -1)
+        self.assertEqual((0 * days).sign(), 0)
+        self.assertEqual((0 * months).sign(), 0)
+
+        anchor_dependent = 1 * months - 30 * days
+        self.assertIsNone(anchor_dependent.sign())
+        self.assertEqual(anchor_dependent.sign(31 / Jan / 2021), -1)
+        self.assertEqual(anchor_dependent.sign(1 / Mar / 2021), 1)
+        self.assertEqual(anchor_dependent.sign(1 / Apr / 2021), 0)
+        self.assertEqual((1 * day).sign(5 / Mar / 2021), -1)
+
+    def test_pickle_and_hash(self):
+        values = [months, days.from_(16 / Oct / 1995), hours.until(16 / Oct / 1995), MO, FR(-2), 1 * months,
+                  3 * years + 2 * days + SA(-1), 5 * days, relativedelta(day=31)]
+        for value in values:
+            for restored in (pickle.loads(pickle.dumps(value)), copy.copy(value), copy.deepcopy(value)):
+                self.assertEqual(restored, value)
+                self.assertEqual(hash(restored), hash(value))
+        self.assertIs(pickle.loads(pickle.dumps(MO)), MO)
+        self.assertEqual(MO(1), MO)
+        self.assertNotEqual(MO(2), MO)
+        self.assertNotEqual(days.from_(16 / Oct / 1995), days.until(16 / Oct / 1995))
+        self.assertEqual(len({months, months, days, MO, MO(1), MO(2)}), 4)
+        self.assertLess(len(pickle.dumps(1 * months)), 100)
+
+        midnight = BeautifulRelativeDelta(hour=0, minute=0, second=0, microsecond=0)
+        restored = pickle.loads(pickle.dumps(midnight))
+        self.assertEqual(restored, midnight)
+        self.assertEqual((16 / Oct / 1995)[10:20:30] + restored, (16 / Oct / 1995)[0:00])
+        self.assertEqual(pickle.loads(pickle.dumps(BeautifulRelativeDelta(month=1, day=1, hour=0))).hour, 0)
+        self.assertEqual(5 * pickle.loads(pickle.dumps(days.from_(16 / Oct / 1995))), 21 / Oct / 1995)
+
+    def test_hashed_fields_read_only(self):
+        for value, name in [(days, 'name'), (days.from_(16 / Oct / 1995), 'start'), (hours.ago, 'is_until'),
+                            (MO, 'wd'), (FR(-2), 'n')]:
+            with self.assertRaises(AttributeError):
+                setattr(value, name, None)
+            with self.assertRaises(AttributeError):
+                delattr(value, name)
+        self.assertEqual(days.name, 'days')
+        self.assertEqual(MO.n, 1)
@@ -0,0 +1,122 @@
+import random
+import unittest
+from array import array
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
+
+from dateutil.relativedelta import relativedelta
+
+from beautiful_date import Jan, Mar, Jun, Dec, Buckets, DateArray, years, months, weeks, days, hours, minutes, \
+    bdays, drange
+
+
+def brute_force(r, value):
+    """Index of the interval by comparing the value with all the dates of the range."""
+    elements = list(r)
+    if not isinstance(r._start, datetime) and isinstance(value, datetime):
+        value = value.date()
+    if isinstance(r._start, datetime) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day, tzinfo=r._tz)
+    bounds = elements + [r._aware(r._stop)]
+    for i in range(len(elements)):
+        if (bounds[i + 1] < value <= bounds[i]) if r._backwards else (bounds[i] <= value < bounds[i + 1]):
+            return i
+    return -1
+
+
+class TestBuckets(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(22)
+        first, last = datetime(2019, 6, 1), datetime(2022, 6, 1)
+        self.datetimes = [first + timedelta(seconds=rng.randrange(int((last - first).total_seconds())))
+                          for _ in range(500)]
+        self.dates = [d.date() for d in self.datetimes]
+
+    def test_ranges_of_dates(self):
+        ranges = [
+            drange(1 / Jan / 2020, 1 / Jan / 2022),
+            drange(1 / Jan / 2020, 1 / Jan / 2022, 1 * weeks),
+            drange(3 / Jan / 2020, 17 / Dec / 2021, 10 * days),
+            drange(31 / Jan / 2020, 1 / Jan / 2022, 1 * months),
+            drange(1 / Jan / 2020, 1 / Jan / 2023, 1 * years),
+            drange(1 / Jan / 2020, 1 / Jun / 2020, 1 * bdays),
+            drange(1 / Jan / 2020, 1 / Jan / 2021, relativedelta(days=1, weekday=0)),
+            drange(1 / Jan / 2022, 1 / Jan / 2020, -3 * days),
+            drange(31 / Dec / 2021, 1 / Jan / 2020, -1 * months),
+            drange(1 / Jan / 2020, 1 / Jan / 2020),
+        ]
+        for r in ranges:
+            expected = [brute_force(r, d) for d in self.dates]
+            self.assertEqual(list(r.bucketize(self.dates)), expected, r)
+            self.assertEqual(list(r.bucketize(self.datetimes)), expected, r)
+            self.assertEqual(list(r.bucketize(DateArray(self.dates))), expected, r)
+            self.assertEqual(list(r.bucketize(array('i', (d.toordinal() for d in self.dates)))), expected, r)
+
+            counts = r.bucket_counts(iter(self.dates))
+            self.assertEqual(len(counts), len(r))
+            self.assertEqual(counts, [expected.count(i) for i in range(len(r))])
+
+            groups = r.group_by(d for d in self.dates)
+            self.assertEqual(list(groups), [r[i] for i in sorted(set(expected) - {-1})])
+            self.assertEqual(sum(map(len, groups.values())), sum(counts))
+
+    def test_ranges_of_datetimes(self):
+        start, stop = (1 / Jan / 2020)[:], (1 / Jan / 2022)[:]
+        ranges = [
+            drange(start, stop, 6 * hours),
+            drange(start + 7 * minutes, stop, 1 * weeks + 1 * hours),
+            drange(start, stop, 1 * months),
+            drange(stop, start, -5 * days),
+            drange((31 / Mar / 2020)[12:], stop, 1 * months),
+        ]
+        for r in ranges:
+            values = self.datetimes + self.dates[:50]
+            expected = [brute_force(r, d) for d in values]
+            self.assertEqual(list(r.bucketize(values)), expected, r)
+            self.assertEqual(Buckets(r).index(values[0]), expected[0])
+        with self.assertRaises(TypeError):
+            list(ranges[0].bucketize(array('i', [1, 2])))
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo is not available')
+    def test_ranges_with_tz(self):
+        tz = ZoneInfo('Europe/Prague')
+        for mode in ('wall', 'absolute'):
+            r = drange((28 / Mar / 2020)[:], (1 / Jun / 2020)[:], 1 * days, tz=tz, mode=mode)
+            values = [d.replace(tzinfo=tz) for d in self.datetimes]
+            self.assertEqual(list(r.bucketize(values)), [brute_force(r, d) for d in values])
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_numpy(self):
+        dates = np.array(self.dates + [date(1960, 1, 1)], dtype='datetime64[D]')
+        datetimes = np.array(self.datetimes + [datetime(1960, 1, 1)], dtype='datetime64[us]')
+        for r in (drange(1 / Jan / 2020, 1 / Jan / 2022, 1 * weeks),
+                  drange(31 / Jan / 2020, 1 / Jan / 2022, 1 * months),
+                  drange(31 / Dec / 2021, 1 / Jan / 1950, -1 * months)):
+            expected = [brute_force(r, d) for d in self.dates + [date(1960, 1, 1)]]
+            self.assertEqual(r.bucketize(dates).tolist(), expected)
+            self.assertEqual(r.bucketize(datetimes).tolist(), expected)
+            self.assertEqual(r.bucket_counts(dates), r.bucket_counts(self.dates + [date(1960, 1, 1)]))
+            self.assertEqual(r.group_by(dates).keys(), r.group_by(self.dates + [date(1960, 1, 1)]).keys())
+
+        r = drange((1 / Jan / 2020)[:], (1 / Jun / 2021)[:], 1 * months)
+        self.assertEqual(r.bucketize(datetimes).tolist(), list(r.bucketize(self.datetimes + [datetime(1960, 1, 1)])))
+        r = drange((1 / Jan / 1950)[:], (1 / Jun / 2021)[:], 1 * hours)
+        self.assertEqual(r.bucketize(datetimes).tolist(), list(r.bucketize(self.datetimes + [datetime(1960, 1, 1)])))
+
+    def test_buckets(self):
+        buckets = Buckets(drange(1 / Jan / 2020, 1 / Jan / 2021, 1 * months))
+        self.assertEqual(len(buckets), 12)
+        self.assertEqual(repr(buckets), 'Buckets(drange(2020-01-01, 2021-01-01, BeautifulRelativeDelta(months=+1)))')
+        self.assertEqual(buckets.index(31 / Dec / 2020), 11)
+        self.assertEqual(buckets.index((1 / Jun / 2020)[23:59]), 5)
+        self.assertEqual(buckets.index(1 / Jan / 2021), -1)
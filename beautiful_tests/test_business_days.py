@@ -0,0 +1,142 @@
+import os
+import pickle
+import random
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+
+from beautiful_date import Jan, Mar, Dec, BeautifulDate, BusinessCalendar, bdays, days, drange, \
+    MO, TU, WE, TH, SU
+
+
+def _brute_offset(calendar, d, n):
+    current = d
+    if n == 0:
+        while not calendar.is_business_day(current):
+            current += timedelta(days=1)
+        return current
+    step = timedelta(days=1 if n > 0 else -1)
+    for _ in range(abs(n)):
+        current += step
+        while not calendar.is_business_day(current):
+            current += step
+    return current
+
+
+class TestBusinessDays(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        start = date(2020, 1, 1)
+        self.holidays = [start + timedelta(days=rng.randrange(1000)) for _ in range(150)]
+        self.calendars = [
+            BusinessCalendar(),
+            BusinessCalendar(holidays=self.holidays),
+            BusinessCalendar([SU, MO, TU, WE, TH], self.holidays),
+            BusinessCalendar('0000001', self.holidays),
+        ]
+
+    def test_weekmask_and_holidays(self):
+        cal = BusinessCalendar(holidays=[25 / Dec / 2023, 30 / Dec / 2023, 26 / Dec / 2023, 25 / Dec / 2023])
+        self.assertEqual(cal.holidays, [25 / Dec / 2023, 26 / Dec / 2023])
+        self.assertEqual(repr(cal), "BusinessCalendar('1111100', holidays=2)")
+        self.assertEqual(BusinessCalendar([MO, TU, WE, TH, 4]), BusinessCalendar('1111100'))
+        self.assertTrue(cal.is_business_day(27 / Dec / 2023))
+        self.assertTrue((27 / Dec / 2023)[10:] in cal)
+        self.assertFalse(cal.is_business_day(25 / Dec / 2023))
+        self.assertFalse(cal.is_business_day(24 / Dec / 2023))
+
+        with self.assertRaises(ValueError):
+            BusinessCalendar('0000000')
+        with self.assertRaises(ValueError):
+            BusinessCalendar('11111')
+
+    def test_offset(self):
+        self.assertEqual(15 / Mar / 2024 + 1 * bdays, 18 / Mar / 2024)
+        self.assertEqual(16 / Mar / 2024 - 1 * bdays, 15 / Mar / 2024)
+        self.assertEqual(16 / Mar / 2024 + 0 * bdays, 18 / Mar / 2024)
+        self.assertEqual(1 * bdays + 15 / Mar / 2024, 18 / Mar / 2024)
+        self.assertIsInstance(date(2024, 3, 15) + 1 * bdays, BeautifulDate)
+        self.assertEqual((15 / Mar / 2024)[10:30] + 1 * bdays, datetime(2024, 3, 18, 10, 30))
+
+        for cal in self.calendars:
+            for d in drange(20 / Dec / 2019, 10 / Jan / 2023, 13 * days):
+                for n in (-30, -7, -1, 0, 1, 2, 5, 40):
+                    self.assertEqual(d + n * cal.bdays, _brute_offset(cal, d, n), (cal, d, n))
+
+    def test_count(self):
+        cal = BusinessCalendar(holidays=[25 / Dec / 2023, 26 / Dec / 2023, 1 / Jan / 2024])
+        self.assertEqual(cal.count(1 / Dec / 2023, 1 / Jan / 2024), 19)
+        self.assertEqual(cal.count(1 / Jan / 2024, 1 / Dec / 2023), -19)
+
+        for cal in self.calendars:
+            start = 1 / Jan / 2020
+            for end in drange(start, 1 / Jan / 2023, 17 * days):
+                expected = sum(cal.is_business_day(d) for d in drange(start, end))
+                self.assertEqual(cal.count(start, end), expected)
+
+    def test_drange(self):
+        for cal in self.calendars:
+            for start, stop, n in [(1 / Jan / 2020, 1 / Mar / 2021, 1), (4 / Jan / 2020, 1 / Mar / 2021, 3),
+                                   (1 / Mar / 2021, 1 / Jan / 2020, -1), (7 / Mar / 2021, 1 / Jan / 2020, -4)]:
+                r = drange(start, stop, n * cal.bdays)
+                expected = list(r._walk())
+                self.assertEqual(list(r), expected)
+                self.assertEqual(len(r), len(expected))
+                self.assertEqual([r[i] for i in range(len(r))], expected)
+                self.assertEqual(list(reversed(r)), expected[::-1])
+                self.assertEqual(list(r[5:20]), expected[5:20])
+                self.assertEqual(list(r[3::4]), expected[3::4])
+                self.assertEqual(list(r[::-3]), expected[::-3])
+                self.assertIsInstance(r[::-3], drange)
+                self.assertEqual(list(r[len(r):]), [])
+                for d in drange(start, stop, 1 * days if n > 0 else -1 * days):
+                    self.assertEqual(d in r, d in expected)
+                self.assertEqual(r.index(expected[7]), 7)
+
+        r = drange(15 / Mar / 2024, 22 / Mar / 2024, 2 * bdays)
+        self.assertEqual(list(r), [15 / Mar / 2024, 19 / Mar / 2024, 21 / Mar / 2024])
+        self.assertEqual(list(drange((15 / Mar / 2024)[10:], (19 / Mar / 2024)[:], 1 * bdays)),
+                         [(15 / Mar / 2024)[10:], (18 / Mar / 2024)[10:]])
+        self.assertEqual(len(drange(1 / Jan / 1900, 1 / Jan / 2100, 1 * bdays)), 52179)
+
+    def test_serialization(self):
+        for cal in self.calendars:
+            loaded = BusinessCalendar.from_bytes(cal.to_bytes())
+            self.assertEqual(loaded, cal)
+            self.assertEqual(loaded.count(1 / Jan / 2020, 1 / Jan / 2023), cal.count(1 / Jan / 2020, 1 / Jan / 2023))
+
+        cal = self.calendars[2]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'holidays.bin')
+            cal.save(path)
+            self.assertEqual(os.path.getsize(path), 10 + 4 * len(cal.holidays))
+            self.assertEqual(BusinessCalendar.load(path), cal)
+
+        with self.assertRaises(ValueError):
+            BusinessCalendar.from_bytes(b'BDAY')
+        with self.assertRaises(ValueError):
+            BusinessCalendar.from_bytes(b'NOPE' + cal.to_bytes()[4:])
+        with self.assertRaises(ValueError):
+            BusinessCalendar.from_bytes(cal.to_bytes()[:-1])
+
+    def test_delta(self):
+        self.assertEqual(repr(5 * bdays), 'BusinessDelta(bdays=+5)')
+        self.assertEqual(-(5 * bdays), -5 * bdays)
+        self.assertEqual(2 * (5 * bdays), 10 * bdays)
+        self.assertEqual((-5 * bdays).sign(), -1)
+        self.assertNotEqual(5 * bdays, 5 * BusinessCalendar('1111110').bdays)
+        with self.assertRaises(ValueError):
+            drange(1 / Jan / 2020, 1 / Jan / 2021, 0 * bdays)
+        with self.assertRaises(ValueError):
+            1.5 * bdays
+        self.assertEqual(1 / Jan / 2024 + 1.0 * bdays, 2 / Jan / 2024)
+
+    def test_read_only(self):
+        delta = 5 * bdays
+        for value, name in [(delta, 'n'), (delta, 'calendar'), (bdays, 'calendar'), (delta.calendar, 'weekmask')]:
+            with self.assertRaises(AttributeError):
+                setattr(value, name, None)
+        self.assertEqual(delta.n, 5)
+        self.assertEqual(pickle.loads(pickle.dumps(delta)), delta)
+        self.assertEqual(pickle.loads(pickle.dumps(self.calendars[1])), self.calendars[1])
@@ -0,0 +1,68 @@
+import unittest
+from datetime import date, datetime, timezone
+
+from dateutil.relativedelta import relativedelta
+
+from beautiful_date import Jan, Feb, Mar, Apr, May, Jun, Oct, BeautifulDate, years, months, days, drange, \
+    MO, TU, FR, SA, SU
+from beautiful_date.calendar_table import CalendarTable, get_calendar_table, set_calendar_window, add_months
+
+
+class TestCalendarTable(unittest.TestCase):
+
+    def test_lookups(self):
+        table = CalendarTable(1999, 2001)
+        for d in drange(1 / Jan / 1995, 1 / Jan / 2005, 3 * days):
+            self.assertEqual(table.ordinal(d.year, d.month, d.day), d.toordinal())
+            self.assertEqual(table.weekday(d.year, d.month, d.day), d.weekday())
+            month_start = d.replace(day=1)
+            next_month_start = (month_start + 32 * days).replace(day=1)
+            self.assertEqual(table.month_length(d.year, d.month), (next_month_start - month_start).days)
+        self.assertIn(2000, table)
+        self.assertNotIn(2002, table)
+        self.assertEqual(repr(table), 'CalendarTable(1999, 2001)')
+        self.assertEqual(table.month_length(9999, 12), 31)
+        with self.assertRaises(ValueError):
+            CalendarTable(2000, 1999)
+
+    def test_add_months(self):
+        table = CalendarTable(2000, 2001)
+        for d in drange(1 / Jan / 1999, 1 / Jan / 2003):
+            for n in (-25, -13, -1, 0, 1, 2, 11, 12, 37):
+                self.assertEqual(table.add_months(d, n), d + relativedelta(months=n))
+
+        dt = datetime(2020, 1, 31, 10, 30, tzinfo=timezone.utc)
+        self.assertEqual(add_months(dt, 1), datetime(2020, 2, 29, 10, 30, tzinfo=timezone.utc))
+        self.assertIsInstance(add_months(31 / Jan / 2020, 1), BeautifulDate)
+        with self.assertRaises(ValueError):
+            add_months(date(9999, 12, 1), 1)
+
+    def test_calendar_window(self):
+        default = get_calendar_table()
+        try:
+            table = set_calendar_window(1990, 1999)
+            self.assertIs(get_calendar_table(), table)
+            self.assertEqual(31 / Jan / 1995 + 1 * months, 28 / Feb / 1995)
+            self.assertEqual(31 / Jan / 2020 + 1 * months, 29 / Feb / 2020)
+        finally:
+            set_calendar_window(default.first_year, default.last_year)
+
+    def test_deltas(self):
+        for d in drange(1 / Jan / 1899, 1 / Mar / 1901, 5 * days):
+            for n in [-5, -4, -3, -2, -1, 1, 2, 3, 4, 5]:
+                for wd in (MO, TU, FR, SA, SU):
+                    self.assertEqual(d + wd(n), d + relativedelta(weekday=wd.wd(n)))
+                    self.assertEqual(d - wd(n), d + relativedelta(weekday=wd.wd(-n)))
+            self.assertEqual(d + 1 * years + 1 * months, d + relativedelta(years=1, months=1))
+
+        self.assertIsInstance(date(2020, 1, 1) + MO, BeautifulDate)
+        self.assertIsInstance(date(2020, 1, 1) + 1 * months, BeautifulDate)
+        self.assertEqual(datetime(2020, 1, 1, 10) + MO(2), datetime(2020, 1, 13, 10))
+        self.assertEqual(datetime(2020, 1, 31, 10) - 1 * months, datetime(2019, 12, 31, 10))
+        self.assertEqual((16 / Oct / 1995) + MO, 16 / Oct / 1995)
+        with self.assertRaises(ValueError):
+            (16 / Oct / 1995) + MO(0)
+        with self.assertRaises(ValueError):
+            (16 / Oct / 1995) - MO(0)
+        self.assertEqual(list(drange(31 / Jan / 2020, 1 / Jun / 2020, relativedelta(months=1))),
+                         [31 / Jan / 2020, 29 / Feb / 2020, 29 / Mar / 2020, 29 / Apr / 2020, 29 / May / 2020])
@@ -0,0 +1,59 @@
+import unittest
+from datetime import date, datetime, timezone, timedelta
+
+from beautiful_date import Oct, D, BeautifulDate, days, hours, drange, \
+    Clock, FrozenClock, get_clock, use_clock, frozen_clock
+
+
+class TestClock(unittest.TestCase):
+
+    def test_frozen_clock(self):
+        now = (16 / Oct / 1995)[10:30]
+        with frozen_clock(now) as clock:
+            self.assertIsInstance(clock, FrozenClock)
+            self.assertIs(get_clock(), clock)
+
+            self.assertEqual(D.now(), now)
+            self.assertEqual(D.today(), date(1995, 10, 16))
+            self.assertIsInstance(D.today(), BeautifulDate)
+            self.assertEqual(D.tomorrow(), date(1995, 10, 17))
+            self.assertEqual(D.yesterday(), date(1995, 10, 15))
+
+            self.assertEqual(1 * hours.ago, datetime(1995, 10, 16, 9, 30))
+            self.assertEqual(2 * hours.from_now, datetime(1995, 10, 16, 12, 30))
+            self.assertEqual(5 * days.from_today, date(1995, 10, 21))
+            self.assertEqual(5 * days.until_today, date(1995, 10, 11))
+            self.assertEqual(list(drange(18 / Oct / 1995)), [date(1995, 10, 16), date(1995, 10, 17)])
+
+            clock.advance(5 * days + 1 * hours)
+            self.assertEqual(D.now(), datetime(1995, 10, 21, 11, 30))
+            self.assertEqual(D.today(), date(1995, 10, 21))
+
+            clock.set(datetime(2000, 1, 1, tzinfo=timezone.utc))
+            now = D.now(timezone(timedelta(hours=2)))
+            self.assertEqual(now, datetime(2000, 1, 1, tzinfo=timezone.utc))
+            self.assertEqual(now.hour, 2)
+
+        self.assertIsNot(get_clock(), clock)
+
+    def test_memoized_clock(self):
+        clock = Clock(tick=timedelta(hours=1))
+        self.assertEqual(clock.tick, 3600)
+        with use_clock(clock):
+            self.assertIs(D.now(), D.now())
+            self.assertIs(D.today(), D.today())
+            self.assertIsNot(D.now(timezone.utc), D.now())
+            self.assertEqual(D.today(), date.today())
+
+        clock = Clock(tick=0)
+        self.assertIsNot(clock.now(), clock.now())
+
+        clock = Clock()
+        self.assertIsNot(clock.now(), clock.now())
+        self.assertAlmostEqual(clock.now(), datetime.now(), delta=timedelta(seconds=1))
+
+    def test_nested_clocks(self):
+        with frozen_clock((16 / Oct / 1995)[:]):
+            with frozen_clock((17 / Oct / 1995)[:]):
+                self.assertEqual(D.today(), date(1995, 10, 17))
+            self.assertEqual(D.today(), date(1995, 10, 16))
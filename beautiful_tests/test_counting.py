@@ -0,0 +1,118 @@
+import calendar
+import pickle
+import random
+import unittest
+from datetime import date, datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from beautiful_date import Jan, Feb, Mar, Oct, Dec, DateArray, DateDifference, months_between, between, count, \
+    between_many, count_many, years, months, weeks, days, hours, minutes, bdays, drange, MO, TU, SU
+
+
+def random_dates(rng, n, month_ends=0.3):
+    dates = []
+    for _ in range(n):
+        d = date(2000, 1, 1) + timedelta(days=rng.randrange(-5000, 5000))
+        if rng.random() < month_ends:
+            d = d.replace(day=calendar.monthrange(d.year, d.month)[1])
+        dates.append(d)
+    return dates
+
+
+class TestCounting(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(24)
+        self.starts = random_dates(rng, 400)
+        self.ends = random_dates(rng, 400)
+        self.start_times = [datetime(d.year, d.month, d.day, rng.randrange(24), rng.randrange(60)) for d in self.starts]
+        self.end_times = [datetime(d.year, d.month, d.day, rng.randrange(24), rng.randrange(60)) for d in self.ends]
+
+    def test_months_between(self):
+        for a, b in zip(self.starts + self.start_times, self.ends + self.end_times):
+            delta = relativedelta(b, a)
+            self.assertEqual(months_between(a, b), delta.years * 12 + delta.months, (a, b))
+            self.assertEqual(between(a, b, years), delta.years)
+            self.assertEqual(between(a, b, 3 * months), int((delta.years * 12 + delta.months) / 3))
+        self.assertEqual(months_between(31 / Jan / 2020, 29 / Feb / 2020), 1)
+        self.assertEqual(months_between(29 / Feb / 2020, 31 / Jan / 2020), -0)
+        self.assertEqual(months_between(31 / Mar / 2020, (29 / Feb / 2020)[12:00]), 0)
+
+    def test_between_fixed(self):
+        for a, b in zip(self.start_times, self.end_times):
+            for unit, td in ((weeks, timedelta(weeks=1)), (days, timedelta(days=1)), (hours, timedelta(hours=1)),
+                             (15 * minutes, timedelta(minutes=15))):
+                self.assertEqual(between(a, b, unit), int((b - a) / td))
+        self.assertEqual(between(1 / Jan / 2020, (2 / Jan / 2020)[12:00], hours), 36)
+        for invalid in (1 * months + 1 * days, -1 * days, relativedelta(day=1), 0 * months):
+            with self.assertRaises(ValueError):
+                between(1 / Jan / 2020, 1 / Jan / 2021, invalid)
+
+    def test_difference(self):
+        diff = (16 / Oct / 1995) - (29 / Feb / 1992)
+        self.assertIsInstance(diff, DateDifference)
+        self.assertEqual(diff, timedelta(days=1325))
+        self.assertEqual(repr(diff), 'DateDifference(days=1325)')
+        self.assertEqual((diff.start, diff.end), (29 / Feb / 1992, 16 / Oct / 1995))
+        self.assertEqual(diff.in_(months), 43)
+        self.assertEqual(diff.in_(years), 3)
+        self.assertEqual(diff.in_(weeks), 189)
+        self.assertEqual(diff.in_(MO), count(MO, 29 / Feb / 1992, 16 / Oct / 1995))
+        self.assertEqual((date(1992, 2, 29) - 16 / Oct / 1995).in_(months), -43)
+        self.assertEqual(((16 / Oct / 1995)[10:30] - datetime(1995, 10, 15, 11)).in_(hours), 23)
+        self.assertEqual(pickle.loads(pickle.dumps(diff)).in_(months), 43)
+        self.assertEqual((16 / Oct / 1995) - 1 * days, 15 / Oct / 1995)
+        self.assertEqual((29 / Feb / 1992) + diff, 16 / Oct / 1995)
+
+    def test_count_weekdays(self):
+        for a, b in zip(self.starts[:100], self.ends[:100]):
+            for wd in (MO, TU, SU):
+                expected = sum(1 for d in drange(a, b) if d.weekday() == wd.wd.weekday) if a < b else 0
+                self.assertEqual(count(wd, a, b), expected)
+        self.assertEqual(count(MO, 1 / Jan / 2020, 1 / Jan / 2021), 52)
+        self.assertEqual(count(MO, (6 / Jan / 2020)[23:00], 7 / Jan / 2020), 1)
+
+    def test_count_steps(self):
+        for a, b in zip(self.starts[:100], self.ends[:100]):
+            for step in (months, 3 * months, -2 * months, years, weeks, -1 * days, bdays):
+                r = drange(a, b, 1 * step if step in (months, years, weeks, bdays) else step)
+                self.assertEqual(count(step, a, b), len(tuple(r)))
+                self.assertEqual(r.count(), len(tuple(r)))
+        self.assertEqual(count(months, 31 / Jan / 2020, 1 / Jan / 2021), 12)
+        self.assertEqual(drange(31 / Jan / 2000, 1 / Jan / 2100, 1 * months).count(), 1200)
+        self.assertEqual(drange(31 / Dec / 2020, 1 / Jan / 2020, -1 * months).count(), 12)
+        r = drange((31 / Jan / 2020)[10:00], (31 / Mar / 2020)[9:00], 1 * months)
+        self.assertEqual(r.count(), 3)
+        self.assertEqual(r.count((29 / Feb / 2020)[10:00]), 1)
+        self.assertEqual(r.count(29 / Feb / 2020), 0)
+
+    def test_many(self):
+        self.assertEqual(between_many(self.starts, self.ends, months),
+                         [months_between(a, b) for a, b in zip(self.starts, self.ends)])
+        expected = [count(SU, a, b) for a, b in zip(self.starts, self.ends)]
+        self.assertEqual(count_many(SU, DateArray(self.starts), DateArray(self.ends)), expected)
+        self.assertEqual(count_many(SU, self.starts, iter(self.ends)), expected)
+        self.assertEqual(count_many(months, self.starts[:20], self.ends[:20]),
+                         [count(months, a, b) for a, b in zip(self.starts[:20], self.ends[:20])])
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_numpy(self):
+        for starts, ends in ((self.starts, self.ends), (self.start_times, self.end_times)):
+            a, b = np.array(starts, dtype='datetime64[us]'), np.array(ends, dtype='datetime64[us]')
+            for unit in (years, months, 3 * months, weeks, days, hours, 15 * minutes, MO):
+                self.assertEqual(between_many(a, b, unit).tolist(),
+                                 [between(x, y, unit) for x, y in zip(starts, ends)], unit)
+        a, b = np.array(self.starts, dtype='datetime64[D]'), np.array(self.ends, dtype='datetime64[D]')
+        self.assertEqual(count_many(TU, a, b).tolist(), [count(TU, x, y) for x, y in zip(self.starts, self.ends)])
+        self.assertEqual(between_many(np.array([31 / Jan / 2020], dtype='datetime64[D]'),
+                                      np.array([29 / Feb / 2020], dtype='datetime64[D]'), months).tolist(), [1])
+        self.assertEqual(between_many(np.array([1 / Mar / 2020], dtype='datetime64[D]'),
+                                      np.array([31 / Dec / 2019], dtype='datetime64[D]'), months).tolist(), [-2])
+        self.assertEqual(between(1 / Mar / 2020, 31 / Dec / 2019, months), -2)
+        self.assertEqual(between(1 / Dec / 2020, 1 / Oct / 2020, months), -2)
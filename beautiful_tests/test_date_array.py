@@ -0,0 +1,132 @@
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, datetime
+
+from dateutil.relativedelta import relativedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from beautiful_date import Jan, Feb, Mar, Oct, Dec, BeautifulDate, DateArray, years, months, weeks, days, hours, \
+    bdays, drange, MO
+
+
+class TestDateArray(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(20)
+        self.dates = [date.fromordinal(rng.randrange(date(1850, 1, 1).toordinal(), date(2250, 1, 1).toordinal()))
+                      for _ in range(2000)]
+        self.array = DateArray.from_iterable(self.dates)
+
+    def test_sequence(self):
+        a = self.array
+        self.assertEqual(len(a), len(self.dates))
+        self.assertEqual(list(a), self.dates)
+        self.assertIsInstance(a[0], BeautifulDate)
+        self.assertEqual(a[-1], self.dates[-1])
+        self.assertEqual(list(a[10:20:3]), self.dates[10:20:3])
+        self.assertEqual(list(reversed(a)), self.dates[::-1])
+        self.assertIn(self.dates[5], a)
+        self.assertNotIn(self.dates[5] - 1 * days, DateArray([self.dates[5]]))
+        self.assertNotIn(datetime(2000, 1, 1), a)
+        self.assertEqual(a.nbytes, 4 * len(a))
+        self.assertEqual(DateArray(self.dates), a)
+        self.assertNotEqual(a[1:], a[:-1])
+        self.assertEqual(repr(DateArray([16 / Oct / 1995])), 'DateArray([1995-10-16])')
+        self.assertEqual(repr(DateArray.from_iterable(drange(1 / Jan / 2020, 1 / Feb / 2020))),
+                         'DateArray([2020-01-01, 2020-01-02, 2020-01-03, ..., 2020-01-29, 2020-01-30, 2020-01-31])')
+        with self.assertRaises(TypeError):
+            DateArray([datetime(2000, 1, 1)])
+
+    def test_deltas(self):
+        a = self.array
+        for delta in (5 * days, -2 * weeks, 1 * months, -13 * months, 2 * years, relativedelta(months=1),
+                      relativedelta(days=3), MO(2), 3 * bdays, 1 * months + 1 * days):
+            self.assertEqual(list(a + delta), [d + delta for d in self.dates])
+            self.assertEqual(list(delta + a), [d + delta for d in self.dates])
+        for delta in (5 * days, 1 * months, relativedelta(years=1)):
+            self.assertEqual(list(a - delta), [d - delta for d in self.dates])
+        with self.assertRaises(TypeError):
+            a + 5 * hours
+
+    def test_comparisons_and_sorting(self):
+        a = self.array
+        pivot = 1 / Jan / 2000
+        self.assertEqual(a < pivot, [d < pivot for d in self.dates])
+        self.assertEqual(a >= pivot, [d >= pivot for d in self.dates])
+        self.assertEqual(a <= a + 1 * days, [True] * len(a))
+        self.assertEqual(a > a, [False] * len(a))
+        with self.assertRaises(ValueError):
+            a < a[1:]
+
+        self.assertEqual([self.dates[i] for i in a.argsort()], sorted(self.dates))
+        s = a.sorted()
+        self.assertEqual(list(s), sorted(self.dates))
+        self.assertEqual(list(a.sorted(reverse=True)), sorted(self.dates, reverse=True))
+        for d in self.dates[:100] + [date(1700, 1, 1), date(2300, 1, 1)]:
+            self.assertEqual(s.searchsorted(d), sum(x < d for x in self.dates))
+            self.assertEqual(s.searchsorted(d, side='right'), sum(x <= d for x in self.dates))
+        self.assertEqual(s.searchsorted([date(1700, 1, 1), date(2300, 1, 1)]), [0, len(s)])
+        a.sort()
+        self.assertEqual(a, s)
+
+    def test_from_drange(self):
+        ranges = [
+            drange(1 / Jan / 2000, 1 / Jan / 2030),
+            drange(1 / Jan / 2030, 1 / Jan / 2000, -3 * days),
+            drange(31 / Jan / 1850, 1 / Jan / 2300, 1 * months),
+            drange(31 / Dec / 2030, 1 / Jan / 1990, -1 * months),
+            drange(29 / Feb / 2000, 1 / Mar / 2100, 1 * years),
+            drange(1 / Jan / 2020, 1 / Mar / 2020, 1 * bdays),
+            drange(1 / Jan / 2020, 1 / Mar / 2020, MO(2)),
+            drange(1 / Jan / 2020, 1 / Jan / 2020),
+        ]
+        for r in ranges:
+            self.assertEqual(list(r.to_date_array()), list(r))
+            self.assertEqual(list(DateArray.from_iterable(r)), list(r))
+        with self.assertRaises(TypeError):
+            drange((1 / Jan / 2020)[:], (2 / Jan / 2020)[:], 1 * hours).to_date_array()
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dates.bin')
+            self.array.save(path)
+            self.assertEqual(os.path.getsize(path), 16 + 4 * len(self.array))
+
+            self.assertEqual(DateArray.load(path), self.array)
+            mapped = DateArray.load(path, mmap_mode='r')
+            self.assertEqual(mapped, self.array)
+            self.assertEqual(list(mapped[:5] + 1 * months), [d + 1 * months for d in self.dates[:5]])
+            with self.assertRaises(TypeError):
+                mapped.sort()
+            del mapped
+
+            writable = DateArray.load(path, mmap_mode='r+')
+            writable.sort()
+            del writable
+            self.assertEqual(list(DateArray.load(path)), sorted(self.dates))
+
+            with open(path, 'r+b') as f:
+                f.truncate(100)
+            with self.assertRaises(ValueError):
+                DateArray.load(path)
+            with self.assertRaises(ValueError):
+                DateArray.load(path, mmap_mode='r')
+            with self.assertRaises(ValueError):
+                DateArray.load(path, mmap_mode='w')
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_to_array(self):
+        values = DateArray([1 / Jan / 1970, 29 / Feb / 2024, 1 / Mar / 1600]).to_array()
+        self.assertEqual(values.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(list(values.astype(object)), [date(1970, 1, 1), date(2024, 2, 29), date(1600, 3, 1)])
+
+    def test_empty(self):
+        self.assertEqual(list(DateArray()), [])
+        self.assertFalse(DateArray())
+        self.assertEqual(DateArray().searchsorted(1 / Feb / 2000), 0)
@@ -1,7 +1,27 @@
+import copy
+import pickle
 import unittest
-from datetime import date, datetime, timedelta
-from itertools import zip_longest as zipl
-from beautiful_date import Mar, Apr, days, hours, drange
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice, zip_longest as zipl
+
+from dateutil.relativedelta import relativedelta
+from freezegun import freeze_time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover
+    ZoneInfo = None
+
+from beautiful_date import Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sept, Oct, Nov, Dec, \
+    BeautifulDate, BeautifulDatetime, BusinessCalendar, years, months, days, hours, minutes, bdays, drange, \
+    MO, TU, WE, TH, FR, SA, SU, frozen_clock
+from beautiful_date.date_range import delta_sign
 
 
 class TestDrange(unittest.TestCase):
@@ -99,10 +119,413 @@ class TestDrange(unittest.TestCase):
 
     def test_repr(self):
         self.assertEqual(repr(drange(27 / Mar / 1994, 5 / Apr / 1994)),
-                         'drange(1994-03-27, 1994-04-05, BeautifulRelativeDelta(days=+1))')
+                         'drange(1994-03-27, 1994-04-05, BeautifulFixedDelta(days=+1))')
         self.assertEqual(repr(drange((27 / Mar / 1994)[10:25], (4 / Apr / 1994)[10:10], 12 * hours)),
-                         'drange(1994-03-27 10:25:00, 1994-04-04 10:10:00, BeautifulRelativeDelta(hours=+12))')
+                         'drange(1994-03-27 10:25:00, 1994-04-04 10:10:00, BeautifulFixedDelta(hours=+12))')
 
     def test_zero_step_error(self):
         with self.assertRaises(ValueError):
             _ = drange((5 / Apr / 1994), step=0 * days)
+
+    def test_reiterable(self):
+        r = drange(27 / Mar / 1994, 5 / Apr / 1994)
+        self.assertEqual(list(r), list(r))
+        self.assertEqual(len(list(r)), 9)
+
+        r = drange(31 / Jan / 1994, 1 / Jan / 1995, 1 * months)
+        self.assertEqual(list(r), list(r))
+
+    def test_fixed_step_sequence(self):
+        r = drange(1 / Jan / 2020, 1 / Jan / 2021)
+        self.assertEqual(len(r), 366)
+        self.assertEqual(r[0], 1 / Jan / 2020)
+        self.assertEqual(r[59], 29 / Feb / 2020)
+        self.assertEqual(r[-1], 31 / Dec / 2020)
+        self.assertIsInstance(r[10], BeautifulDate)
+        with self.assertRaises(IndexError):
+            _ = r[366]
+
+        self.assertIn(29 / Feb / 2020, r)
+        self.assertNotIn(1 / Jan / 2021, r)
+        self.assertNotIn((1 / Jan / 2020)[10:00], r)
+        self.assertEqual(r.index(29 / Feb / 2020), 59)
+        with self.assertRaises(ValueError):
+            r.index(31 / Dec / 2019)
+
+        weekly = drange(1 / Jan / 2020, 1 / Jan / 2021, 2 * days)
+        self.assertEqual(len(weekly), 183)
+        self.assertNotIn(2 / Jan / 2020, weekly)
+        self.assertEqual(list(weekly), [r[i] for i in range(0, 366, 2)])
+
+        backwards = drange(5 / Apr / 1994, 27 / Mar / 1994, -2 * days)
+        self.assertEqual(len(backwards), 5)
+        self.assertEqual(backwards[-1], 28 / Mar / 1994)
+        self.assertIn(1 / Apr / 1994, backwards)
+        self.assertEqual(len(drange(27 / Mar / 1994, 5 / Apr / 1994, -1 * days)), 0)
+        self.assertFalse(drange(27 / Mar / 1994, 5 / Apr / 1994, -1 * days))
+
+        t = drange((27 / Mar / 1994)[10:25], (4 / Apr / 1994)[10:10], 12 * hours)
+        self.assertEqual(len(t), 16)
+        self.assertEqual(t[-1], (3 / Apr / 1994)[22:25])
+        self.assertIn((1 / Apr / 1994)[10:25], t)
+        self.assertNotIn((1 / Apr / 1994)[10:26], t)
+
+    def test_fixed_step_slicing(self):
+        r = drange(1 / Jan / 2020, 1 / Jan / 2021)
+        self.assertIsInstance(r[::7], drange)
+        self.assertEqual(list(r[::7]), list(r)[::7])
+        self.assertEqual(list(r[10:20]), list(r)[10:20])
+        self.assertEqual(list(r[-5:]), list(r)[-5:])
+        self.assertEqual(list(r[::-3]), list(r)[::-3])
+        self.assertEqual(list(r[20:10]), [])
+        self.assertEqual(list(reversed(r)), list(r)[::-1])
+
+    def test_calendar_step_sequence(self):
+        r = drange(31 / Jan / 2020, 1 / Jan / 2021, 1 * months)
+        expected = [31 / Jan / 2020, 29 / Feb / 2020, 29 / Mar / 2020, 29 / Apr / 2020, 29 / May / 2020,
+                    29 / Jun / 2020, 29 / Jul / 2020, 29 / Aug / 2020, 29 / Sept / 2020, 29 / Oct / 2020,
+                    29 / Nov / 2020, 29 / Dec / 2020]
+        self.assertEqual(list(r), expected)
+        self.assertEqual(len(r), 12)
+        self.assertEqual(r[1], 29 / Feb / 2020)
+        self.assertEqual(r[-1], 29 / Dec / 2020)
+        self.assertIn(29 / Mar / 2020, r)
+        self.assertNotIn(31 / Mar / 2020, r)
+        self.assertEqual(r.index(29 / Apr / 2020), 3)
+        self.assertEqual(list(reversed(r)), expected[::-1])
+
+        self.assertIsInstance(r[1:4], drange)
+        self.assertEqual(list(r[1:4]), expected[1:4])
+        self.assertEqual(list(r[5:]), expected[5:])
+        self.assertEqual(list(r[4:2]), [])
+        self.assertEqual(list(r[::2]), expected[::2])
+
+        # Slices that no calendar step produces are ranges over the dates of the original one
+        for s in (r[::2], r[1::3], r[::-1], r[-2::-4], r[5:1:-2]):
+            self.assertIsInstance(s, drange)
+        self.assertNotEqual(list(r[::2]), list(drange(31 / Jan / 2020, 1 / Jan / 2021, 2 * months)))
+        s = r[::-2]
+        self.assertEqual(list(s), expected[::-2])
+        self.assertEqual(len(s), 6)
+        self.assertEqual(s[1], 29 / Oct / 2020)
+        self.assertEqual(s.index(29 / Aug / 2020), 2)
+        self.assertIn(29 / Jun / 2020, s)
+        self.assertNotIn(29 / Jul / 2020, s)
+        self.assertEqual(list(s[1::2]), expected[-3::-4])
+        self.assertEqual(pickle.loads(pickle.dumps(s)), s)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_to_array_fixed_step(self):
+        r = drange(27 / Mar / 1994, 5 / Apr / 1994, 2 * days)
+        a = r.to_array()
+        self.assertEqual(a.dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(a.tolist(), list(r))
+        self.assertEqual(r.to_numpy('s').dtype, np.dtype('datetime64[s]'))
+
+        r = drange((27 / Mar / 1994)[10:25], (4 / Apr / 1994)[10:10], -7 * hours)
+        self.assertEqual(len(r.to_array()), 0)
+
+        r = drange((4 / Apr / 1994)[10:10], (27 / Mar / 1994)[10:25], -7 * hours)
+        self.assertEqual(r.to_array().tolist(), list(r))
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_to_array_calendar_step(self):
+        r = drange(31 / Jan / 2020, 1 / Jun / 2020, 1 * months)
+        self.assertEqual(r.to_array().tolist(), list(r))
+
+        r = drange((31 / Dec / 2021)[10:30], (1 / Jan / 2019)[:], -1 * months)
+        self.assertEqual(r.to_array().tolist(), list(r))
+
+        r = drange(29 / Feb / 2000, 1 / Jan / 2100, 1 * years)
+        self.assertEqual(r.to_array().tolist(), list(r))
+
+        r = drange(1 / Jan / 2000, 1 / Jan / 2001, 1 * months + 1 * days)
+        self.assertEqual(r.to_array().tolist(), list(r))
+
+    def test_direction(self):
+        self.assertEqual(list(drange(1 / Mar / 2021, 5 / Mar / 2021, 1 * months - 30 * days)),
+                         [1 / Mar / 2021, 2 / Mar / 2021, 3 / Mar / 2021, 4 / Mar / 2021])
+        self.assertEqual(list(drange(31 / Jan / 2021, 1 / Jan / 2021, 1 * months - 30 * days)),
+                         [31 / Jan / 2021, 29 / Jan / 2021])
+        self.assertEqual(list(drange(1 / Jan / 2021, 1 / Feb / 2021, 1 * months + MO(-2), direction='forward')),
+                         [1 / Jan / 2021, 25 / Jan / 2021])
+        self.assertEqual(list(drange(1 / Mar / 2021, 1 / Jan / 2021, 1 * months - 30 * days, direction='backward')),
+                         [1 / Mar / 2021])
+        with self.assertRaises(ValueError):
+            drange(1 / Mar / 2021, 1 / Jan / 2021, 1 * days, direction='up')
+        self.assertEqual(list(drange(1 / Mar / 2021, 4 / Mar / 2021, 1 * days, direction='forward')),
+                         [1 / Mar / 2021, 2 / Mar / 2021, 3 / Mar / 2021])
+        for start, stop, step, direction in ((1 / Jan / 2020, 1 / Jun / 2020, 1 * days, 'backward'),
+                                             (1 / Jun / 2020, 1 / Jan / 2020, 1 * days, 'backward'),
+                                             (1 / Jun / 2020, 1 / Jan / 2020, 1 * months, 'backward'),
+                                             (1 / Jun / 2020, 1 / Jan / 2020, -1 * bdays, 'forward'),
+                                             ((1 / Jan / 2020)[:], (1 / Jun / 2020)[:], -1 * hours, 'forward')):
+            with self.assertRaises(ValueError):
+                drange(start, stop, step, direction=direction)
+
+    def test_plain_relativedelta_step(self):
+        # Plain relativedelta has no bounds() or sign() of its own
+        r = drange(date(2020, 1, 1), date(2020, 7, 1), relativedelta(months=1))
+        self.assertEqual(list(r), [BeautifulDate(2020, m, 1) for m in range(1, 7)])
+        self.assertEqual(len(r), 6)
+        self.assertIn(date(2020, 3, 1), r)
+        self.assertEqual(list(drange(date(2020, 7, 1), date(2020, 1, 1), relativedelta(months=-2))),
+                         [1 / Jul / 2020, 1 / May / 2020, 1 / Mar / 2020])
+        self.assertEqual(list(drange(date(2020, 1, 1), date(2020, 1, 10), relativedelta(days=3))),
+                         [1 / Jan / 2020, 4 / Jan / 2020, 7 / Jan / 2020])
+        self.assertEqual(list(drange(1 / Mar / 2021, 4 / Mar / 2021, relativedelta(months=1, days=-30))),
+                         [1 / Mar / 2021, 2 / Mar / 2021, 3 / Mar / 2021])
+        self.assertEqual(delta_sign(relativedelta(months=1)), 1)
+        self.assertEqual(delta_sign(relativedelta(months=1, days=-30)), None)
+        self.assertEqual(delta_sign(relativedelta(months=1, days=-30), 1 / Mar / 2021), 1)
+
+    def test_direction_does_not_depend_on_current_time(self):
+        # The step moves 31/Jan backward and 1/Mar forward, so taking its sign at the current time
+        # would reverse one of the ranges at each of the times
+        step = 1 * months - 30 * days
+        for now in [(31 / Jan / 2021)[:], (1 / Mar / 2021)[:]]:
+            with freeze_time(now), frozen_clock(now):
+                self.assertEqual(list(drange(1 / Mar / 2021, 5 / Mar / 2021, step)),
+                                 [1 / Mar / 2021, 2 / Mar / 2021, 3 / Mar / 2021, 4 / Mar / 2021])
+                self.assertEqual(list(drange(31 / Jan / 2021, 1 / Jan / 2021, step)),
+                                 [31 / Jan / 2021, 29 / Jan / 2021])
+
+    def test_stream_weekdays(self):
+        r = drange(1 / Jan / 2021, 1 / Jan / 2022)
+        expected = [d for d in r if d.weekday() == 0]
+        mondays = r.filter(weekday=MO)
+        self.assertEqual(list(mondays), expected)
+        self.assertEqual(list(mondays), expected)
+        self.assertEqual(list(r.filter(weekday=0)), expected)
+
+        weekends = r.filter(weekday=[SA, SU])
+        self.assertEqual(list(weekends), [d for d in r if d.weekday() >= 5])
+        self.assertEqual(list(r.filter(weekday=[SA, SU]).filter(weekday=SU)), [d for d in r if d.weekday() == 6])
+
+        backwards = drange(1 / Jan / 2021, 1 / Jan / 2020, -3 * days)
+        self.assertEqual(list(backwards.filter(weekday=[MO, FR])), [d for d in backwards if d.weekday() in (0, 4)])
+
+        hourly = drange((1 / Jan / 2021)[:], (20 / Jan / 2021)[:], 5 * hours)
+        self.assertEqual(list(hourly.filter(weekday=SU)), [d for d in hourly if d.weekday() == 6])
+
+        monthly = drange(1 / Jan / 2021, 1 / Jan / 2022, 1 * months)
+        self.assertEqual(list(monthly.filter(weekday=MO)), [1 / Feb / 2021, 1 / Mar / 2021, 1 / Nov / 2021])
+
+    def test_stream_operations(self):
+        r = drange(1 / Jan / 2021, 1 / Jan / 2022)
+        self.assertEqual(list(r.filter(weekday=MO, day=range(1, 8)).take(3)),
+                         [4 / Jan / 2021, 1 / Feb / 2021, 1 / Mar / 2021])
+        self.assertEqual(list(r.filter(month=[Feb, 3], day=1)), [1 / Feb / 2021, 1 / Mar / 2021])
+        self.assertEqual(list(r.filter(lambda d: d.day == 31, month=Jan)), [31 / Jan / 2021])
+        self.assertEqual(list(r.every(100)), [1 / Jan / 2021, 11 / Apr / 2021, 20 / Jul / 2021, 28 / Oct / 2021])
+        self.assertEqual(list(r.take(0)), [])
+        self.assertEqual(list(r.take(2).map(str)), ['2021-01-01', '2021-01-02'])
+
+        holidays = [1 / Jan / 2021, 6 / Jan / 2021]
+        self.assertEqual(list(r.take(7).exclude(holidays)),
+                         [2 / Jan / 2021, 3 / Jan / 2021, 4 / Jan / 2021, 5 / Jan / 2021, 7 / Jan / 2021])
+        hourly = drange((1 / Jan / 2021)[:], (3 / Jan / 2021)[:], 12 * hours)
+        self.assertEqual(list(hourly.exclude(holidays)), [(2 / Jan / 2021)[:], (2 / Jan / 2021)[12:]])
+
+        self.assertEqual(list(r.take(10).chunk(4).map(len)), [4, 4, 2])
+        weeks = list(r.filter(weekday=[MO, TU, WE, TH, FR]).chunk(5).take(2))
+        self.assertEqual(weeks, [(1 / Jan / 2021, 4 / Jan / 2021, 5 / Jan / 2021, 6 / Jan / 2021, 7 / Jan / 2021),
+                                 (8 / Jan / 2021, 11 / Jan / 2021, 12 / Jan / 2021, 13 / Jan / 2021, 14 / Jan / 2021)])
+
+        monthly = drange(31 / Jan / 2020, 1 / Jan / 2021, 1 * months)
+        self.assertEqual(list(monthly.every(5).take(2)), [31 / Jan / 2020, 29 / Jun / 2020])
+
+        with self.assertRaises(ValueError):
+            r.chunk(0)
+        with self.assertRaises(ValueError):
+            r.every(0)
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo is not available')
+    def test_timezone_absolute(self):
+        tz = ZoneInfo('Europe/Prague')
+        r = drange((26 / Oct / 2025)[:], (26 / Oct / 2025)[5:], 30 * minutes, tz=tz, mode='absolute')
+        expected = [datetime(2025, 10, 25, 22, tzinfo=timezone.utc) + i * timedelta(minutes=30) for i in range(12)]
+        # Datetimes with repeated wall time never equal datetimes of other timezones (PEP 495)
+        self.assertEqual([d.timestamp() for d in r], [d.timestamp() for d in expected])
+        self.assertEqual(len(r), 12)
+        self.assertEqual([(d.hour, d.minute, d.fold) for d in r][4:8],
+                         [(2, 0, 0), (2, 30, 0), (2, 0, 1), (2, 30, 1)])
+        for d in r:
+            self.assertIs(d.tzinfo, tz)
+            self.assertEqual(d.utcoffset(), d.astimezone(tz).utcoffset())
+        self.assertEqual(r[6].timestamp(), expected[6].timestamp())
+        self.assertEqual(r[6].fold, 1)
+        self.assertEqual([d.timestamp() for d in r[::5]], [d.timestamp() for d in expected[::5]])
+        self.assertEqual([d.timestamp() for d in reversed(r)], [d.timestamp() for d in expected[::-1]])
+        self.assertIn(expected[7], r)
+        self.assertEqual(r.index(expected[7]), 7)
+        self.assertNotIn((26 / Oct / 2025)[2:], r)
+
+        hourly = drange((1 / Jan / 2020)[:], (1 / Jan / 2023)[:], 7 * hours, tz=tz, mode='absolute')
+        expected = drange(hourly[0].astimezone(timezone.utc), hourly[-1] + 1 * hours, 7 * hours)
+        self.assertEqual([d.timestamp() for d in hourly], [d.timestamp() for d in expected])
+        self.assertEqual([d.utcoffset() for d in hourly], [d.astimezone(tz).utcoffset() for d in hourly])
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo is not available')
+    def test_timezone_wall(self):
+        tz = ZoneInfo('America/New_York')
+        r = drange((7 / Mar / 2025)[2:30], (11 / Mar / 2025)[:], 1 * days, tz=tz)
+        self.assertEqual([d.hour for d in r], [2, 2, 3, 2])
+        self.assertEqual([d.utcoffset() for d in r], [timedelta(hours=h) for h in (-5, -5, -4, -4)])
+        self.assertEqual(r[2], datetime(2025, 3, 9, 3, 30, tzinfo=tz))
+        self.assertEqual(r[3], datetime(2025, 3, 10, 7, 30, tzinfo=timezone.utc) - 1 * hours)
+
+        r = drange((2 / Nov / 2025)[1:30], (5 / Nov / 2025)[:], 1 * days, tz=tz)
+        self.assertEqual(r[0].utcoffset(), timedelta(hours=-4))
+        self.assertEqual(r[0].fold, 0)
+
+        start = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+        r = drange(start, (1 / Jun / 2025)[:], 1 * months, tz=tz)
+        self.assertEqual([(d.month, d.hour) for d in r], [(3, 7), (4, 7), (5, 7)])
+        self.assertIn(datetime(2025, 4, 1, 7, tzinfo=tz), r)
+        self.assertNotIn(datetime(2025, 4, 1, 7), r)
+        self.assertEqual(repr(drange((1 / Jan / 2025)[:], (3 / Jan / 2025)[:], tz=tz)),
+                         "drange(2025-01-01 00:00:00-05:00, 2025-01-03 00:00:00-05:00, "
+                         "BeautifulFixedDelta(days=+1), tz=America/New_York, mode='wall')")
+        self.assertEqual(list(drange(1 / Jan / 2025, 3 / Jan / 2025, tz=tz).filter(weekday=TH)),
+                         [datetime(2025, 1, 2, tzinfo=tz)])
+
+        with self.assertRaises(ValueError):
+            drange(1 / Jan / 2025, 3 / Jan / 2025, tz=tz, mode='local')
+
+    @unittest.skipIf(ZoneInfo is None, 'zoneinfo is not available')
+    def test_timezone_wall_spring_forward(self):
+        tz = ZoneInfo('Europe/Prague')
+        # 02:00-03:00 doesn't exist on 30/Mar/2025, moving 02:00 forward would repeat 03:00
+        r = drange(datetime(2025, 3, 30, 0), datetime(2025, 3, 30, 5), 1 * hours, tz=tz)
+        expected = [datetime(2025, 3, 30, h, tzinfo=tz) for h in (0, 1, 3, 4)]
+        self.assertEqual(list(r), expected)
+        self.assertEqual(len(r), 4)
+        self.assertEqual([r[i] for i in range(-4, 4)], expected * 2)
+        self.assertEqual([r.index(d) for d in expected], [0, 1, 2, 3])
+        self.assertEqual(list(reversed(r)), expected[::-1])
+        self.assertEqual(list(r[1:]), expected[1:])
+        self.assertEqual(list(r[::2]), expected[::2])
+        self.assertIsInstance(r[::2], drange)
+        self.assertEqual(list(r[::-1]), expected[::-1])
+        self.assertEqual(list(r.bucketize([datetime(2025, 3, 30, 1, 30, tzinfo=tz), expected[2]])), [1, 2])
+        self.assertEqual([d.utcoffset() for d in r], [timedelta(hours=h) for h in (1, 1, 2, 2)])
+        for d in r:
+            self.assertIsInstance(d, BeautifulDatetime)
+
+        # Backwards and with steps not dividing the gap, the nonexistent wall times are left out as well
+        r = drange(datetime(2025, 3, 30, 4), datetime(2025, 3, 30, 0), -25 * minutes, tz=tz)
+        self.assertEqual([(d.hour, d.minute) for d in r],
+                         [(4, 0), (3, 35), (3, 10), (1, 55), (1, 30), (1, 5), (0, 40), (0, 15)])
+        self.assertEqual(len(r), 8)
+        self.assertEqual(r.index(datetime(2025, 3, 30, 1, 5, tzinfo=tz)), 5)
+
+        # Steps longer than the gap move the nonexistent wall time forward
+        r = drange(datetime(2025, 3, 30, 0), datetime(2025, 3, 30, 5), 2 * hours, tz=tz)
+        self.assertEqual([d.hour for d in r], [0, 3, 4])
+        self.assertIn(datetime(2025, 3, 30, 3, tzinfo=tz), r)
+        self.assertEqual(r.index(datetime(2025, 3, 30, 3, tzinfo=tz)), 1)
+        self.assertNotIn(datetime(2025, 3, 30, 3, tzinfo=tz), drange(datetime(2025, 3, 30, 0),
+                                                                     datetime(2025, 3, 30, 5), 25 * minutes, tz=tz))
+
+        # Zones can be given by name
+        start, stop = datetime(2025, 3, 30, 0), datetime(2025, 3, 30, 5)
+        self.assertEqual(drange(start, stop, 1 * hours, tz='Europe/Prague'), drange(start, stop, 1 * hours, tz=tz))
+        self.assertEqual(list(drange(start, stop, 1 * hours, tz='Europe/Prague')), expected)
+        with self.assertRaises(TypeError):
+            drange(start, stop, 1 * hours, tz=1)
+
+        # Repeated wall times are in the range only the first time they occur
+        r = drange(datetime(2025, 10, 26, 0), datetime(2025, 10, 26, 5), 1 * hours, tz=tz)
+        self.assertIn(datetime(2025, 10, 26, 2, tzinfo=tz), r)
+        self.assertNotIn(datetime(2025, 10, 26, 2, fold=1, tzinfo=tz), r)
+
+    def test_split_and_partitions(self):
+        cal = BusinessCalendar(holidays=[25 / Dec / 2020])
+        ranges = [
+            drange((1 / Jan / 2000)[:], (1 / Jan / 2001)[:], 20 * minutes),
+            drange(1 / Jan / 2021, 1 / Jan / 2020, -1 * days),
+            drange(31 / Jan / 2000, 1 / Jan / 2020, 1 * months),
+            drange(1 / Jan / 2020, 1 / Jan / 2021, 1 * cal.bdays),
+            drange(1 / Jan / 2020, 5 / Jan / 2020),
+        ]
+        if ZoneInfo is not None:
+            ranges.append(drange(1 / Jan / 2020, 1 / Jan / 2021, 5 * hours, tz=ZoneInfo('Europe/Prague')))
+
+        for r in ranges:
+            expected = list(r)
+            for n in (1, 3, 7):
+                parts = r.split(n)
+                self.assertEqual(len(parts), n)
+                self.assertEqual([d for part in parts for d in part], expected)
+                self.assertLessEqual(max(map(len, parts)) - min(map(len, parts)), 1)
+            chunks = list(r.partitions(100))
+            self.assertEqual([d for chunk in chunks for d in chunk], expected)
+            self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+            self.assertEqual([list(pickle.loads(pickle.dumps(part))) for part in r.split(3)],
+                             [list(part) for part in r.split(3)])
+
+        self.assertEqual(list(map(repr, drange(1 / Jan / 2020, 1 / Jan / 2021).split(2))),
+                         [repr(drange(1 / Jan / 2020, 2 / Jul / 2020)), repr(drange(2 / Jul / 2020, 1 / Jan / 2021))])
+        with self.assertRaises(ValueError):
+            drange(1 / Jan / 2020, 1 / Jan / 2021).split(0)
+        with self.assertRaises(ValueError):
+            next(drange(1 / Jan / 2020, 1 / Jan / 2021).partitions(0))
+
+    def test_pickle_and_hash(self):
+        ranges = [drange(1 / Jan / 2020, 1 / Jan / 2021), drange(31 / Jan / 2020, 1 / Jan / 2021, 1 * months),
+                  drange(1 / Jan / 2021, 1 / Jan / 2020, -1 * months), drange(1 / Jan / 2020, 1 / Mar / 2020, MO),
+                  drange(1 / Jan / 2021, 1 / Jan / 2020, -1 * days, direction='backward'),
+                  drange(1 / Jan / 2020, 1 / Jan / 2021, 1 * months - 30 * days, direction='forward')]
+        if ZoneInfo is not None:
+            tz = ZoneInfo('Europe/Prague')
+            ranges += [drange((28 / Mar / 2020)[:], (30 / Mar / 2020)[:], 5 * hours, tz=tz, mode=mode)
+                       for mode in ('wall', 'absolute')]
+        for r in ranges:
+            expected = list(r)
+            restored = pickle.loads(pickle.dumps(r))
+            self.assertEqual(restored, r)
+            self.assertEqual(hash(restored), hash(r))
+            self.assertEqual(list(restored), expected)
+            self.assertEqual(list(r), expected)
+            self.assertIs(copy.copy(r), r)
+        self.assertEqual(len(set(ranges + [drange(1 / Jan / 2020, 1 / Jan / 2021)])), len(ranges))
+        self.assertNotEqual(drange(1 / Jan / 2020, 1 / Jan / 2021), drange(1 / Jan / 2020, 1 / Jan / 2021, 2 * days))
+
+        # Cached dates of the range aren't pickled
+        r = drange(1 / Jan / 2000, 1 / Jan / 2100, 1 * months)
+        size = len(pickle.dumps(r))
+        r[-1]
+        self.assertEqual(len(pickle.dumps(r)), size)
+
+    def test_parallel_map(self):
+        r = drange(1 / Jan / 2020, 1 / Jan / 2022)
+        expected = [d.weekday() for d in r]
+        with ThreadPoolExecutor(4) as executor:
+            self.assertEqual(list(r.parallel_map(date.weekday, executor, chunk_size=30)), expected)
+            self.assertEqual(sorted(r.parallel_map(date.weekday, executor, ordered=False, chunk_size=30,
+                                                   max_in_flight=3)), sorted(expected))
+
+            submitted = []
+            results = r.parallel_map(date.weekday, _RecordingExecutor(executor, submitted), chunk_size=10,
+                                     max_in_flight=2)
+            next(results)
+            self.assertEqual(len(submitted), 2)
+            list(islice(results, 10))
+            self.assertEqual(len(submitted), 3)
+            with self.assertRaises(ValueError):
+                next(r.parallel_map(date.weekday, executor, max_in_flight=0))
+
+        with ProcessPoolExecutor(2) as executor:
+            self.assertEqual(list(r.parallel_map(date.weekday, executor, chunk_size=100)), expected)
+        self.assertEqual(list(r[:20].parallel_map(date.weekday)), expected[:20])
+
+
+class _RecordingExecutor:
+    def __init__(self, executor, submitted):
+        self.executor = executor
+        self.submitted = submitted
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        return self.executor.submit(fn, *args)
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Cumulative time of "import beautiful_date" in microseconds (best of several runs with compiled bytecode)
+# that shouldn't be exceeded. It is about 6500us, the rest is the margin for slower machines.
+IMPORT_TIME_BUDGET = 10000
+
+
+def _import_times(code, env=None):
+    """Runs code in a new interpreter with -X importtime. Returns {module: cumulative import time in us}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True, env=env)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class TestImport(unittest.TestCase):
+
+    def test_dsl_does_not_import_dateutil(self):
+        times = _import_times('from beautiful_date import D, Jan, Oct\n'
+                              'D @ 16/10/1995, 16/Oct/1995, (16/Jan/1995)[10:30]')
+        self.assertIn('beautiful_date', times)
+        for module in ('dateutil', 'beautiful_date.beautiful_timedelta', 'beautiful_date.date_range',
+                       'beautiful_date.business_days', 'beautiful_date.recurrence'):
+            self.assertNotIn(module, times)
+
+    def test_deltas_are_imported_on_access(self):
+        # Modules loaded with import_module() aren't reported by -X importtime, so sys.modules is checked instead
+        subprocess.run([sys.executable, '-c', 'import sys\n'
+                        'from beautiful_date import Oct\n'
+                        'assert "dateutil" not in sys.modules\n'
+                        'from beautiful_date import days\n'
+                        'assert 16/Oct/1995 + 2*days == 18/Oct/1995\n'
+                        'assert "beautiful_date.beautiful_timedelta" in sys.modules\n'
+                        'from beautiful_date import *\n'
+                        'drange, every, bdays, MO, compile_delta\n'
+                        'assert "beautiful_date.recurrence" in sys.modules'], check=True)
+
+    def test_import_time(self):
+        with tempfile.TemporaryDirectory() as cache:
+            # Bytecode is written to the separate cache by the first run, so compiling isn't measured
+            env = dict(os.environ, PYTHONPYCACHEPREFIX=cache)
+            env.pop('PYTHONDONTWRITEBYTECODE', None)
+            _import_times('import beautiful_date', env)
+            best = min(_import_times('import beautiful_date', env)['beautiful_date'] for _ in range(5))
+        self.assertLess(best, IMPORT_TIME_BUDGET)
+
+    def test_lazy_attributes(self):
+        import beautiful_date
+        self.assertIs(beautiful_date.days, beautiful_date.beautiful_timedelta.days)
+        self.assertIn('drange', dir(beautiful_date))
+        with self.assertRaises(AttributeError):
+            beautiful_date.weeekdays
@@ -0,0 +1,115 @@
+import random
+import unittest
+from datetime import date, timedelta
+
+from beautiful_date import Jan, Feb, Oct, DatePeriod, IntervalSet, period, days, hours, drange
+
+
+def _days(interval_set, within):
+    return {d for d in drange(within.start, within.end) if d in interval_set}
+
+
+class TestDatePeriod(unittest.TestCase):
+
+    def test_create(self):
+        p = (16 / Oct / 1995) >> (20 / Oct / 1995)
+        self.assertEqual(p, DatePeriod(16 / Oct / 1995, 20 / Oct / 1995))
+        self.assertEqual((16 / Oct / 1995) >> 4 * days, p)
+        self.assertEqual(period(16 / Oct / 1995, 4 * days), p)
+        self.assertEqual(period(16 / Oct / 1995, 20 / Oct / 1995), p)
+        self.assertEqual(repr(p), 'DatePeriod(1995-10-16, 1995-10-20)')
+        self.assertEqual(p.duration, timedelta(days=4))
+        self.assertEqual(period((16 / Oct / 1995)[10:], 2 * hours).end, (16 / Oct / 1995)[12:])
+        self.assertEqual(hash(p), hash(period(16 / Oct / 1995, 4 * days)))
+        self.assertFalse((16 / Oct / 1995) >> (16 / Oct / 1995))
+        with self.assertRaises(AttributeError):
+            p.end = 15 / Oct / 1995
+        self.assertEqual(p.end, 20 / Oct / 1995)
+        with self.assertRaises(ValueError):
+            (20 / Oct / 1995) >> (16 / Oct / 1995)
+
+    def test_operations(self):
+        p = (16 / Oct / 1995) >> (20 / Oct / 1995)
+        self.assertIn(16 / Oct / 1995, p)
+        self.assertNotIn(20 / Oct / 1995, p)
+        self.assertIn((17 / Oct / 1995) >> (19 / Oct / 1995), p)
+        self.assertTrue(p.overlaps((19 / Oct / 1995) >> (25 / Oct / 1995)))
+        self.assertFalse(p.overlaps((20 / Oct / 1995) >> (25 / Oct / 1995)))
+        self.assertEqual(p & ((19 / Oct / 1995) >> (25 / Oct / 1995)), (19 / Oct / 1995) >> (20 / Oct / 1995))
+        self.assertIsNone(p & ((20 / Oct / 1995) >> (25 / Oct / 1995)))
+        self.assertEqual(p | ((20 / Oct / 1995) >> (25 / Oct / 1995)),
+                         IntervalSet([(16 / Oct / 1995) >> (25 / Oct / 1995)]))
+        self.assertEqual(p - ((17 / Oct / 1995) >> (18 / Oct / 1995)),
+                         IntervalSet([(16 / Oct / 1995) >> (17 / Oct / 1995), (18 / Oct / 1995) >> (20 / Oct / 1995)]))
+
+
+class TestIntervalSet(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(13)
+        self.within = (1 / Jan / 2020) >> (1 / Jan / 2021)
+
+        def random_periods(n):
+            periods = []
+            for _ in range(n):
+                start = date(2020, 1, 1) + timedelta(days=rng.randrange(366))
+                periods.append((start, start + timedelta(days=rng.randrange(1, 15))))
+            return periods
+
+        self.a = random_periods(40)
+        self.b = random_periods(40)
+
+    def test_bulk_construction(self):
+        s = IntervalSet(self.a)
+        expected = {d for d in drange(self.within.start, self.within.end) if any(a <= d < b for a, b in self.a)}
+        self.assertEqual(_days(s, self.within), expected)
+        for first, second in zip(s, s[1:]):
+            self.assertLess(first.end, second.start)
+        self.assertEqual(s.duration, timedelta(days=len(expected)))
+        self.assertEqual(IntervalSet(reversed(self.a)), s)
+
+        bookings = IntervalSet([(1 / Jan / 2024) >> (5 / Jan / 2024), (3 / Jan / 2024) >> (8 / Jan / 2024),
+                                (10 / Jan / 2024, 12 / Jan / 2024), (12 / Jan / 2024, 12 / Jan / 2024)])
+        self.assertEqual(list(bookings), [(1 / Jan / 2024) >> (8 / Jan / 2024), (10 / Jan / 2024) >> (12 / Jan / 2024)])
+        self.assertEqual(repr(IntervalSet()), 'IntervalSet([])')
+        self.assertFalse(IntervalSet())
+        self.assertEqual(IntervalSet().duration, timedelta(0))
+
+    def test_set_algebra(self):
+        a, b = IntervalSet(self.a), IntervalSet(self.b)
+        days_a, days_b = _days(a, self.within), _days(b, self.within)
+        self.assertEqual(_days(a | b, self.within), days_a | days_b)
+        self.assertEqual(_days(a & b, self.within), days_a & days_b)
+        self.assertEqual(_days(a - b, self.within), days_a - days_b)
+        self.assertEqual(_days(b - a, self.within), days_b - days_a)
+        self.assertEqual(a | b, IntervalSet(self.a + self.b))
+        self.assertEqual(a.union(b), b.union(a))
+        self.assertEqual(a.intersection(b), b & a)
+        self.assertEqual(a - IntervalSet(), a)
+        self.assertEqual(a & IntervalSet(), IntervalSet())
+
+    def test_queries(self):
+        s = IntervalSet(self.a)
+        for d in drange(self.within.start, self.within.end):
+            self.assertEqual(d in s, any(a <= d < b for a, b in self.a))
+
+        for start, end in self.b:
+            p = DatePeriod(start, end)
+            expected = [q for q in s if q.overlaps(p)]
+            self.assertEqual(s.overlapping(p), expected)
+            self.assertEqual(s.overlaps(p), bool(expected))
+            self.assertEqual(p in s, all(d in s for d in drange(start, end)))
+
+    def test_gaps(self):
+        s = IntervalSet([(1 / Jan / 2024) >> (8 / Jan / 2024), (10 / Jan / 2024) >> (12 / Jan / 2024)])
+        self.assertEqual(s.gaps(), IntervalSet([(8 / Jan / 2024) >> (10 / Jan / 2024)]))
+        self.assertEqual(s.gaps((5 / Jan / 2024) >> (1 / Feb / 2024)),
+                         IntervalSet([(8 / Jan / 2024) >> (10 / Jan / 2024), (12 / Jan / 2024) >> (1 / Feb / 2024)]))
+        self.assertEqual(IntervalSet().gaps((1 / Jan / 2024, 1 / Feb / 2024)),
+                         IntervalSet([(1 / Jan / 2024) >> (1 / Feb / 2024)]))
+
+        a = IntervalSet(self.a)
+        self.assertEqual(_days(a.gaps(self.within), self.within),
+                         set(drange(self.within.start, self.within.end)) - _days(a, self.within))
+        self.assertEqual(a.gaps(self.within) | a & IntervalSet([self.within]), IntervalSet([self.within]))
+        self.assertIsInstance((1 / Feb / 2024) >> 1 * days, DatePeriod)
@@ -0,0 +1,103 @@
+import gc
+import unittest
+from datetime import date, datetime
+from itertools import islice
+
+from beautiful_date import Jan, Feb, Mar, Jun, Jul, Sept, Oct, Nov, Dec, BeautifulDate, BusinessCalendar, Recurrence, \
+    every, years, months, weeks, days, hours, day, bdays, drange, MO, TU, FR, SA, frozen_clock
+from beautiful_date.recurrence import _expansion
+
+
+class TestRecurrence(unittest.TestCase):
+
+    def assert_matches_scan(self, rule, start, end, predicate):
+        expected = [d for d in drange(start, end) if predicate(d)]
+        self.assertEqual(rule.between(start, end), expected)
+        for d in drange(start, end, 11 * days):
+            following = [e for e in expected if e > d]
+            if following:
+                self.assertEqual(rule.next_after(d), following[0])
+
+    def test_weekdays(self):
+        self.assert_matches_scan(every(1 * months).on(TU(2)), 1 / Jan / 2020, 1 / Jan / 2024,
+                                 lambda d: d.weekday() == 1 and 8 <= d.day <= 14)
+        self.assert_matches_scan(every(1 * months).on(FR(-1)), 1 / Jan / 2020, 1 / Jan / 2024,
+                                 lambda d: d.weekday() == 4 and (d + 7 * days).month != d.month)
+        self.assert_matches_scan(every(1 * months).on(TU(5)), 1 / Jan / 2020, 1 / Jan / 2024,
+                                 lambda d: d.weekday() == 1 and d.day > 28)
+        self.assert_matches_scan(every(1 * weeks).on(MO, FR), 1 / Jan / 2020, 1 / Jan / 2022,
+                                 lambda d: d.weekday() in (0, 4))
+
+    def test_business_days(self):
+        cal = BusinessCalendar(holidays=[29 / Mar / 2024, 31 / Dec / 2024])
+        rule = every(3 * months).on(-1 * cal.bdays)
+        self.assertEqual(rule.between(1 / Jan / 2024, 1 / Jan / 2025),
+                         [28 / Mar / 2024, 28 / Jun / 2024, 30 / Sept / 2024, 30 / Dec / 2024])
+        self.assertEqual(every(1 * months).on(1 * bdays, 2 * bdays).between(1 / Jun / 2024, 1 / Jul / 2024),
+                         [3 / Jun / 2024, 4 / Jun / 2024])
+        self.assertEqual(every(1 * months).on(0 * bdays).next_after(3 / Jun / 2024), 1 / Jul / 2024)
+
+    def test_deltas_and_start(self):
+        self.assert_matches_scan(every(1 * months).on(31 * day), 1 / Jan / 2020, 1 / Jan / 2022,
+                                 lambda d: (d + 1 * days).day == 1)
+        self.assertEqual(every(1 * years).on(1 * months + 28 * day).between(1 / Jan / 2020, 1 / Jan / 2022),
+                         [28 / Feb / 2020, 28 / Feb / 2021])
+        self.assertEqual(every(1 * years).between(1 / Mar / 2020, 1 / Mar / 2022), [1 / Jan / 2021, 1 / Jan / 2022])
+
+        rule = every(2 * weeks, start=3 / Jan / 2024).on(SA)
+        self.assertEqual(rule.between(1 / Jan / 2023, 1 / Feb / 2024), [6 / Jan / 2024, 20 / Jan / 2024])
+        self.assertEqual(rule.next_after(1 / Jan / 2000), 6 / Jan / 2024)
+        self.assertEqual(rule.next_after((6 / Jan / 2024)[10:]), 20 / Jan / 2024)
+        self.assertEqual(list(islice(rule, 3)), [6 / Jan / 2024, 20 / Jan / 2024, 3 / Feb / 2024])
+
+        rule = every(1 * months, start=15 / Oct / 1995).on(1 * day, 20 * day)
+        self.assertEqual(rule.between(1 / Jan / 1995, 1 / Dec / 1995),
+                         [20 / Oct / 1995, 1 / Nov / 1995, 20 / Nov / 1995])
+
+        with frozen_clock(datetime(2024, 1, 10)):
+            self.assertEqual(list(islice(every(1 * months).on(MO), 2)), [5 / Feb / 2024, 4 / Mar / 2024])
+
+    def test_no_occurrences(self):
+        rule = every(1 * months).on(TU(6))
+        self.assertIsNone(rule.next_after(1 / Jan / 2024))
+        self.assertEqual(list(rule.after(1 / Jan / 2024)), [])
+        self.assertEqual(every(1 * years).on(TU(5)).between(1 / Jan / 2020, 1 / Jan / 2021), [4 / Feb / 2020])
+        self.assertEqual(every(1 * years).on(TU(54)).between(1 / Jan / 2020, 1 / Jan / 2021), [])
+
+    def test_batch_and_cache(self):
+        rule = every(1 * months).on(TU(2))
+        starts = list(drange(1 / Jan / 2020, 1 / Jan / 2021, 3 * days))
+        self.assertEqual(rule.next_after_many(starts), [rule.next_after(d) for d in starts])
+        self.assertIsInstance(rule.next_after(date(2020, 1, 1)), BeautifulDate)
+
+        _expansion.cache_clear()
+        every(1 * months).on(TU(2)).between(1 / Jan / 2020, 1 / Jan / 2021)
+        every(1 * months).on(TU(2)).between(1 / Jan / 2020, 1 / Jan / 2021)
+        self.assertEqual(_expansion.cache_info().hits, 13)
+        self.assertEqual(hash(every(1 * months).on(TU(2))), hash(rule))
+
+    def test_batch_unordered(self):
+        rule = every(3 * months, start=15 / Feb / 2020).on(-1 * bdays)
+        dates = [16 / Oct / 1995, 30 / Dec / 2024, 1 / Jan / 2021, 16 / Oct / 1995, 31 / Dec / 2060, date(2021, 3, 31),
+                 (30 / Jun / 2020)[23:59]]
+        self.assertEqual(rule.next_after_many(dates), [rule.next_after(d) for d in dates])
+        self.assertEqual(rule.next_after_many([]), [])
+        self.assertEqual(every(1 * months).on(TU(6)).next_after_many([1 / Jan / 2024, 1 / Jan / 2020]), [None, None])
+
+    def test_cache_releases_rules(self):
+        _expansion.cache_clear()
+        every(1 * months).on(TU(2)).between(1 / Jan / 2020, 1 / Jan / 2021)
+        gc.collect()
+        self.assertEqual([o for o in gc.get_objects() if isinstance(o, Recurrence)], [])
+        self.assertEqual(_expansion.cache_info().currsize, 13)
+
+    def test_invalid_steps(self):
+        self.assertEqual(repr(every(2 * weeks, start=1 / Jan / 2024).on(MO, FR)),
+                         'every(BeautifulFixedDelta(days=+14), start=2024-01-01).on(MO, FR)')
+        self.assertIsInstance(every(1 * days), Recurrence)
+        with self.assertRaises(ValueError):
+            every(1 * months + 1 * days)
+        with self.assertRaises(ValueError):
+            every(5 * hours)
+        with self.assertRaises(ValueError):
+            every(-1 * months)
@@ -0,0 +1,135 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from dateutil.relativedelta import relativedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from beautiful_date import Jan, Apr, Oct, BeautifulDate, BeautifulDatetime, DateArray, floor, ceil, floor_many, \
+    ceil_many, round_many, years, months, weeks, days, hours, minutes, seconds, MO, SU
+from beautiful_date.rounding import round as round_to
+
+
+def as_timedelta(unit):
+    if isinstance(unit, relativedelta):
+        return timedelta(days=unit.days, hours=unit.hours, minutes=unit.minutes, seconds=unit.seconds)
+    return unit
+
+
+def expected_floor(d, unit):
+    """Floor by walking from the origin with relativedelta/timedelta, for comparison."""
+    if isinstance(unit, relativedelta) and (unit.years or unit.months):
+        n = unit.years * 12 + unit.months
+        first = d.replace(day=1)
+        if isinstance(d, datetime):
+            first = first.replace(hour=0, minute=0, second=0, microsecond=0)
+        return first - relativedelta(months=(d.year * 12 + d.month - 1) % n)
+    unit = as_timedelta(unit)
+    origin = datetime(1, 1, 1) if isinstance(d, datetime) else date(1, 1, 1)
+    return d - (d - origin) % unit
+
+
+class TestRounding(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(23)
+        first, last = datetime(1899, 1, 1), datetime(2101, 1, 1)
+        self.datetimes = [first + timedelta(microseconds=rng.randrange((last - first) // timedelta(microseconds=1)))
+                          for _ in range(300)]
+        self.datetimes += [datetime(2020, 1, 1), datetime(2020, 3, 1), datetime(2020, 1, 6, 12)]
+        self.dates = [d.date() for d in self.datetimes]
+
+    def test_floor_ceil_round(self):
+        units = [1 * years, 3 * months, 1 * months, 2 * weeks, 1 * weeks, 3 * days, 1 * days,
+                 6 * hours, 15 * minutes, 7 * seconds, relativedelta(hours=1), timedelta(minutes=1)]
+        for unit in units:
+            for d in self.datetimes + self.dates:
+                sub_day = not (isinstance(unit, relativedelta) and (unit.years or unit.months)) and \
+                    as_timedelta(unit) % timedelta(days=1)
+                if not isinstance(d, datetime) and sub_day:
+                    d = datetime(d.year, d.month, d.day)
+                f, c, r = floor(d, unit), ceil(d, unit), round_to(d, unit)
+                self.assertEqual(f, expected_floor(d, unit), (d, unit))
+                self.assertEqual(type(f), type(c))
+                self.assertLessEqual(f, d)
+                self.assertGreaterEqual(c, d)
+                if f == d:
+                    self.assertEqual(c, d)
+                else:
+                    self.assertEqual(c, f + unit)
+                self.assertEqual(r, c if d - f >= c - d else f)
+
+    def test_types(self):
+        self.assertEqual(floor(date(1995, 10, 16), 1 * months), 1 / Oct / 1995)
+        self.assertIsInstance(floor(date(1995, 10, 16), 1 * months), BeautifulDate)
+        self.assertIsInstance(floor(datetime(1995, 10, 16, 10), 1 * hours), datetime)
+        self.assertIs(type(floor((16 / Oct / 1995)[10:30], 1 * hours)), BeautifulDatetime)
+        self.assertEqual(floor(16 / Oct / 1995, 1 * hours), (16 / Oct / 1995)[:])
+        self.assertEqual(ceil((16 / Oct / 1995)[0:1], 1 * hours), (16 / Oct / 1995)[1])
+
+    def test_operators(self):
+        t = (16 / Oct / 1995)[23:14:10]
+        self.assertEqual(t // (1 * months), (1 / Oct / 1995)[:])
+        self.assertEqual(t // (15 * minutes), (16 / Oct / 1995)[23:00])
+        self.assertEqual(datetime(1995, 10, 16, 23, 14) // (1 * hours), datetime(1995, 10, 16, 23))
+        self.assertEqual(date(1995, 10, 16) // (1 * years), 1 / Jan / 1995)
+        self.assertEqual(round(t, 1 * hours), (16 / Oct / 1995)[23:00])
+        self.assertEqual(round(16 / Oct / 1995, 1 * months), 1 / Oct / 1995)
+        self.assertEqual(timedelta(hours=5) // (1 * hours), 5)
+        with self.assertRaises(TypeError):
+            _ = 5 // (1 * hours)
+
+    def test_start(self):
+        self.assertEqual(floor(16 / Oct / 1995, 1 * weeks), 16 / Oct / 1995)
+        self.assertEqual(floor(16 / Oct / 1995, 1 * weeks, start=SU), 15 / Oct / 1995)
+        self.assertEqual(ceil(17 / Oct / 1995, 1 * weeks, start=MO), 23 / Oct / 1995)
+        self.assertEqual(floor(16 / Oct / 1995, 3 * months, start=Apr), 1 / Oct / 1995)
+        self.assertEqual(floor(16 / Oct / 1995, 1 * years, start=Apr), 1 / Apr / 1995)
+        self.assertEqual(floor(16 / Jan / 1995, 1 * years, start=Apr), 1 / Apr / 1994)
+        for invalid in (1 * months + 1 * days, 0 * hours, -1 * months, relativedelta(day=1)):
+            with self.assertRaises(ValueError):
+                floor(16 / Oct / 1995, invalid)
+        with self.assertRaises(ValueError):
+            floor(16 / Oct / 1995, 1 * weeks, start=Apr)
+
+    def test_aware(self):
+        tz = timezone(timedelta(hours=5, minutes=30))
+        t = datetime(1995, 10, 16, 23, 14, tzinfo=tz)
+        self.assertEqual(floor(t, 1 * hours), datetime(1995, 10, 16, 23, tzinfo=tz))
+        self.assertEqual(floor(t, 1 * months), datetime(1995, 10, 1, tzinfo=tz))
+        self.assertEqual(ceil(t, 1 * days), datetime(1995, 10, 17, tzinfo=tz))
+
+    def test_many(self):
+        for unit in (1 * months, 2 * weeks, 3 * days, 15 * minutes):
+            for method, fn in (('floor', floor_many), ('ceil', ceil_many), ('round', round_many)):
+                single = {'floor': floor, 'ceil': ceil, 'round': round_to}[method]
+                self.assertEqual(fn(self.datetimes, unit), [single(d, unit) for d in self.datetimes])
+                self.assertEqual(fn(iter(self.dates), unit), [single(d, unit) for d in self.dates])
+                if unit == 15 * minutes:
+                    with self.assertRaises(TypeError):
+                        fn(DateArray(self.dates), unit)
+                    continue
+                self.assertEqual(list(fn(DateArray(self.dates), unit, start=SU if unit == 2 * weeks else None)),
+                                 [single(d, unit, SU if unit == 2 * weeks else None) for d in self.dates])
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_numpy(self):
+        datetimes = np.array(self.datetimes + [None], dtype='datetime64[us]')
+        dates = np.array(self.dates, dtype='datetime64[D]')
+        for unit, start in ((1 * months, None), (3 * months, Apr), (1 * weeks, SU), (1 * days, None),
+                            (15 * minutes, None), (7 * seconds, None)):
+            for method, fn in (('floor', floor_many), ('ceil', ceil_many), ('round', round_many)):
+                single = {'floor': floor, 'ceil': ceil, 'round': round_to}[method]
+                result = fn(datetimes, unit, start)
+                self.assertEqual(result[:-1].tolist(), [single(d, unit, start) for d in self.datetimes])
+                self.assertTrue(np.isnat(result[-1]))
+
+                result = fn(dates, unit, start).astype(object).tolist()
+                self.assertEqual(result, [single(d, unit, start) for d in self.dates])
+        self.assertEqual(floor_many(dates, 1 * months).dtype, np.dtype('datetime64[D]'))
+        self.assertEqual(floor_many(dates, 1 * hours).dtype, np.dtype('datetime64[us]'))
+        self.assertEqual(floor_many(datetimes.astype('datetime64[ns]'), 1 * hours).dtype, np.dtype('datetime64[ns]'))
@@ -0,0 +1,135 @@
+import asyncio
+import gc
+import unittest
+from datetime import timedelta
+
+from beautiful_date import Jan, minutes, drange, Clock, Scheduler, FrozenClock, frozen_clock
+from beautiful_date.scheduling import _schedulers
+
+
+class LoopClock(Clock):
+    """Clock that starts at the given datetime and goes with the time of the running event loop.
+
+    Timers of the scheduler go off without the real clock being involved.
+    """
+
+    __slots__ = ('start', 'loop_start')
+
+    def __init__(self, start):
+        super().__init__()
+        self.start = start
+        self.loop_start = asyncio.get_running_loop().time()
+
+    def now(self, tz=None):
+        return self.start + timedelta(seconds=asyncio.get_running_loop().time() - self.loop_start)
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def _collect(aligned, results):
+    async for t in aligned:
+        results.append(t)
+
+
+class TestAligned(unittest.TestCase):
+
+    def setUp(self):
+        self.start = (1 / Jan / 2024)[9:00]
+        self.r = drange(self.start, (1 / Jan / 2024)[10:15], 15 * minutes)
+
+    def run_stalled(self, missed):
+        """Ticks received after the clock was moved by 0, 10, 5 and 31 minutes."""
+        clock = FrozenClock(self.start)
+        scheduler = Scheduler(clock)
+        results = []
+        received = []
+
+        async def main():
+            task = asyncio.ensure_future(_collect(self.r.aligned(missed, scheduler=scheduler), results))
+            for delta in (0, 10, 5, 31):
+                clock.advance(delta * minutes)
+                scheduler.wake()
+                await _settle()
+                received.append([t.strftime('%H:%M') for t in results])
+            task.cancel()
+
+        asyncio.run(main())
+        return received
+
+    def test_fake_clock(self):
+        self.assertEqual(self.run_stalled('coalesce'),
+                         [['09:00'], ['09:00'], ['09:00', '09:15'], ['09:00', '09:15', '09:45']])
+        self.assertEqual(self.run_stalled('skip')[-1], ['09:00', '09:15'])
+        self.assertEqual(self.run_stalled('all')[-1], ['09:00', '09:15', '09:30', '09:45'])
+
+    def test_shared_scheduler(self):
+        clock = FrozenClock(self.start)
+        scheduler = Scheduler(clock)
+        results = [[] for _ in range(50)]
+
+        async def main():
+            tasks = [asyncio.ensure_future(_collect(drange(self.start + i * minutes, self.start + 1 * minutes * (i + 2),
+                                                           1 * minutes).aligned(scheduler=scheduler), results[i]))
+                     for i in range(50)]
+            await _settle()
+            self.assertEqual(scheduler.waiting, 50)
+            for _ in range(60):
+                clock.advance(1 * minutes)
+                scheduler.wake()
+                await _settle()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        self.assertEqual(results, [[self.start + i * minutes, self.start + (i + 1) * minutes] for i in range(50)])
+        self.assertEqual(scheduler.waiting, 0)
+
+    def test_context_clock(self):
+        async def main():
+            with frozen_clock(self.start + 20 * minutes):
+                aligned = self.r.aligned('skip')
+                first = asyncio.ensure_future(aligned.__anext__())
+                await _settle()
+                self.assertFalse(first.done())
+                first.cancel()
+                self.assertEqual(await self.r.aligned('coalesce').__anext__(), self.start + 15 * minutes)
+
+        asyncio.run(main())
+
+    def test_loop_timer(self):
+        results = []
+
+        async def main():
+            clock = LoopClock(self.start)
+            scheduler = Scheduler(clock)
+            step = timedelta(milliseconds=20)
+            async for t in drange(self.start + step, self.start + 5 * step, step).aligned(scheduler=scheduler):
+                results.append((t, clock.now()))
+            self.assertEqual(scheduler.waiting, 0)
+
+        asyncio.run(main())
+        self.assertEqual([t for t, _ in results], [self.start + i * timedelta(milliseconds=20) for i in range(1, 5)])
+        for t, received in results:
+            self.assertGreaterEqual(received, t)
+
+    def test_closed_loops_are_released(self):
+        async def main():
+            with frozen_clock(self.start + 20 * minutes):
+                # One range finishes, the other one is still waiting when the loop is closed
+                self.assertEqual(await self.r.aligned('coalesce').__anext__(), self.start + 15 * minutes)
+                waiting = asyncio.ensure_future(self.r.aligned('skip').__anext__())
+                await _settle()
+                self.assertFalse(waiting.done())
+
+        for _ in range(3):
+            asyncio.run(main())
+        gc.collect()
+        self.assertEqual(len(_schedulers), 0)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.r.aligned('wait')
+        with self.assertRaises(ValueError):
+            drange(self.start, self.start - 1 * minutes, -1 * minutes).aligned()
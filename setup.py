@@ -53,7 +53,7 @@ URL = 'https://github.com/kuzmoyev/beautiful-date'
 DOWNLOAD_URL = 'https://github.com/kuzmoyev/beautiful-date/archive/1.0.tar.gz'
 EMAIL = 'kuzmovych.goog@gmail.com'
 AUTHOR = 'Yevhen Kuzmovych'
-REQUIRES_PYTHON = '>=3.5.0'
+REQUIRES_PYTHON = '>=3.7.0'
 VERSION = '2.2.1'
 
 REQUIRED = [
@@ -86,6 +86,7 @@ setup(
     packages=['beautiful_date'],
     install_requires=REQUIRED,
     extras_require={
+        'numpy': ['numpy'],
         'dev': TESTS_REQUIRED,
         'tests': TESTS_REQUIRED
     },
@@ -95,8 +96,6 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',